@@ -1,5 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
+from functools import cached_property
+from typing import Optional
 
 from fastapi import HTTPException
 from starlette.requests import Request
@@ -16,6 +18,104 @@ from dispatch.organization.models import OrganizationRead
 
 log = logging.getLogger(__name__)
 
+# organization roles from least to most privileged, each role holds the permissions of the ones before it
+ORGANIZATION_ROLE_HIERARCHY = [
+    UserRoles.member,
+    UserRoles.admin,
+    UserRoles.manager,
+    UserRoles.owner,
+]
+
+
+def has_role(role: Optional[UserRoles], minimum: UserRoles) -> bool:
+    """Whether the role is at least as privileged as the minimum role."""
+    if role not in ORGANIZATION_ROLE_HIERARCHY:
+        return False
+    return ORGANIZATION_ROLE_HIERARCHY.index(role) >= ORGANIZATION_ROLE_HIERARCHY.index(minimum)
+
+
+class PermissionContext:
+    """
+    Everything permissions are evaluated against, resolved lazily and at most once per request.
+
+    Use `get_permission_context` to retrieve the context of a request.
+    """
+
+    def __init__(self, request: Request):
+        self.request = request
+        self.db_session = request.state.db
+
+    @cached_property
+    def organization(self):
+        if self.request.path_params.get("organization"):
+            return organization_service.get_by_slug_or_raise(
+                db_session=self.db_session,
+                organization_in=OrganizationRead(
+                    slug=self.request.path_params["organization"],
+                    name=self.request.path_params["organization"],
+                ),
+            )
+        elif self.request.path_params.get("organization_id"):
+            return organization_service.get(
+                db_session=self.db_session,
+                organization_id=self.request.path_params["organization_id"],
+            )
+
+    @cached_property
+    def user(self):
+        return get_current_user(request=self.request)
+
+    @cached_property
+    def role(self) -> Optional[UserRoles]:
+        principal = getattr(self.request.state, "principal", None)
+        if principal and principal.user.id == self.user.id:
+            return principal.organization_roles.get(self.organization.slug)
+        return self.user.get_organization_role(self.organization.slug)
+
+    @cached_property
+    def incident(self):
+        return incident_service.get(
+            db_session=self.db_session, incident_id=self.request.path_params["incident_id"]
+        )
+
+    @cached_property
+    def case(self) -> Optional[Case]:
+        return case_service.get(
+            db_session=self.db_session, case_id=self.request.path_params["case_id"]
+        )
+
+    def has_role(self, minimum: UserRoles) -> bool:
+        return has_role(self.role, minimum)
+
+    @cached_property
+    def is_incident_commander(self) -> bool:
+        if not self.incident or not self.incident.commander:
+            return False
+        return self.incident.commander.individual.email == self.user.email
+
+    @cached_property
+    def is_incident_reporter(self) -> bool:
+        if not self.incident or not self.incident.reporter:
+            return False
+        return self.incident.reporter.individual.email == self.user.email
+
+    @cached_property
+    def is_case_participant(self) -> bool:
+        if not self.case:
+            return False
+        return self.user.email in [
+            participant.individual.email for participant in self.case.participants
+        ]
+
+
+def get_permission_context(request: Request) -> PermissionContext:
+    """Returns the permission context of the request, creating it on first use."""
+    context = getattr(request.state, "permission_context", None)
+    if context is None:
+        context = PermissionContext(request)
+        request.state.permission_context = context
+    return context
+
 
 def any_permission(permissions: list, request: Request) -> bool:
     for p in permissions:
@@ -35,6 +135,7 @@ class BasePermission(ABC):
 
     Upon initialization, calls abstract method  `has_required_permissions`
     which will be specific to concrete implementation of Permission class.
+    The request's `PermissionContext` is available as `self.context`.
 
     You would write your permissions like this:
 
@@ -67,28 +168,15 @@ class BasePermission(ABC):
         ...
 
     def __init__(self, request: Request):
-        organization = None
-        if request.path_params.get("organization"):
-            organization = organization_service.get_by_slug_or_raise(
-                db_session=request.state.db,
-                organization_in=OrganizationRead(
-                    slug=request.path_params["organization"],
-                    name=request.path_params["organization"],
-                ),
-            )
-        elif request.path_params.get("organization_id"):
-            organization = organization_service.get(
-                db_session=request.state.db, organization_id=request.path_params["organization_id"]
-            )
+        self.context = get_permission_context(request)
 
-        if not organization:
+        if not self.context.organization:
             raise HTTPException(status_code=self.org_error_code, detail=self.org_error_msg)
 
-        user = get_current_user(request=request)
-        if not user:
+        if not self.context.user:
             raise HTTPException(status_code=self.user_error_code, detail=self.user_error_msg)
 
-        self.role = user.get_organization_role(organization.slug)
+        self.role = self.context.role
         if not self.has_required_permissions(request):
             raise HTTPException(
                 status_code=self.user_role_error_code, detail=self.user_role_error_msg
@@ -125,36 +213,17 @@ class PermissionsDependency(object):
 
 class OrganizationOwnerPermission(BasePermission):
     def has_required_permissions(self, request: Request) -> bool:
-        return self.role == UserRoles.owner
+        return self.context.has_role(UserRoles.owner)
 
 
 class OrganizationManagerPermission(BasePermission):
     def has_required_permissions(self, request: Request) -> bool:
-        permission = any_permission(
-            permissions=[
-                OrganizationOwnerPermission,
-            ],
-            request=request,
-        )
-        if not permission:
-            if self.role == UserRoles.manager:
-                return True
-        return permission
+        return self.context.has_role(UserRoles.manager)
 
 
 class OrganizationAdminPermission(BasePermission):
     def has_required_permissions(self, request: Request) -> bool:
-        permission = any_permission(
-            permissions=[
-                OrganizationOwnerPermission,
-                OrganizationManagerPermission,
-            ],
-            request=request,
-        )
-        if not permission:
-            if self.role == UserRoles.admin:
-                return True
-        return permission
+        return self.context.has_role(UserRoles.admin)
 
 
 class OrganizationMemberPermission(BasePermission):
@@ -162,18 +231,7 @@ class OrganizationMemberPermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        permission = any_permission(
-            permissions=[
-                OrganizationOwnerPermission,
-                OrganizationManagerPermission,
-                OrganizationAdminPermission,
-            ],
-            request=request,
-        )
-        if not permission:
-            if self.role == UserRoles.member:
-                return True
-        return permission
+        return self.context.has_role(UserRoles.member)
 
 
 class SensitiveProjectActionPermission(BasePermission):
@@ -181,14 +239,7 @@ class SensitiveProjectActionPermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        return any_permission(
-            permissions=[
-                OrganizationOwnerPermission,
-                OrganizationManagerPermission,
-                OrganizationAdminPermission,
-            ],
-            request=request,
-        )
+        return self.context.has_role(UserRoles.admin)
 
 
 class ProjectCreatePermission(BasePermission):
@@ -196,10 +247,7 @@ class ProjectCreatePermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        return any_permission(
-            permissions=[OrganizationOwnerPermission, OrganizationManagerPermission],
-            request=request,
-        )
+        return self.context.has_role(UserRoles.manager)
 
 
 class ProjectUpdatePermission(BasePermission):
@@ -207,14 +255,7 @@ class ProjectUpdatePermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        return any_permission(
-            permissions=[
-                OrganizationOwnerPermission,
-                OrganizationManagerPermission,
-                OrganizationAdminPermission,
-            ],
-            request=request,
-        )
+        return self.context.has_role(UserRoles.admin)
 
 
 class IncidentJoinOrSubscribePermission(BasePermission):
@@ -222,12 +263,8 @@ class IncidentJoinOrSubscribePermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        current_incident = incident_service.get(
-            db_session=request.state.db, incident_id=request.path_params["incident_id"]
-        )
-
-        if current_incident.visibility == Visibility.restricted:
-            return OrganizationAdminPermission(request=request)
+        if self.context.incident.visibility == Visibility.restricted:
+            return self.context.has_role(UserRoles.admin)
 
         return True
 
@@ -237,21 +274,14 @@ class IncidentViewPermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        current_incident = incident_service.get(
-            db_session=request.state.db, incident_id=request.path_params["incident_id"]
-        )
-
-        if not current_incident:
+        if not self.context.incident:
             return False
 
-        if current_incident.visibility == Visibility.restricted:
-            return any_permission(
-                permissions=[
-                    OrganizationAdminPermission,
-                    IncidentCommanderPermission,
-                    IncidentReporterPermission,
-                ],
-                request=request,
+        if self.context.incident.visibility == Visibility.restricted:
+            return (
+                self.context.has_role(UserRoles.admin)
+                or self.context.is_incident_commander
+                or self.context.is_incident_reporter
             )
         return True
 
@@ -261,13 +291,10 @@ class IncidentEditPermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        return any_permission(
-            permissions=[
-                OrganizationAdminPermission,
-                IncidentCommanderPermission,
-                IncidentReporterPermission,
-            ],
-            request=request,
+        return (
+            self.context.has_role(UserRoles.admin)
+            or self.context.is_incident_commander
+            or self.context.is_incident_reporter
         )
 
 
@@ -276,17 +303,7 @@ class IncidentReporterPermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        current_user = get_current_user(request=request)
-        current_incident = incident_service.get(
-            db_session=request.state.db, incident_id=request.path_params["incident_id"]
-        )
-
-        if not current_incident:
-            return False
-
-        if current_incident.reporter:
-            if current_incident.reporter.individual.email == current_user.email:
-                return True
+        return self.context.is_incident_reporter
 
 
 class IncidentCommanderPermission(BasePermission):
@@ -294,16 +311,7 @@ class IncidentCommanderPermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        current_user = get_current_user(request=request)
-        current_incident = incident_service.get(
-            db_session=request.state.db, incident_id=request.path_params["incident_id"]
-        )
-        if not current_incident:
-            return False
-
-        if current_incident.commander:
-            if current_incident.commander.individual.email == current_user.email:
-                return True
+        return self.context.is_incident_commander
 
 
 # Cases
@@ -314,21 +322,11 @@ class CaseViewPermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        current_case = case_service.get(
-            db_session=request.state.db, case_id=request.path_params["case_id"]
-        )
-
-        if not current_case:
+        if not self.context.case:
             return False
 
-        if current_case.visibility == Visibility.restricted:
-            return any_permission(
-                permissions=[
-                    OrganizationAdminPermission,
-                    CaseParticipantPermission,
-                ],
-                request=request,
-            )
+        if self.context.case.visibility == Visibility.restricted:
+            return self.context.has_role(UserRoles.admin) or self.context.is_case_participant
         return True
 
 
@@ -337,13 +335,7 @@ class CaseEditPermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        return any_permission(
-            permissions=[
-                OrganizationAdminPermission,
-                CaseParticipantPermission,
-            ],
-            request=request,
-        )
+        return self.context.has_role(UserRoles.admin) or self.context.is_case_participant
 
 
 class CaseParticipantPermission(BasePermission):
@@ -351,11 +343,4 @@ class CaseParticipantPermission(BasePermission):
         self,
         request: Request,
     ) -> bool:
-        current_user = get_current_user(request=request)
-        current_case: Case = case_service.get(
-            db_session=request.state.db, case_id=request.path_params["case_id"]
-        )
-        participant_emails: list[str] = [
-            participant.individual.email for participant in current_case.participants
-        ]
-        return current_user.email in participant_emails
+        return self.context.is_case_participant
@@ -5,17 +5,21 @@
     :license: Apache, see LICENSE for more details.
 """
 import logging
-from typing import Annotated, Optional
+import threading
+from typing import Annotated, Dict, NamedTuple, Optional
 
+from cachetools import TTLCache
 from fastapi import HTTPException, Depends
 from starlette.requests import Request
 from starlette.status import HTTP_401_UNAUTHORIZED
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 
 from dispatch.config import (
     DISPATCH_AUTHENTICATION_PROVIDER_SLUG,
     DISPATCH_AUTHENTICATION_DEFAULT_USER,
 )
+from dispatch.database.core import get_detached_copy, get_session_schema_name, merge_detached_copy
 from dispatch.enums import UserRoles
 from dispatch.organization import service as organization_service
 from dispatch.organization.models import OrganizationRead
@@ -42,6 +46,63 @@ InvalidCredentialException = HTTPException(
     status_code=HTTP_401_UNAUTHORIZED, detail=[{"msg": "Could not validate credentials"}]
 )
 
+# number of seconds a user and its roles may be served after they changed in another process
+PRINCIPAL_CACHE_TTL = 30
+PRINCIPAL_CACHE_SIZE = 4096
+
+
+class Principal(NamedTuple):
+    """A user and its roles, as resolved for authenticated requests."""
+
+    user: DispatchUser  # detached copy
+    organization_roles: Dict[str, UserRoles]  # organization slug -> role
+    project_roles: Dict[int, UserRoles]  # project id -> role
+
+
+# maps (schema, email) to the principal, project roles live in the organization's schema
+_principals = TTLCache(maxsize=PRINCIPAL_CACHE_SIZE, ttl=PRINCIPAL_CACHE_TTL)
+_principals_lock = threading.Lock()
+
+
+def invalidate_principals():
+    """Drops all cached principals, e.g. after a user or role changed."""
+    with _principals_lock:
+        _principals.clear()
+
+
+@event.listens_for(DispatchUser, "after_update")
+@event.listens_for(DispatchUser, "after_delete")
+@event.listens_for(DispatchUserOrganization, "after_insert")
+@event.listens_for(DispatchUserOrganization, "after_update")
+@event.listens_for(DispatchUserOrganization, "after_delete")
+@event.listens_for(DispatchUserProject, "after_insert")
+@event.listens_for(DispatchUserProject, "after_update")
+@event.listens_for(DispatchUserProject, "after_delete")
+def _invalidate_principals_on_change(mapper, connection, target):
+    invalidate_principals()
+
+
+def get_principal(*, db_session, email: str) -> Optional[Principal]:
+    """Returns the cached principal for the given email, loading it on a miss."""
+    key = (get_session_schema_name(db_session), email)
+    with _principals_lock:
+        principal = _principals.get(key)
+    if principal:
+        return principal
+
+    user = get_by_email(db_session=db_session, email=email)
+    if not user:
+        return None
+
+    principal = Principal(
+        user=get_detached_copy(user),
+        organization_roles={o.organization.slug: o.role for o in user.organizations},
+        project_roles={p.project_id: p.role for p in user.projects},
+    )
+    with _principals_lock:
+        _principals[key] = principal
+    return principal
+
 
 def get(*, db_session, user_id: int) -> Optional[DispatchUser]:
     """Returns a user based on the given user id."""
@@ -246,11 +307,17 @@ def update(*, db_session, user: DispatchUser, user_in: UserUpdate) -> DispatchUs
             )
 
     db_session.commit()
+    invalidate_principals()
     return user
 
 
 def get_current_user(request: Request) -> DispatchUser:
     """Attempts to get the current user depending on the configured authentication provider."""
+    # resolved at most once per request
+    current_user = getattr(request.state, "current_user", None)
+    if current_user is not None:
+        return current_user
+
     if DISPATCH_AUTHENTICATION_PROVIDER_SLUG:
         auth_plugin = plugins.get(DISPATCH_AUTHENTICATION_PROVIDER_SLUG)
         user_email = auth_plugin.get_current_user(request)
@@ -264,11 +331,19 @@ def get_current_user(request: Request) -> DispatchUser:
         )
         raise InvalidCredentialException
 
-    return get_or_create(
-        db_session=request.state.db,
-        organization=request.state.organization,
-        user_in=UserRegister(email=user_email),
-    )
+    principal = get_principal(db_session=request.state.db, email=user_email)
+    if principal:
+        current_user = merge_detached_copy(request.state.db, principal.user)
+    else:
+        current_user = get_or_create(
+            db_session=request.state.db,
+            organization=request.state.organization,
+            user_in=UserRegister(email=user_email),
+        )
+
+    request.state.principal = principal
+    request.state.current_user = current_user
+    return current_user
 
 
 CurrentUser = Annotated[DispatchUser, Depends(get_current_user)]
@@ -278,4 +353,7 @@ def get_current_role(
     request: Request, current_user: DispatchUser = Depends(get_current_user)
 ) -> UserRoles:
     """Attempts to get the current user depending on the configured authentication provider."""
+    principal = getattr(request.state, "principal", None)
+    if principal and principal.user.id == current_user.id:
+        return principal.organization_roles.get(request.state.organization)
     return current_user.get_organization_role(organization_slug=request.state.organization)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
 
 from dispatch.config import DISPATCH_AUTH_REGISTRATION_ENABLED
@@ -14,8 +14,12 @@ from dispatch.exceptions import (
     InvalidUsernameError,
 )
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
-from dispatch.enums import UserRoles
+from dispatch.database.service import (
+    CommonParameters,
+    search_filter_sort_export,
+    search_filter_sort_paginate,
+)
+from dispatch.enums import ExportFormat, UserRoles
 from dispatch.models import OrganizationSlug, PrimaryKey
 from dispatch.organization.models import OrganizationRead
 
@@ -73,6 +77,44 @@ def get_users(organization: OrganizationSlug, common: CommonParameters):
     }
 
 
+@user_router.get(
+    "/export",
+    dependencies=[
+        Depends(
+            PermissionsDependency(
+                [
+                    OrganizationMemberPermission,
+                ]
+            )
+        )
+    ],
+    summary="Streams all matching users as NDJSON or CSV.",
+)
+def export_users(
+    organization: OrganizationSlug,
+    common: CommonParameters,
+    export_format: ExportFormat = Query(ExportFormat.ndjson, alias="format"),
+):
+    """Streams all users of the organization matching the search."""
+    common["filter_spec"] = {
+        "and": [{"model": "Organization", "op": "==", "field": "slug", "value": organization}]
+    }
+
+    return search_filter_sort_export(
+        organization=organization,
+        model="DispatchUser",
+        item_model=UserRead,
+        export_format=export_format,
+        serialize=lambda u: UserRead(
+            id=u.id,
+            email=u.email,
+            projects=u.projects,
+            role=u.get_organization_role(organization),
+        ),
+        **common,
+    )
+
+
 @user_router.post(
     "",
     response_model=UserRead,
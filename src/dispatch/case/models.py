@@ -298,3 +298,4 @@ class CasePagination(DispatchBase):
     itemsPerPage: int
     page: int
     total: int
+    next: Optional[str] = None
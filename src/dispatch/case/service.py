@@ -16,6 +16,7 @@ from dispatch.participant import flows as participant_flows
 from dispatch.participant_role.models import ParticipantRoleType
 from dispatch.project import service as project_service
 from dispatch.service import flows as service_flows
+from dispatch.signal.dedup import signal_dedup_index
 from dispatch.tag import service as tag_service
 
 from .enums import CaseStatus
@@ -357,3 +358,4 @@ def delete(*, db_session, case_id: int):
     """Deletes an existing case."""
     db_session.query(Case).filter(Case.id == case_id).delete()
     db_session.commit()
+    signal_dedup_index.discard_case(db_session=db_session, case_id=case_id)
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.auth.permissions import SensitiveProjectActionPermission, PermissionsDependency
 from dispatch.models import PrimaryKey
 
@@ -23,6 +27,9 @@ def get_case_severities(common: CommonParameters):
     return search_filter_sort_paginate(model="CaseSeverity", **common)
 
 
+add_export_route(router, model="CaseSeverity", item_model=CaseSeverityRead)
+
+
 @router.post(
     "",
     response_model=CaseSeverityRead,
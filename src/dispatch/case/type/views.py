@@ -2,7 +2,11 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 from dispatch.auth.permissions import SensitiveProjectActionPermission, PermissionsDependency
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import PrimaryKey
 
 from .models import CaseTypeCreate, CaseTypePagination, CaseTypeRead, CaseTypeUpdate
@@ -18,6 +22,9 @@ def get_case_types(common: CommonParameters):
     return search_filter_sort_paginate(model="CaseType", **common)
 
 
+add_export_route(router, model="CaseType", item_model=CaseTypeRead)
+
+
 @router.post(
     "",
     response_model=CaseTypeRead,
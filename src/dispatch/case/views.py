@@ -19,7 +19,12 @@ from dispatch.auth.service import CurrentUser
 from dispatch.case.enums import CaseStatus
 from dispatch.common.utils.views import create_pydantic_include
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    Cursor,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import OrganizationSlug, PrimaryKey
 from dispatch.incident.models import IncidentCreate, IncidentRead
 from dispatch.incident import service as incident_service
@@ -35,7 +40,7 @@ from .flows import (
     case_triage_create_flow,
     case_update_flow,
 )
-from .models import Case, CaseCreate, CasePagination, CaseRead, CaseUpdate
+from .models import Case, CaseCreate, CasePagination, CaseRead, CaseReadMinimal, CaseUpdate
 from .service import create, delete, get, update
 
 
@@ -58,6 +63,9 @@ def get_current_case(db_session: DbSession, request: Request) -> Case:
 CurrentCase = Annotated[Case, Depends(get_current_case)]
 
 
+add_export_route(router, model="Case", item_model=CaseReadMinimal)
+
+
 @router.get(
     "/{case_id}",
     response_model=CaseRead,
@@ -74,9 +82,13 @@ def get_case(
 
 
 @router.get("", summary="Retrieves a list of cases.")
-def get_cases(common: CommonParameters, include: List[str] = Query([], alias="include[]")):
+def get_cases(
+    common: CommonParameters,
+    include: List[str] = Query([], alias="include[]"),
+    cursor: Cursor = None,
+):
     """Retrieves all cases."""
-    pagination = search_filter_sort_paginate(model="Case", **common)
+    pagination = search_filter_sort_paginate(model="Case", cursor=cursor, **common)
 
     if include:
         # only allow two levels for now
@@ -87,6 +99,7 @@ def get_cases(common: CommonParameters, include: List[str] = Query([], alias="in
             "itemsPerPage": ...,
             "page": ...,
             "total": ...,
+            "next": ...,
         }
         return json.loads(CasePagination(**pagination).json(include=include_fields))
     return json.loads(CasePagination(**pagination).json())
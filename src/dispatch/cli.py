@@ -767,49 +767,172 @@ def signals_group():
 
 
 @signals_group.command("process")
-def process_signals():
-    """Runs a continuous process that does additional processing on newly created signals."""
+@click.option(
+    "--workers",
+    default=1,
+    type=int,
+    help="Number of worker threads. Each worker uses up to two database connections.",
+)
+@click.option(
+    "--batch-size",
+    default=500,
+    type=int,
+    help="Maximum number of instances of a signal processed per claim.",
+)
+@click.option(
+    "--max-idle-sleep",
+    default=30,
+    type=int,
+    help="Maximum number of seconds a worker backs off for when there is nothing to process.",
+)
+@click.option(
+    "--organization-refresh-interval",
+    default=300,
+    type=int,
+    help="Number of seconds after which the list of organizations is reloaded.",
+)
+def process_signals(
+    workers: int, batch_size: int, max_idle_sleep: int, organization_refresh_interval: int
+):
+    """Runs a continuous process that does additional processing on newly created signals.
+
+    Work is partitioned by signal: a worker claims a signal with unprocessed
+    instances (skipping signals claimed by others) and processes its instances
+    in creation order, so several workers or processes can share the backlog.
+    Instances that fail are skipped by the worker until they're an hour old and
+    no longer pending, and workers only count instances processed successfully
+    as work done, so failing instances don't keep them from backing off.
+    """
+    import threading
+    import time
     from datetime import datetime, timedelta, timezone
-    from sqlalchemy import asc
-    from dispatch.database.core import sessionmaker, engine, SessionLocal
-    from dispatch.signal.models import SignalInstance
+
+    from dispatch.common.utils.cli import install_plugins
+    from dispatch.database.core import (
+        SessionLocal,
+        get_organization_engine,
+        get_organization_sessionmaker,
+    )
+    from dispatch.metrics import provider as metrics_provider
     from dispatch.organization.service import get_all as get_all_organizations
     from dispatch.signal import flows as signal_flows
-    from dispatch.common.utils.cli import install_plugins
+    from dispatch.signal.dedup import signal_dedup_index
 
     install_plugins()
 
-    organizations = get_all_organizations(db_session=SessionLocal())
-    while True:
-        for organization in organizations:
-            schema_engine = engine.execution_options(
-                schema_translate_map={
-                    None: f"dispatch_organization_{organization.slug}",
-                }
-            )
-            db_session = sessionmaker(bind=schema_engine)()
+    def get_organization_slugs():
+        db_session = SessionLocal()
+        try:
+            return [o.slug for o in get_all_organizations(db_session=db_session)]
+        finally:
+            db_session.close()
+
+    def reconcile_dedup_index(organization_slugs):
+        """Drops the cases deleted by other processes from the deduplication index."""
+        for organization_slug in organization_slugs:
+            db_session = get_organization_sessionmaker(organization_slug)()
+            try:
+                signal_dedup_index.reconcile(db_session=db_session)
+            except Exception as e:
+                log.exception(e)
+            finally:
+                db_session.close()
+
+    def process_organization(organization_slug: str, failed_instance_ids: dict) -> int:
+        """Processes each signal with pending instances at most once, returns the instances processed."""
+        schema_engine = get_organization_engine(organization_slug)
+        db_session = get_organization_sessionmaker(organization_slug)()
+        processed_signal_ids = []
+        processed = 0
+        try:
+            while True:
+                one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+                with schema_engine.connect() as connection:
+                    # the claim is held until this transaction ends
+                    with connection.begin():
+                        succeeded = signal_flows.process_signal_instances(
+                            connection=connection,
+                            db_session=db_session,
+                            since=one_hour_ago,
+                            batch_size=batch_size,
+                            exclude_signal_ids=processed_signal_ids,
+                            failed_instance_ids=failed_instance_ids,
+                        )
+                if succeeded is None:
+                    return processed
+                processed += succeeded
+        finally:
+            db_session.close()
+
+    def warm_dedup_index():
+        """Loads recently processed instances into the deduplication index before processing."""
+        for organization_slug in get_organization_slugs():
+            db_session = get_organization_sessionmaker(organization_slug)()
+            try:
+                signal_dedup_index.warm(db_session=db_session)
+            except Exception as e:
+                log.exception(e)
+            finally:
+                db_session.close()
+
+        log.info(f"Warmed signal dedup index with {signal_dedup_index.statistics()['size']} keys.")
+
+    def worker():
+        organization_slugs = []
+        organizations_refreshed_at = None
+        idle_sleep = 1
+        # ids of the instances that failed, with the time they failed at
+        failed_instance_ids = {}
+
+        while True:
+            # failed instances are no longer pending once they're an hour old
             one_hour_ago = datetime.now(timezone.utc) - timedelta(hours=1)
-            signal_instances = (
-                (
-                    db_session.query(SignalInstance)
-                    # .filter(SignalInstance.project_id == project.id) can this be a group by? does it even matter?
-                    .filter(SignalInstance.filter_action == None)  # noqa
-                    .filter(SignalInstance.case_id == None)  # noqa
-                    .filter(SignalInstance.created_at >= one_hour_ago)
-                )
-                .order_by(asc(SignalInstance.created_at))
-                .limit(500)
-            )
-            for signal_instance in signal_instances:
+            for instance_id, failed_at in list(failed_instance_ids.items()):
+                if failed_at < one_hour_ago:
+                    del failed_instance_ids[instance_id]
+
+            now = time.monotonic()
+            if (
+                organizations_refreshed_at is None
+                or now - organizations_refreshed_at >= organization_refresh_interval
+            ):
                 try:
-                    signal_flows.signal_instance_create_flow(
-                        db_session=db_session,
-                        signal_instance_id=signal_instance.id,
-                    )
+                    organization_slugs = get_organization_slugs()
+                    organizations_refreshed_at = now
                 except Exception as e:
-                    log.debug(signal_instance)
                     log.exception(e)
-            db_session.close()
+                reconcile_dedup_index(organization_slugs)
+
+            processed = 0
+            for organization_slug in organization_slugs:
+                try:
+                    processed += process_organization(organization_slug, failed_instance_ids)
+                except Exception as e:
+                    log.exception(e)
+
+            if processed:
+                statistics = signal_dedup_index.statistics()
+                metrics_provider.gauge("signal.dedup_index.size", statistics["size"])
+                metrics_provider.gauge("signal.dedup_index.hit_rate", statistics["hit_rate"])
+                idle_sleep = 1
+            else:
+                time.sleep(idle_sleep)
+                idle_sleep = min(idle_sleep * 2, max_idle_sleep)
+
+    warm_dedup_index()
+
+    if workers <= 1:
+        worker()
+        return
+
+    threads = [
+        threading.Thread(target=worker, name=f"signal-processor-{i}", daemon=True)
+        for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
 
 
 @dispatch_server.command("slack")
@@ -110,6 +110,7 @@ MJML_PATH = config(
     "MJML_PATH",
     default=f"{os.path.dirname(os.path.realpath(__file__))}/static/dispatch/node_modules/.bin",
 )
+MJML_WORKERS = config("MJML_WORKERS", cast=int, default=2)
 DISPATCH_MARKDOWN_IN_INCIDENT_DESC = config(
     "DISPATCH_MARKDOWN_IN_INCIDENT_DESC", cast=bool, default=False
 )
@@ -147,6 +148,13 @@ DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS = config(
     "DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS", default=None
 )
 
+DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS_TTL = config(
+    "DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS_TTL", cast=int, default=3600
+)  # Seconds
+DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS_REFRESH_INTERVAL = config(
+    "DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS_REFRESH_INTERVAL", cast=int, default=0
+)  # Seconds, disabled if 0
+
 DISPATCH_PKCE_DONT_VERIFY_AT_HASH = config("DISPATCH_PKCE_DONT_VERIFY_AT_HASH", default=False)
 
 if DISPATCH_AUTHENTICATION_PROVIDER_SLUG == "dispatch-auth-provider-pkce":
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, HTTPException, status
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import PrimaryKey
 
 from .models import (
@@ -21,6 +25,9 @@ def get_queries(common: CommonParameters):
     return search_filter_sort_paginate(model="Query", **common)
 
 
+add_export_route(router, model="Query", item_model=QueryRead)
+
+
 @router.get("/{query_id}", response_model=QueryRead)
 def get_query(db_session: DbSession, query_id: PrimaryKey):
     """Given its unique ID, retrieve details about a single query."""
@@ -2,7 +2,11 @@ from fastapi import APIRouter, HTTPException, status
 
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import PrimaryKey
 
 from .models import (
@@ -23,6 +27,9 @@ def get_source_data_formats(common: CommonParameters):
     return search_filter_sort_paginate(model="SourceDataFormat", **common)
 
 
+add_export_route(router, model="SourceDataFormat", item_model=SourceDataFormatRead)
+
+
 @router.get("/{source_data_format_id}", response_model=SourceDataFormatRead)
 def get_source_data_format(db_session: DbSession, source_data_format_id: PrimaryKey):
     """Given its unique id, retrieve details about a source data format."""
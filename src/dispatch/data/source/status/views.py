@@ -2,7 +2,11 @@ from fastapi import APIRouter, HTTPException
 
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import PrimaryKey
 
 from .models import (
@@ -23,6 +27,9 @@ def get_source_statuses(common: CommonParameters):
     return search_filter_sort_paginate(model="SourceStatus", **common)
 
 
+add_export_route(router, model="SourceStatus", item_model=SourceStatusRead)
+
+
 @router.get("/{source_status_id}", response_model=SourceStatusRead)
 def get_source_status(db_session: DbSession, source_status_id: PrimaryKey):
     """Given its unique id, retrieve details about a single source status."""
@@ -2,7 +2,11 @@ from fastapi import APIRouter, HTTPException, status
 
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import PrimaryKey
 
 from .models import (
@@ -23,6 +27,9 @@ def get_source_transports(common: CommonParameters):
     return search_filter_sort_paginate(model="SourceTransport", **common)
 
 
+add_export_route(router, model="SourceTransport", item_model=SourceTransportRead)
+
+
 @router.get("/{source_transport_id}", response_model=SourceTransportRead)
 def get_source_transport(db_session: DbSession, source_transport_id: PrimaryKey):
     """Given its unique id, retrieve details about a single source transport."""
@@ -2,7 +2,11 @@ from fastapi import APIRouter, HTTPException, status
 
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import PrimaryKey
 
 from .models import (
@@ -23,6 +27,9 @@ def get_source_types(common: CommonParameters):
     return search_filter_sort_paginate(model="SourceType", **common)
 
 
+add_export_route(router, model="SourceType", item_model=SourceTypeRead)
+
+
 @router.get("/{source_type_id}", response_model=SourceTypeRead)
 def get_source_type(db_session: DbSession, source_type_id: PrimaryKey):
     """Given its unique id, retrieve details about a single source type."""
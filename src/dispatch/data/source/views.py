@@ -1,7 +1,11 @@
 from fastapi import APIRouter, HTTPException, status
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import PrimaryKey
 
 from .models import (
@@ -21,6 +25,9 @@ def get_sources(common: CommonParameters):
     return search_filter_sort_paginate(model="Source", **common)
 
 
+add_export_route(router, model="Source", item_model=SourceRead)
+
+
 @router.get("/{source_id}", response_model=SourceRead)
 def get_source(db_session: DbSession, source_id: PrimaryKey):
     """Given its unique id, retrieve details about a single source."""
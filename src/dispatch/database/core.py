@@ -1,18 +1,25 @@
 import functools
 import re
-from typing import Annotated, Any
+import threading
+import time
+from collections import Counter
+from types import MappingProxyType
+from typing import Annotated, Any, Dict, FrozenSet, Mapping, NamedTuple, Optional, Set
 
 from fastapi import Depends
 from pydantic import BaseModel
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base, declared_attr
-from sqlalchemy.orm import object_session, sessionmaker, Session
+from sqlalchemy.ext.hybrid import hybrid_method, hybrid_property
+from sqlalchemy.orm import make_transient_to_detached, object_session, sessionmaker, Session
 from sqlalchemy.sql.expression import true
 from sqlalchemy_utils import get_mapper
 from starlette.requests import Request
 
 from dispatch import config
+from dispatch.database.enums import DISPATCH_ORGANIZATION_SCHEMA_PREFIX
 from dispatch.exceptions import NotFoundError
 from dispatch.search.fulltext import make_searchable
 
@@ -45,6 +52,184 @@ engine = create_engine(
 SessionLocal = sessionmaker(bind=engine)
 
 
+# minimum number of seconds between catalog refreshes triggered by unknown schema names
+SCHEMA_NAMES_REFRESH_INTERVAL = 5
+
+_schema_names: Set[str] = set()
+_schema_names_refreshed_at: Optional[float] = None
+_schema_names_lock = threading.Lock()
+
+
+def get_organization_schema_name(organization_slug: str) -> str:
+    """Returns the name of the database schema used by an organization."""
+    return f"{DISPATCH_ORGANIZATION_SCHEMA_PREFIX}_{organization_slug}"
+
+
+def refresh_schema_names() -> Set[str]:
+    """Reloads the known schema names from the database catalog."""
+    global _schema_names, _schema_names_refreshed_at
+
+    with _schema_names_lock:
+        _schema_names = set(inspect(engine).get_schema_names())
+        _schema_names_refreshed_at = time.monotonic()
+        return _schema_names
+
+
+def register_schema_name(schema_name: str) -> None:
+    """Adds a newly created schema to the in-process schema registry."""
+    with _schema_names_lock:
+        _schema_names.add(schema_name)
+
+
+def invalidate_schema_names() -> None:
+    """Forces the schema registry to be reloaded on its next lookup."""
+    global _schema_names_refreshed_at
+
+    with _schema_names_lock:
+        _schema_names.clear()
+        _schema_names_refreshed_at = None
+
+
+def schema_exists(schema_name: str) -> bool:
+    """Checks whether a schema exists without querying the catalog on every call.
+
+    Unknown names trigger a (rate limited) refresh so that schemas created
+    by other processes are eventually picked up.
+    """
+    if schema_name in _schema_names:
+        return True
+
+    if (
+        _schema_names_refreshed_at is not None
+        and time.monotonic() - _schema_names_refreshed_at < SCHEMA_NAMES_REFRESH_INTERVAL
+    ):
+        return False
+
+    return schema_name in refresh_schema_names()
+
+
+_organization_engines: Dict[str, Engine] = {}
+_organization_sessionmakers: Dict[str, sessionmaker] = {}
+_organization_engines_lock = threading.Lock()
+
+# per organization counters of connections taken from the shared pool
+_organization_pool_checkouts: Counter = Counter()
+_organization_pool_checked_out: Counter = Counter()
+_organization_pool_stats_lock = threading.Lock()
+
+ORGANIZATION_CONNECTION_INFO_KEY = "dispatch_organization_slug"
+
+
+def _track_organization_checkout(organization_slug: str):
+    def engine_connect(connection, branch):
+        if branch:
+            return
+        connection.info[ORGANIZATION_CONNECTION_INFO_KEY] = organization_slug
+        with _organization_pool_stats_lock:
+            _organization_pool_checkouts[organization_slug] += 1
+            _organization_pool_checked_out[organization_slug] += 1
+
+    return engine_connect
+
+
+@event.listens_for(engine, "checkin")
+def _track_organization_checkin(dbapi_connection, connection_record):
+    organization_slug = connection_record.info.pop(ORGANIZATION_CONNECTION_INFO_KEY, None)
+    if organization_slug:
+        with _organization_pool_stats_lock:
+            _organization_pool_checked_out[organization_slug] -= 1
+
+
+def get_organization_engine(organization_slug: str) -> Engine:
+    """Returns the (cached) schema translated engine for an organization."""
+    schema_engine = _organization_engines.get(organization_slug)
+    if schema_engine:
+        return schema_engine
+
+    with _organization_engines_lock:
+        schema_engine = _organization_engines.get(organization_slug)
+        if not schema_engine:
+            schema_engine = engine.execution_options(
+                schema_translate_map={
+                    None: get_organization_schema_name(organization_slug),
+                }
+            )
+            event.listen(
+                schema_engine, "engine_connect", _track_organization_checkout(organization_slug)
+            )
+            _organization_engines[organization_slug] = schema_engine
+    return schema_engine
+
+
+def get_organization_sessionmaker(organization_slug: str) -> sessionmaker:
+    """Returns the (cached) session factory bound to an organization's schema."""
+    session_factory = _organization_sessionmakers.get(organization_slug)
+    if session_factory:
+        return session_factory
+
+    schema_engine = get_organization_engine(organization_slug)
+    with _organization_engines_lock:
+        session_factory = _organization_sessionmakers.get(organization_slug)
+        if not session_factory:
+            session_factory = sessionmaker(bind=schema_engine)
+            _organization_sessionmakers[organization_slug] = session_factory
+    return session_factory
+
+
+def get_session_schema_name(db_session: Session) -> Optional[str]:
+    """Returns the organization schema a session is bound to, if any."""
+    bind = db_session.get_bind()
+    schema_translate_map = bind.get_execution_options().get("schema_translate_map") or {}
+    return schema_translate_map.get(None)
+
+
+def get_detached_copy(obj: Any) -> Any:
+    """Returns a clean, detached copy of a persistent object's column attributes.
+
+    Copies can be shared between threads and added to any session without
+    emitting SQL via `session.merge(copy, load=False)`. Relationships are
+    left unloaded.
+    """
+    mapper = inspect(obj).mapper
+    copy = mapper.class_()
+    for column_attr in mapper.column_attrs:
+        setattr(copy, column_attr.key, getattr(obj, column_attr.key))
+    make_transient_to_detached(copy)
+    return copy
+
+
+def merge_detached_copy(db_session: Session, copy: Any) -> Any:
+    """Returns the session's instance of a detached copy, merging it without SQL if needed."""
+    identity_key = db_session.identity_key(instance=copy)
+    instance = db_session.identity_map.get(identity_key)
+    if instance is not None:
+        return instance
+    return db_session.merge(copy, load=False)
+
+
+def get_organization_pool_statistics() -> Dict[str, Any]:
+    """Returns the shared pool status along with per organization connection usage."""
+    with _organization_pool_stats_lock:
+        organizations = {
+            slug: {
+                "checkouts": _organization_pool_checkouts[slug],
+                "checked_out": _organization_pool_checked_out[slug],
+            }
+            for slug in _organization_pool_checkouts
+        }
+
+    pool = engine.pool
+    return {
+        "pool": {
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        },
+        "organizations": organizations,
+    }
+
+
 def resolve_table_name(name):
     """Resolves table names to their mapped names."""
     names = re.split("(?=[A-Z])", name)  # noqa
@@ -134,21 +319,86 @@ def get_model_name_by_tablename(table_fullname: str) -> str:
     return get_class_by_tablename(table_fullname=table_fullname).__name__
 
 
+class ModelIndex(NamedTuple):
+    """Immutable lookup tables over all mapped model classes."""
+
+    registry_size: int
+    by_table_name: Mapping[str, Any]
+    by_class_name: Mapping[str, Any]
+    fields: Mapping[Any, FrozenSet[str]]
+    relationships: Mapping[Any, Mapping[str, Any]]
+
+
+_model_index: Optional[ModelIndex] = None
+_model_index_lock = threading.Lock()
+
+
+def _build_model_index() -> ModelIndex:
+    """Builds the model index from the declarative class registry."""
+    by_table_name = {}
+    by_class_name = {}
+    fields = {}
+    relationships = {}
+
+    for c in list(Base._decl_class_registry.values()):
+        if not isinstance(c, type) or not hasattr(c, "__table__"):
+            continue
+
+        by_table_name[c.__table__.fullname.lower()] = c
+        by_class_name[c.__name__] = c
+
+        mapper = inspect(c)
+        hybrid_names = [
+            key
+            for key, item in mapper.all_orm_descriptors.items()
+            if isinstance(item, (hybrid_property, hybrid_method))
+        ]
+        fields[c] = frozenset(mapper.columns.keys()) | frozenset(hybrid_names)
+        relationships[c] = MappingProxyType({r.key: r.mapper.class_ for r in mapper.relationships})
+
+    return ModelIndex(
+        registry_size=len(Base._decl_class_registry),
+        by_table_name=MappingProxyType(by_table_name),
+        by_class_name=MappingProxyType(by_class_name),
+        fields=MappingProxyType(fields),
+        relationships=MappingProxyType(relationships),
+    )
+
+
+def get_model_index() -> ModelIndex:
+    """Returns the model index, (re)building it if new models have been mapped."""
+    global _model_index
+
+    model_index = _model_index
+    if model_index and model_index.registry_size == len(Base._decl_class_registry):
+        return model_index
+
+    with _model_index_lock:
+        if not _model_index or _model_index.registry_size != len(Base._decl_class_registry):
+            _model_index = _build_model_index()
+        return _model_index
+
+
+def get_class_by_name(name: str) -> Any:
+    """Return class reference by its class name, or None if there is none."""
+    return get_model_index().by_class_name.get(name)
+
+
+def get_model_field_names(model: Any) -> FrozenSet[str]:
+    """Returns the names of the columns and hybrid attributes that can be filtered or sorted on."""
+    return get_model_index().fields.get(model, frozenset())
+
+
 def get_class_by_tablename(table_fullname: str) -> Any:
     """Return class reference mapped to table."""
+    by_table_name = get_model_index().by_table_name
 
-    def _find_class(name):
-        for c in Base._decl_class_registry.values():
-            if hasattr(c, "__table__"):
-                if c.__table__.fullname.lower() == name.lower():
-                    return c
-
-    mapped_name = resolve_table_name(table_fullname)
-    mapped_class = _find_class(mapped_name)
+    mapped_name = resolve_table_name(table_fullname).lower()
+    mapped_class = by_table_name.get(mapped_name)
 
     # try looking in the 'dispatch_core' schema
     if not mapped_class:
-        mapped_class = _find_class(f"dispatch_core.{mapped_name}")
+        mapped_class = by_table_name.get(f"dispatch_core.{mapped_name}")
 
     if not mapped_class:
         raise ValidationError(
@@ -192,10 +442,4 @@ def ensure_unique_default_per_project(target, value, oldvalue, initiator):
 
 
 def refetch_db_session(organization_slug: str) -> Session:
-    schema_engine = engine.execution_options(
-        schema_translate_map={
-            None: f"dispatch_organization_{organization_slug}",
-        }
-    )
-    db_session = sessionmaker(bind=schema_engine)()
-    return db_session
+    return get_organization_sessionmaker(organization_slug)()
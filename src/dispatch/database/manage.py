@@ -17,7 +17,7 @@ from dispatch.search.fulltext import (
     sync_trigger,
 )
 
-from .core import Base, sessionmaker
+from .core import Base, register_schema_name, sessionmaker
 from .enums import DISPATCH_ORGANIZATION_SCHEMA_PREFIX
 
 
@@ -141,6 +141,8 @@ def init_schema(*, engine, organization: Organization):
         with engine.connect() as connection:
             connection.execute(CreateSchema(schema_name))
 
+    register_schema_name(schema_name)
+
     # set the schema for table creation
     tables = get_tenant_tables()
 
@@ -0,0 +1,46 @@
+"""Adds the EntitySighting rollup of entities seen in cases
+
+Revision ID: 5f6c2a3e8d41
+Revises: 9ad021045e45
+Create Date: 2023-05-24 10:12:41.208315
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "5f6c2a3e8d41"
+down_revision = "9ad021045e45"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "entity_sighting",
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("case_id", sa.Integer(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["case_id"], ["case.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["entity_id"], ["entity.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("entity_id", "day", "case_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO entity_sighting (entity_id, day, case_id, count)
+        SELECT assoc_signal_instance_entities.entity_id,
+               CAST(signal_instance.created_at AS DATE),
+               signal_instance.case_id,
+               COUNT(*)
+        FROM assoc_signal_instance_entities
+        JOIN signal_instance
+          ON signal_instance.id = assoc_signal_instance_entities.signal_instance_id
+        WHERE signal_instance.case_id IS NOT NULL
+        GROUP BY 1, 2, 3
+        """
+    )
+
+
+def downgrade():
+    op.drop_table("entity_sighting")
@@ -0,0 +1,31 @@
+"""Adds the DocumentExtraction state of document term extraction
+
+Revision ID: 3b8e61f0c7d2
+Revises: 5f6c2a3e8d41
+Create Date: 2023-05-31 09:41:27.530614
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "3b8e61f0c7d2"
+down_revision = "5f6c2a3e8d41"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "document_extraction",
+        sa.Column("document_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("modified_time", sa.String(), nullable=False),
+        sa.Column("matcher_key", sa.String(), nullable=False),
+        sa.ForeignKeyConstraint(["document_id"], ["document.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("document_id", "name"),
+    )
+
+
+def downgrade():
+    op.drop_table("document_extraction")
@@ -1,32 +1,44 @@
+import base64
+import binascii
+import csv
+import hashlib
+import io
 import json
 import logging
+import re
+import threading
+import types
 from collections import namedtuple
 from collections.abc import Iterable
+from datetime import date, datetime
+from enum import Enum
 from inspect import signature
 from itertools import chain
-from typing import Annotated, List
+from typing import Annotated, Any, Callable, FrozenSet, Iterator, List, Optional, Tuple, Type
 
-from fastapi import Depends, Query
+from cachetools import LRUCache
+from fastapi import APIRouter, Depends, Query, Request
 from pydantic import BaseModel
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
 from pydantic.types import Json, constr
 from six import string_types
 from sortedcontainers import SortedSet
-from sqlalchemy import and_, desc, func, not_, or_, orm
-from sqlalchemy.exc import InvalidRequestError, ProgrammingError
+from sqlalchemy import and_, asc, desc, false, func, not_, or_, orm, text
+from sqlalchemy.exc import DataError, InvalidRequestError, ProgrammingError
 from sqlalchemy.orm.mapper import Mapper
 from sqlalchemy_filters import apply_pagination, apply_sort
 from sqlalchemy_filters.exceptions import BadFilterFormat, FieldNotFound
-from sqlalchemy_filters.models import Field, get_model_from_spec
+from sqlalchemy_filters.models import get_model_from_spec
+from starlette.responses import StreamingResponse
 
 from dispatch.auth.models import DispatchUser
 from dispatch.auth.service import CurrentUser, get_current_role
 from dispatch.case.models import Case
-from dispatch.database.core import DbSession
+from dispatch.database.core import DbSession, get_organization_sessionmaker
 from dispatch.data.query.models import Query as QueryModel
 from dispatch.data.source.models import Source
-from dispatch.enums import UserRoles, Visibility
-from dispatch.exceptions import FieldNotFoundError, InvalidFilterError
+from dispatch.enums import ExportFormat, UserRoles, Visibility
+from dispatch.exceptions import FieldNotFoundError, InvalidCursorError, InvalidFilterError
 from dispatch.feedback.models import Feedback
 from dispatch.incident.models import Incident
 from dispatch.incident.type.models import IncidentType
@@ -37,7 +49,13 @@ from dispatch.search.fulltext.composite_search import CompositeSearch
 from dispatch.signal.models import Signal, SignalInstance
 from dispatch.task.models import Task
 
-from .core import Base, get_class_by_tablename, get_model_name_by_tablename
+from .core import (
+    Base,
+    get_class_by_name,
+    get_class_by_tablename,
+    get_model_field_names,
+    get_model_name_by_tablename,
+)
 
 log = logging.getLogger(__file__)
 
@@ -52,6 +70,76 @@ BOOLEAN_FUNCTIONS = [
 ]
 
 
+class FilterNotEvaluableError(Exception):
+    """Raised when a filter spec can only be evaluated by the database."""
+
+
+# in-memory counterparts of the boolean functions, following SQL's three-valued
+# logic where `None` stands for an unknown (NULL) result
+def _python_or(*results):
+    if any(result is True for result in results):
+        return True
+    if any(result is None for result in results):
+        return None
+    return False
+
+
+def _python_and(*results):
+    if any(result is False for result in results):
+        return False
+    if any(result is None for result in results):
+        return None
+    return True
+
+
+def _python_not(result):
+    return None if result is None else not result
+
+
+PYTHON_BOOLEAN_FUNCTIONS = {
+    or_: _python_or,
+    and_: _python_and,
+    not_: _python_not,
+}
+
+
+def _like_to_regex(pattern: str, flags: int = 0):
+    """Translates a SQL LIKE pattern into a compiled regular expression."""
+    regex = "".join(
+        ".*" if char == "%" else "." if char == "_" else re.escape(char) for char in pattern
+    )
+    return re.compile(regex, flags | re.DOTALL)
+
+
+def _python_like(value, pattern, flags=0):
+    return _like_to_regex(pattern, flags).fullmatch(str(value)) is not None
+
+
+def _coerce_value(value, reference):
+    """Coerces a filter value to the type of the attribute it is compared against.
+
+    The database casts string literals on comparison, we mimic it for the common cases.
+    """
+    if isinstance(value, (list, tuple, set)):
+        return [_coerce_value(v, reference) for v in value]
+
+    if not isinstance(value, str) or isinstance(reference, str) or reference is None:
+        return value
+
+    try:
+        if isinstance(reference, bool):
+            return value.lower() in ("true", "t", "1")
+        if isinstance(reference, (int, float)):
+            return type(reference)(value)
+        if isinstance(reference, datetime):
+            return datetime.fromisoformat(value)
+        if isinstance(reference, date):
+            return date.fromisoformat(value)
+    except ValueError:
+        pass
+    return value
+
+
 class Operator(object):
     OPERATORS = {
         "is_null": lambda f: f.is_(None),
@@ -77,6 +165,33 @@ class Operator(object):
         "not_any": lambda f, a: func.not_(f.any(a)),
     }
 
+    ARITIES = {
+        operator: len(signature(function).parameters) for operator, function in OPERATORS.items()
+    }
+
+    # `any` and `not_any` operate on relationships and are left to the database
+    PYTHON_OPERATORS = {
+        "is_null": lambda v: v is None,
+        "is_not_null": lambda v: v is not None,
+        "==": lambda v, a: v == a,
+        "eq": lambda v, a: v == a,
+        "!=": lambda v, a: v != a,
+        "ne": lambda v, a: v != a,
+        ">": lambda v, a: v > a,
+        "gt": lambda v, a: v > a,
+        "<": lambda v, a: v < a,
+        "lt": lambda v, a: v < a,
+        ">=": lambda v, a: v >= a,
+        "ge": lambda v, a: v >= a,
+        "<=": lambda v, a: v <= a,
+        "le": lambda v, a: v <= a,
+        "like": lambda v, a: _python_like(v, a),
+        "ilike": lambda v, a: _python_like(v, a, re.IGNORECASE),
+        "not_ilike": lambda v, a: not _python_like(v, a, re.IGNORECASE),
+        "in": lambda v, a: v in a,
+        "not_in": lambda v, a: v not in a,
+    }
+
     def __init__(self, operator=None):
         if not operator:
             operator = "=="
@@ -86,7 +201,7 @@ class Operator(object):
 
         self.operator = operator
         self.function = self.OPERATORS[operator]
-        self.arity = len(signature(self.function).parameters)
+        self.arity = self.ARITIES[operator]
 
 
 class Filter(object):
@@ -124,8 +239,7 @@ class Filter(object):
         arity = operator.arity
 
         field_name = self.filter_spec["field"]
-        field = Field(model, field_name)
-        sqlalchemy_field = field.get_sqlalchemy_field()
+        sqlalchemy_field = get_sqlalchemy_field(model, field_name)
 
         if arity == 1:
             return function(sqlalchemy_field)
@@ -133,6 +247,49 @@ class Filter(object):
         if arity == 2:
             return function(sqlalchemy_field, value)
 
+    def format_for_python(self, default_model_name=None, row_models=frozenset()):
+        """Returns a predicate evaluating the filter against a row of objects keyed by model name."""
+        model_name = self.filter_spec.get("model", default_model_name)
+        model = get_class_by_name(model_name) if model_name else None
+        if not model:
+            raise BadFilterFormat("Model `{}` not found.".format(model_name))
+
+        if model_name not in row_models:
+            raise FilterNotEvaluableError(f"Model `{model_name}` is not part of the row.")
+
+        field_name = self.filter_spec["field"]
+        if isinstance(get_sqlalchemy_field(model, field_name), types.MethodType):
+            raise FilterNotEvaluableError(f"Hybrid method `{field_name}` can not be evaluated.")
+
+        operator = self.operator.operator
+        function = Operator.PYTHON_OPERATORS.get(operator)
+        if not function:
+            raise FilterNotEvaluableError(f"Operator `{operator}` can not be evaluated.")
+
+        arity = self.operator.arity
+        value = self.value
+
+        def predicate(row):
+            instance = row.get(model_name)
+            field_value = getattr(instance, field_name, None) if instance is not None else None
+
+            if arity == 1:
+                return function(field_value)
+
+            # sqlalchemy renders comparisons against None as IS (NOT) NULL
+            if value is None and operator in ("==", "eq", "!=", "ne"):
+                return (field_value is None) == (operator in ("==", "eq"))
+
+            if field_value is None or value is None:
+                return None
+
+            try:
+                return function(field_value, _coerce_value(value, field_value))
+            except TypeError:
+                return None
+
+        return predicate
+
 
 class BooleanFilter(object):
     def __init__(self, function, *filters):
@@ -152,6 +309,34 @@ class BooleanFilter(object):
             *[filter.format_for_sqlalchemy(query, default_model) for filter in self.filters]
         )
 
+    def format_for_python(self, default_model_name=None, row_models=frozenset()):
+        function = PYTHON_BOOLEAN_FUNCTIONS[self.function]
+        predicates = [
+            filter.format_for_python(default_model_name, row_models) for filter in self.filters
+        ]
+
+        def predicate(row):
+            return function(*[p(row) for p in predicates])
+
+        return predicate
+
+
+def get_sqlalchemy_field(model, field_name):
+    """Returns the model attribute for `field_name`, validated against the model index."""
+    if field_name not in get_model_field_names(model):
+        raise FieldNotFound(
+            "Model {} has no column `{}`.".format(model, field_name),
+        )
+
+    sqlalchemy_field = getattr(model, field_name)
+
+    # if it's a hybrid method, we call it so that we can work with
+    # the result of the execution and not with the method object itself
+    if isinstance(sqlalchemy_field, types.MethodType):
+        sqlalchemy_field = sqlalchemy_field()
+
+    return sqlalchemy_field
+
 
 def _is_iterable_filter(filter_spec):
     """`filter_spec` may be a list of nested filter specs, or a dict."""
@@ -216,6 +401,9 @@ def get_query_models(query):
 
 def get_model_class_by_name(registry, name):
     """Return the model class matching `name` in the given `registry`."""
+    if registry is Base._decl_class_registry:
+        return get_class_by_name(name)
+
     for cls in registry.values():
         if getattr(cls, "__name__", None) == name:
             return cls
@@ -240,16 +428,118 @@ def get_default_model(query):
     return default_model
 
 
+FilterPlan = namedtuple("FilterPlan", ("filters", "filter_models", "joins"))
+
+FILTER_PLAN_CACHE_SIZE = 512
+
+_filter_plan_cache = LRUCache(maxsize=FILTER_PLAN_CACHE_SIZE)
+_filter_plan_cache_lock = threading.Lock()
+
+
+def normalize_filter_spec(filter_spec) -> str:
+    """Serializes a filter spec to JSON, independent of key ordering."""
+    return json.dumps(filter_spec, sort_keys=True, default=str)
+
+
+def get_filter_spec_hash(filter_spec, normalized_filter_spec: str = None) -> str:
+    """Returns a stable hash of a filter spec, independent of key ordering."""
+    normalized_filter_spec = normalized_filter_spec or normalize_filter_spec(filter_spec)
+    return hashlib.sha256(normalized_filter_spec.encode("utf-8")).hexdigest()
+
+
+def compile_filter_spec(model, filter_spec) -> FilterPlan:
+    """Compiles a filter spec for a given model into a reusable plan.
+
+    The plan holds the parsed filter tree, the models referenced by the
+    filters and any model specific joins. Plans are cached by model and
+    normalized filter spec, as the same saved filters are sent over and over.
+    The plan is built from a copy of the filter spec, so callers may change
+    theirs afterwards.
+    """
+    normalized_filter_spec = normalize_filter_spec(filter_spec)
+    key = (model, get_filter_spec_hash(filter_spec, normalized_filter_spec))
+
+    with _filter_plan_cache_lock:
+        plan = _filter_plan_cache.get(key)
+    if plan:
+        return plan
+
+    filters = build_filters(json.loads(normalized_filter_spec))
+    named_models = get_named_models(filters)
+    filter_models = tuple(named_models[0]) if named_models else ()
+
+    joins = []
+    for filter_model in filter_models:
+        if FILTER_SPECIFIC_JOINS.get((model, filter_model)):
+            joins.append(FILTER_SPECIFIC_JOINS[(model, filter_model)])
+
+    plan = FilterPlan(filters=tuple(filters), filter_models=filter_models, joins=tuple(joins))
+
+    with _filter_plan_cache_lock:
+        _filter_plan_cache[key] = plan
+    return plan
+
+
+def get_filter_spec_models(filter_spec, default_model_name: str = None) -> set:
+    """Returns the names of all models referenced by a filter spec."""
+
+    def get_models(filter):
+        if isinstance(filter, BooleanFilter):
+            return set().union(*[get_models(f) for f in filter.filters])
+        return {filter.filter_spec.get("model", default_model_name)}
+
+    return set().union(*[get_models(f) for f in build_filters(filter_spec)])
+
+
+_filter_predicate_cache = LRUCache(maxsize=FILTER_PLAN_CACHE_SIZE)
+
+
+def compile_filter_predicate(
+    filter_spec, default_model_name: str = None, row_models: FrozenSet[str] = frozenset()
+):
+    """Compiles a filter spec into an in-memory predicate.
+
+    The predicate is called with a row, a dictionary of objects keyed by model name
+    (e.g. `{"SignalInstance": ..., "Entity": ..., "EntityType": ...}`), and returns
+    True if the row satisfies the filter spec. Returns None if the filter spec can
+    only be evaluated by the database (e.g. relationship operators, or models that
+    aren't in `row_models` and would have to be joined).
+    """
+    normalized_filter_spec = normalize_filter_spec(filter_spec)
+    key = (
+        default_model_name,
+        row_models,
+        get_filter_spec_hash(filter_spec, normalized_filter_spec),
+    )
+
+    with _filter_plan_cache_lock:
+        if key in _filter_predicate_cache:
+            return _filter_predicate_cache[key]
+
+    try:
+        predicates = [
+            filter.format_for_python(default_model_name, row_models)
+            for filter in build_filters(json.loads(normalized_filter_spec))
+        ]
+
+        def predicate(row) -> bool:
+            return _python_and(*[p(row) for p in predicates]) is True
+
+    except FilterNotEvaluableError as e:
+        log.debug(f"Filter spec will be evaluated by the database. Reason: {e}")
+        predicate = None
+
+    with _filter_plan_cache_lock:
+        _filter_predicate_cache[key] = predicate
+    return predicate
+
+
 def auto_join(query, model_names):
     """Automatically join models to `query` if they're not already present
     and the join can be done implicitly.
     """
-    # every model has access to the registry, so we can use any from the query
-    query_models = get_query_models(query).values()
-    model_registry = list(query_models)[-1]._decl_class_registry
-
     for name in model_names:
-        model = get_model_class_by_name(model_registry, name)
+        model = get_class_by_name(name)
         if model not in get_query_models(query).values():
             try:
                 query = query.join(model)
@@ -258,16 +548,21 @@ def auto_join(query, model_names):
     return query
 
 
-def apply_model_specific_filters(
-    model: Base, query: orm.Query, current_user: DispatchUser, role: UserRoles
-):
-    """Applies any model specific filter as it pertains to the given user."""
+def get_model_specific_filters(model: Base) -> list:
+    """Returns the filters restricting which rows of the model a user may see."""
     model_map = {
         Incident: [restricted_incident_filter],
         # IncidentType: [restricted_incident_type_filter],
     }
 
-    filters = model_map.get(model, [])
+    return model_map.get(model, [])
+
+
+def apply_model_specific_filters(
+    model: Base, query: orm.Query, current_user: DispatchUser, role: UserRoles
+):
+    """Applies any model specific filter as it pertains to the given user."""
+    filters = get_model_specific_filters(model)
 
     for f in filters:
         query = f(query, current_user, role)
@@ -310,16 +605,17 @@ def apply_filters(query, filter_spec, model_cls=None, do_auto_join=True):
                     The :class:`sqlalchemy.orm.Query` instance after all the filters
                     have been applied.
     """
-    filters = build_filters(filter_spec)
     default_model = get_default_model(query)
     if not default_model:
         default_model = model_cls
-    filter_models = get_named_models(filters)[0]
+    plan = compile_filter_spec(model_cls, filter_spec)
 
     if do_auto_join:
-        query = auto_join(query, filter_models)
+        query = auto_join(query, plan.filter_models)
 
-    sqlalchemy_filters = [filter.format_for_sqlalchemy(query, default_model) for filter in filters]
+    sqlalchemy_filters = [
+        filter.format_for_sqlalchemy(query, default_model) for filter in plan.filters
+    ]
 
     if sqlalchemy_filters:
         query = query.filter(*sqlalchemy_filters)
@@ -327,42 +623,41 @@ def apply_filters(query, filter_spec, model_cls=None, do_auto_join=True):
     return query
 
 
+# this is required because by default sqlalchemy-filter's auto-join
+# knows nothing about how to join many-many relationships.
+FILTER_SPECIFIC_JOINS = {
+    (Feedback, "Project"): (Incident, False),
+    (Feedback, "Incident"): (Incident, False),
+    (Task, "Project"): (Incident, False),
+    (Task, "Incident"): (Incident, False),
+    (Task, "IncidentPriority"): (Incident, False),
+    (Task, "IncidentType"): (Incident, False),
+    (PluginInstance, "Plugin"): (Plugin, False),
+    (Source, "Tag"): (Source.tags, True),
+    (Source, "TagType"): (Source.tags, True),
+    (QueryModel, "Tag"): (QueryModel.tags, True),
+    (QueryModel, "TagType"): (QueryModel.tags, True),
+    (DispatchUser, "Organization"): (DispatchUser.organizations, True),
+    (Case, "Tag"): (Case.tags, True),
+    (Case, "TagType"): (Case.tags, True),
+    (Incident, "Tag"): (Incident.tags, True),
+    (Incident, "TagType"): (Incident.tags, True),
+    (Incident, "Term"): (Incident.terms, True),
+    (Signal, "Tag"): (Signal.tags, True),
+    (Signal, "TagType"): (Signal.tags, True),
+    (SignalInstance, "Entity"): (SignalInstance.entities, True),
+    (SignalInstance, "EntityType"): (SignalInstance.entities, True),
+}
+
+
 def apply_filter_specific_joins(model: Base, filter_spec: dict, query: orm.query):
     """Applies any model specific implicity joins."""
-    # this is required because by default sqlalchemy-filter's auto-join
-    # knows nothing about how to join many-many relationships.
-    model_map = {
-        (Feedback, "Project"): (Incident, False),
-        (Feedback, "Incident"): (Incident, False),
-        (Task, "Project"): (Incident, False),
-        (Task, "Incident"): (Incident, False),
-        (Task, "IncidentPriority"): (Incident, False),
-        (Task, "IncidentType"): (Incident, False),
-        (PluginInstance, "Plugin"): (Plugin, False),
-        (Source, "Tag"): (Source.tags, True),
-        (Source, "TagType"): (Source.tags, True),
-        (QueryModel, "Tag"): (QueryModel.tags, True),
-        (QueryModel, "TagType"): (QueryModel.tags, True),
-        (DispatchUser, "Organization"): (DispatchUser.organizations, True),
-        (Case, "Tag"): (Case.tags, True),
-        (Case, "TagType"): (Case.tags, True),
-        (Incident, "Tag"): (Incident.tags, True),
-        (Incident, "TagType"): (Incident.tags, True),
-        (Incident, "Term"): (Incident.terms, True),
-        (Signal, "Tag"): (Signal.tags, True),
-        (Signal, "TagType"): {Signal.tags, True},
-        (SignalInstance, "Entity"): (SignalInstance.entities, True),
-        (SignalInstance, "EntityType"): (SignalInstance.entities, True),
-    }
-    filters = build_filters(filter_spec)
-    filter_models = get_named_models(filters)[0]
-    for filter_model in filter_models:
-        if model_map.get((model, filter_model)):
-            joined_model, is_outer = model_map[(model, filter_model)]
-            try:
-                query = query.join(joined_model, isouter=is_outer)
-            except Exception as e:
-                log.debug(str(e))
+    plan = compile_filter_spec(model, filter_spec)
+    for joined_model, is_outer in plan.joins:
+        try:
+            query = query.join(joined_model, isouter=is_outer)
+        except Exception as e:
+            log.debug(str(e))
 
     return query
 
@@ -427,6 +722,139 @@ def create_sort_spec(model, sort_by, descending):
     return sort_spec
 
 
+def encode_cursor(values: list, page: int = 1) -> str:
+    """Encodes the sort values of a row and the number of the next page into an opaque cursor."""
+
+    def _serialize(value):
+        if isinstance(value, Enum):
+            return value.value
+        if isinstance(value, (datetime, date)):
+            return value.isoformat()
+        if isinstance(value, (str, int, float, bool)) or value is None:
+            return value
+        return str(value)
+
+    payload = json.dumps(
+        {"page": page, "values": [_serialize(v) for v in values]}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[int, list]:
+    """Decodes an opaque cursor into a page number and the sort values of a row."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError):
+        payload = None
+
+    if (
+        not isinstance(payload, dict)
+        or not isinstance(payload.get("page"), int)
+        or payload["page"] < 1
+        or not isinstance(payload.get("values"), list)
+    ):
+        raise ValidationError(
+            [ErrorWrapper(InvalidCursorError(msg="Cursor is not valid."), loc="cursor")],
+            model=BaseModel,
+        )
+    return payload["page"], payload["values"]
+
+
+def create_keyset_spec(model_cls, sort_by: List[str], descending: List[bool]):
+    """Creates the ordered (field, column, descending) triples used for keyset pagination.
+
+    The primary key is always appended as the final tie breaker, so every
+    row has a unique position.
+    """
+    keyset_spec = []
+    for field, direction in zip(sort_by or [], descending or []):
+        if "." in field:
+            raise ValidationError(
+                [
+                    ErrorWrapper(
+                        InvalidCursorError(
+                            msg="Cursor pagination only supports sorting on the model's own fields."
+                        ),
+                        loc="sortBy",
+                    )
+                ],
+                model=BaseModel,
+            )
+        try:
+            column = get_sqlalchemy_field(model_cls, field)
+        except FieldNotFound as e:
+            raise ValidationError(
+                [ErrorWrapper(FieldNotFoundError(msg=str(e)), loc="sortBy")],
+                model=BaseModel,
+            ) from None
+        keyset_spec.append((field, column, direction))
+
+    if not any(field == "id" for field, _, _ in keyset_spec):
+        keyset_spec.append(("id", model_cls.id, keyset_spec[-1][2] if keyset_spec else False))
+    return keyset_spec
+
+
+def _keyset_after(column, is_descending: bool, value):
+    """Returns a clause matching rows that sort strictly after `value` (nulls sort last asc)."""
+    if is_descending:
+        return column.isnot(None) if value is None else column < value
+    return false() if value is None else or_(column > value, column.is_(None))
+
+
+def _keyset_equal(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def apply_keyset_pagination(query, keyset_spec, cursor: str, page_size: int):
+    """Orders and limits the query so it returns the page following `cursor`."""
+    if cursor:
+        _, values = decode_cursor(cursor)
+        if len(values) != len(keyset_spec):
+            raise ValidationError(
+                [
+                    ErrorWrapper(
+                        InvalidCursorError(msg="Cursor does not match the requested sort."),
+                        loc="cursor",
+                    )
+                ],
+                model=BaseModel,
+            )
+
+        clauses = []
+        for i, ((_, column, is_descending), value) in enumerate(zip(keyset_spec, values)):
+            equal = [_keyset_equal(c, v) for (_, c, _), v in zip(keyset_spec[:i], values[:i])]
+            clauses.append(and_(*equal, _keyset_after(column, is_descending, value)))
+        query = query.filter(or_(*clauses))
+
+    order_by = [desc(c).nullsfirst() if d else asc(c).nullslast() for _, c, d in keyset_spec]
+
+    # we fetch one extra row to find out if there is a next page
+    return query.order_by(*order_by).limit(page_size + 1)
+
+
+def get_estimated_count(*, db_session, model_cls) -> int:
+    """Returns the planner's estimate of the number of rows in the model's table."""
+    table = model_cls.__table__
+    schema = table.schema
+    if not schema:
+        schema_translate_map = (
+            db_session.get_bind(mapper=model_cls)
+            .get_execution_options()
+            .get("schema_translate_map", {})
+        )
+        schema = schema_translate_map.get(None, "public")
+
+    estimate = db_session.execute(
+        text(
+            "SELECT c.reltuples::bigint FROM pg_class c "
+            "JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = :schema AND c.relname = :table"
+        ),
+        {"schema": schema, "table": table.name},
+    ).scalar()
+    return max(estimate or 0, 0)
+
+
 def get_all(*, db_session, model):
     """Fetches a query object based on the model class name."""
     return db_session.query(get_class_by_tablename(model))
@@ -461,26 +889,33 @@ CommonParameters = Annotated[
     Depends(common_parameters),
 ]
 
+# opts list endpoints whose pagination model has a `next` field into keyset pagination
+Cursor = Annotated[Optional[str], Query()]
 
-def search_filter_sort_paginate(
+
+def search_filter_sort_query(
+    *,
     db_session,
-    model,
+    model: str,
     query_str: str = None,
     filter_spec: List[dict] = None,
-    page: int = 1,
-    items_per_page: int = 5,
     sort_by: List[str] = None,
     descending: List[bool] = None,
     current_user: DispatchUser = None,
     role: UserRoles = UserRoles.member,
-):
-    """Common functionality for searching, filtering, sorting, and pagination."""
+    keyset: bool = False,
+) -> orm.Query:
+    """Builds the searched, filtered and sorted query used for pagination and exports.
+
+    If `keyset` is set, ordering is left to keyset pagination.
+    """
     model_cls = get_class_by_tablename(model)
     try:
         query = db_session.query(model_cls)
 
         if query_str:
-            sort = False if sort_by else True
+            # keyset pagination can't continue from a search rank
+            sort = False if sort_by or keyset else True
             query = search(query_str=query_str, query=query, model=model, sort=sort)
 
         query = apply_model_specific_filters(model_cls, query, current_user, role)
@@ -489,7 +924,7 @@ def search_filter_sort_paginate(
             query = apply_filter_specific_joins(model_cls, filter_spec, query)
             query = apply_filters(query, filter_spec, model_cls)
 
-        if sort_by:
+        if sort_by and not keyset:
             sort_spec = create_sort_spec(model, sort_by, descending)
             query = apply_sort(query, sort_spec)
 
@@ -507,6 +942,57 @@ def search_filter_sort_paginate(
     except Exception as e:
         log.exception(e)
 
+    return query
+
+
+def search_filter_sort_paginate(
+    db_session,
+    model,
+    query_str: str = None,
+    filter_spec: List[dict] = None,
+    page: int = 1,
+    items_per_page: int = 5,
+    sort_by: List[str] = None,
+    descending: List[bool] = None,
+    cursor: str = None,
+    current_user: DispatchUser = None,
+    role: UserRoles = UserRoles.member,
+):
+    """Common functionality for searching, filtering, sorting, and pagination.
+
+    If a `cursor` is passed (an empty one starts from the first page), keyset
+    pagination is used instead of offset pagination. The response then
+    contains a `next` cursor and `total` is the estimated number of rows in
+    the table when no search, filter or model specific (permission) filter
+    is applied, or -1 otherwise. Only
+    endpoints whose pagination model has a `next` field accept a cursor, see
+    `Cursor`.
+    """
+    model_cls = get_class_by_tablename(model)
+    query = search_filter_sort_query(
+        db_session=db_session,
+        model=model,
+        query_str=query_str,
+        filter_spec=filter_spec,
+        sort_by=sort_by,
+        descending=descending,
+        current_user=current_user,
+        role=role,
+        keyset=cursor is not None,
+    )
+
+    if cursor is not None:
+        return keyset_paginate(
+            db_session=db_session,
+            model_cls=model_cls,
+            query=query,
+            sort_by=sort_by,
+            descending=descending,
+            cursor=cursor,
+            items_per_page=items_per_page,
+            estimate_total=not (query_str or filter_spec or get_model_specific_filters(model_cls)),
+        )
+
     if items_per_page == -1:
         items_per_page = None
 
@@ -533,6 +1019,203 @@ def search_filter_sort_paginate(
     }
 
 
+def keyset_paginate(
+    *,
+    db_session,
+    model_cls,
+    query,
+    sort_by: List[str],
+    descending: List[bool],
+    cursor: str,
+    items_per_page: int,
+    estimate_total: bool,
+):
+    """Returns the page of items following `cursor` along with the cursor of the next page."""
+    if items_per_page < 1:
+        raise ValidationError(
+            [
+                ErrorWrapper(
+                    InvalidCursorError(msg="Cursor pagination requires a positive page size."),
+                    loc="itemsPerPage",
+                )
+            ],
+            model=BaseModel,
+        )
+
+    keyset_spec = create_keyset_spec(model_cls, sort_by, descending)
+    page = decode_cursor(cursor)[0] if cursor else 1
+
+    try:
+        items = apply_keyset_pagination(query, keyset_spec, cursor, items_per_page).all()
+    except (DataError, ProgrammingError) as e:
+        log.debug(e)
+        # the failed statement aborts the transaction, nothing else can be queried on it
+        db_session.rollback()
+        if isinstance(e, DataError):
+            # the cursor's values don't fit the sorted columns
+            raise ValidationError(
+                [ErrorWrapper(InvalidCursorError(msg="Cursor is not valid."), loc="cursor")],
+                model=BaseModel,
+            ) from None
+        return {
+            "items": [],
+            "itemsPerPage": items_per_page,
+            "page": page,
+            "total": 0,
+            "next": None,
+        }
+
+    next_cursor = None
+    if len(items) > items_per_page:
+        items = items[:items_per_page]
+        next_cursor = encode_cursor(
+            [getattr(items[-1], field) for field, _, _ in keyset_spec], page=page + 1
+        )
+
+    total = -1
+    if estimate_total:
+        total = get_estimated_count(db_session=db_session, model_cls=model_cls)
+
+    return {
+        "items": items,
+        "itemsPerPage": items_per_page,
+        "page": page,
+        "total": total,
+        "next": next_cursor,
+    }
+
+
+EXPORT_BATCH_SIZE = 500
+
+
+def _export_rows(rows: List[BaseModel], export_format: ExportFormat, header: bool) -> str:
+    """Serializes a batch of rows into NDJSON lines or CSV records."""
+    if export_format == ExportFormat.ndjson:
+        return "".join(f"{row.json()}\n" for row in rows)
+
+    output = io.StringIO()
+    writer = None
+    for row in rows:
+        data = json.loads(row.json())
+        if not writer:
+            writer = csv.DictWriter(output, fieldnames=list(data.keys()))
+            if header:
+                writer.writeheader()
+        writer.writerow(
+            {k: json.dumps(v) if isinstance(v, (dict, list)) else v for k, v in data.items()}
+        )
+    return output.getvalue()
+
+
+def search_filter_sort_export(
+    db_session,
+    organization: str,
+    model: str,
+    item_model: Type[BaseModel],
+    export_format: ExportFormat = ExportFormat.ndjson,
+    query_str: str = None,
+    filter_spec: List[dict] = None,
+    page: int = None,
+    items_per_page: int = None,
+    sort_by: List[str] = None,
+    descending: List[bool] = None,
+    cursor: str = None,
+    current_user: DispatchUser = None,
+    role: UserRoles = UserRoles.member,
+    serialize: Callable[[Any], BaseModel] = None,
+) -> StreamingResponse:
+    """Streams all rows matching the search and filters, serialized with `item_model`.
+
+    Rows are fetched in keyset ordered batches and serialized incrementally,
+    so memory use does not depend on the size of the result. The rows are
+    read with a session of their own, opened and closed by the response body.
+    Pagination parameters are ignored. `serialize` replaces `item_model.from_orm`
+    for read models that aren't built from the row alone.
+    """
+    serialize = serialize or item_model.from_orm
+    model_cls = get_class_by_tablename(model)
+    query = search_filter_sort_query(
+        db_session=db_session,
+        model=model,
+        query_str=query_str,
+        filter_spec=filter_spec,
+        sort_by=sort_by,
+        descending=descending,
+        current_user=current_user,
+        role=role,
+        keyset=True,
+    )
+    keyset_spec = create_keyset_spec(model_cls, sort_by, descending)
+
+    def _stream() -> Iterator[str]:
+        export_session = get_organization_sessionmaker(organization)()
+        export_query = query.with_session(export_session)
+        batch_cursor = ""
+        header = True
+        try:
+            while batch_cursor is not None:
+                rows = apply_keyset_pagination(
+                    export_query, keyset_spec, batch_cursor, EXPORT_BATCH_SIZE
+                ).all()
+
+                batch_cursor = None
+                if len(rows) > EXPORT_BATCH_SIZE:
+                    rows = rows[:EXPORT_BATCH_SIZE]
+                    batch_cursor = encode_cursor(
+                        [getattr(rows[-1], field) for field, _, _ in keyset_spec]
+                    )
+
+                if rows:
+                    yield _export_rows([serialize(row) for row in rows], export_format, header)
+                    header = False
+
+                # we don't want the session's identity map to grow with the export
+                export_session.expunge_all()
+        finally:
+            export_session.close()
+
+    media_type = "text/csv" if export_format == ExportFormat.csv else "application/x-ndjson"
+    return StreamingResponse(
+        _stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename={model}.{export_format}"},
+    )
+
+
+def add_export_route(
+    router: APIRouter,
+    *,
+    model: str,
+    item_model: Type[BaseModel],
+    path: str = "/export",
+    **kwargs,
+):
+    """Adds a route streaming every `model` row matching the list endpoint's search and filters.
+
+    Must be called before any route whose path parameter would match `path`.
+    Extra keyword arguments (e.g. `dependencies`) are passed to the route.
+    """
+    name = re.sub(r"(?<!^)(?=[A-Z])", "_", model).lower()
+
+    def export(
+        request: Request,
+        common: CommonParameters,
+        export_format: ExportFormat = Query(ExportFormat.ndjson, alias="format"),
+    ):
+        return search_filter_sort_export(
+            organization=request.state.organization,
+            model=model,
+            item_model=item_model,
+            export_format=export_format,
+            **common,
+        )
+
+    export.__name__ = f"export_{name}"
+    export.__doc__ = f"Streams all {name} rows matching the search and filters."
+    kwargs.setdefault("summary", f"Streams all matching {name} rows as NDJSON or CSV.")
+    router.add_api_route(path, export, methods=["GET"], **kwargs)
+
+
 def restricted_incident_filter(query: orm.Query, current_user: DispatchUser, role: UserRoles):
     """Adds additional incident filters to query (usually for permissions)."""
     if role == UserRoles.member:
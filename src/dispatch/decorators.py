@@ -9,7 +9,7 @@ from dispatch.metrics import provider as metrics_provider
 from dispatch.organization import service as organization_service
 from dispatch.project import service as project_service
 
-from .database.core import SessionLocal, engine, sessionmaker
+from .database.core import SessionLocal, get_organization_sessionmaker
 
 
 log = logging.getLogger(__name__)
@@ -32,10 +32,7 @@ def _execute_task_in_project_context(
     try:
         # iterate for all schema
         for organization in organization_service.get_all(db_session=db_session):
-            schema_engine = engine.execution_options(
-                schema_translate_map={None: f"dispatch_organization_{organization.slug}"}
-            )
-            schema_session = sessionmaker(bind=schema_engine)()
+            schema_session = get_organization_sessionmaker(organization.slug)()
             kwargs["db_session"] = schema_session
             for project in project_service.get_all(db_session=schema_session):
                 kwargs["project"] = project
@@ -89,12 +86,7 @@ def background_task(func):
             if not kwargs.get("organization_slug"):
                 raise Exception("If not db_session is supplied organization slug must be provided.")
 
-            schema_engine = engine.execution_options(
-                schema_translate_map={
-                    None: f"dispatch_organization_{kwargs['organization_slug']}",
-                }
-            )
-            db_session = sessionmaker(bind=schema_engine)
+            db_session = get_organization_sessionmaker(kwargs["organization_slug"])
 
             background = True
             kwargs["db_session"] = db_session()
@@ -2,7 +2,11 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.exceptions import ExistsError
 from dispatch.models import PrimaryKey
 
@@ -23,6 +27,9 @@ def get_definitions(common: CommonParameters):
     return search_filter_sort_paginate(model="Definition", **common)
 
 
+add_export_route(router, model="Definition", item_model=DefinitionRead)
+
+
 @router.get("/{definition_id}", response_model=DefinitionRead)
 def get_definition(db_session: DbSession, definition_id: PrimaryKey):
     """Update a definition."""
@@ -0,0 +1,127 @@
+"""
+.. module: dispatch.document.extraction
+    :platform: Unix
+    :copyright: (c) 2022 by Netflix Inc., see AUTHORS for more
+    :license: Apache, see LICENSE for more details.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from dispatch.nlp import extract_terms_from_texts, get_phrase_matcher
+from dispatch.plugin.models import PluginInstance
+
+from .models import Document, DocumentExtraction
+
+log = logging.getLogger(__name__)
+
+# maximum number of documents fetched from the storage plugin at the same time
+MAX_DOWNLOAD_WORKERS = 8
+
+# number of documents downloaded and tokenized together
+EXTRACTION_BATCH_SIZE = 32
+
+
+def get_mime_type(document: Document) -> str:
+    """Returns the mime type a document's text is exported as."""
+    if document.resource_type and "sheet" in document.resource_type:
+        return "text/csv"
+    return "text/plain"
+
+
+def _get_modified_times(plugin, resource_ids: List[str]) -> Dict[str, str]:
+    try:
+        return plugin.get_modified_times(resource_ids)
+    except NotImplementedError:
+        return {}
+    except Exception as e:
+        log.warning(f"Unable to fetch modification time of documents. Reason: {e}")
+        return {}
+
+
+def _get_text(plugin, resource_id: str, mime_type: str) -> Optional[str]:
+    try:
+        return plugin.get(resource_id, mime_type)
+    except Exception as e:
+        log.warning(e)
+        return None
+
+
+def extract_terms_from_documents(
+    *,
+    db_session: Session,
+    plugin: PluginInstance,
+    documents: List[Document],
+    name: str,
+    terms: List[str],
+) -> Iterator[Tuple[Document, List[str]]]:
+    """Yields the distinct terms found in each document modified since its last extraction.
+
+    Documents are fetched through the storage plugin with a bounded thread pool
+    and tokenized in batches. The modification time of all documents is fetched
+    with a single plugin call. A document's extraction is recorded once the
+    caller resumes the iteration, and it's extracted again when it's modified
+    or the terms change. Documents are always extracted if the plugin can't
+    tell when they were last modified.
+    """
+    matcher_key, matcher = get_phrase_matcher(name, terms)
+    storage = plugin.instance
+
+    # worker threads only see plain values, never the session's objects
+    resources = [
+        (document, document.id, document.resource_id, get_mime_type(document))
+        for document in documents
+        if document.resource_id
+    ]
+    if not resources:
+        return
+
+    modified_times = _get_modified_times(storage, [r[2] for r in resources])
+    extractions = {
+        e.document_id: e
+        for e in db_session.query(DocumentExtraction).filter(
+            DocumentExtraction.name == name,
+            DocumentExtraction.document_id.in_([r[1] for r in resources]),
+        )
+    }
+
+    pending = []
+    for resource in resources:
+        modified_time = modified_times.get(resource[2])
+        extraction = extractions.get(resource[1])
+        if (
+            modified_time is not None
+            and extraction is not None
+            and (extraction.modified_time, extraction.matcher_key) == (modified_time, matcher_key)
+        ):
+            continue
+        pending.append((resource, modified_time))
+
+    log.debug(f"Extracting {name} terms from {len(pending)} of {len(resources)} documents.")
+
+    with ThreadPoolExecutor(max_workers=MAX_DOWNLOAD_WORKERS) as executor:
+        for start in range(0, len(pending), EXTRACTION_BATCH_SIZE):
+            batch = pending[start : start + EXTRACTION_BATCH_SIZE]  # noqa
+            texts = executor.map(lambda p: _get_text(storage, p[0][2], p[0][3]), batch)
+            downloaded = [(p, text) for p, text in zip(batch, texts) if text is not None]
+
+            extracted = extract_terms_from_texts(
+                [text for _, text in downloaded], matcher, batch_size=EXTRACTION_BATCH_SIZE
+            )
+            for ((resource, modified_time), _), document_terms in zip(downloaded, extracted):
+                yield resource[0], list(set(document_terms))
+
+                if modified_time is None:
+                    continue
+
+                extraction = extractions.get(resource[1])
+                if extraction is None:
+                    extraction = DocumentExtraction(document_id=resource[1], name=name)
+                    extractions[resource[1]] = extraction
+                    db_session.add(extraction)
+                extraction.modified_time = modified_time
+                extraction.matcher_key = matcher_key
+
+            db_session.commit()
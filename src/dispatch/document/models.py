@@ -43,6 +43,18 @@ class Document(ProjectMixin, ResourceMixin, EvergreenMixin, Base):
     search_vector = Column(TSVectorType("name", regconfig="pg_catalog.simple"))
 
 
+class DocumentExtraction(Base):
+    """The last extraction of terms from a document, one per extraction name.
+
+    A document is only extracted again when it's modified or the terms change.
+    """
+
+    document_id = Column(Integer, ForeignKey("document.id", ondelete="CASCADE"), primary_key=True)
+    name = Column(String, primary_key=True)
+    modified_time = Column(String, nullable=False)
+    matcher_key = Column(String, nullable=False)
+
+
 # Pydantic models...
 class DocumentBase(ResourceBase, EvergreenBase):
     description: Optional[str] = Field(None, nullable=True)
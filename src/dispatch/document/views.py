@@ -1,7 +1,11 @@
 from fastapi import APIRouter, HTTPException, status
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import PrimaryKey
 
 from .models import DocumentCreate, DocumentPagination, DocumentRead, DocumentUpdate
@@ -16,6 +20,9 @@ def get_documents(common: CommonParameters):
     return search_filter_sort_paginate(model="Document", **common)
 
 
+add_export_route(router, model="Document", item_model=DocumentRead)
+
+
 @router.get("/{document_id}", response_model=DocumentRead)
 def get_document(db_session: DbSession, document_id: PrimaryKey):
     """Update a document."""
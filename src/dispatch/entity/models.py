@@ -1,7 +1,7 @@
 from typing import Optional, List
 from pydantic import Field
 
-from sqlalchemy import Column, Integer, String, ForeignKey
+from sqlalchemy import Column, Date, Integer, String, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql.schema import UniqueConstraint
 from sqlalchemy_utils import TSVectorType
@@ -42,6 +42,19 @@ class Entity(Base, TimeStampMixin, ProjectMixin):
     )
 
 
+class EntitySighting(Base):
+    """Number of signal instances per day an entity was seen with in a case.
+
+    Maintained as instances are associated with cases, so correlations don't
+    have to join cases, signal instances and entities.
+    """
+
+    entity_id = Column(Integer, ForeignKey("entity.id", ondelete="CASCADE"), primary_key=True)
+    day = Column(Date, primary_key=True)
+    case_id = Column(Integer, ForeignKey("case.id", ondelete="CASCADE"), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+
 # Pydantic models
 class EntityBase(DispatchBase):
     name: Optional[str] = Field(None, nullable=True)
@@ -1,18 +1,20 @@
 from datetime import datetime, timedelta
-from typing import Generator, Optional, Sequence, Union, NewType, NamedTuple
+from functools import lru_cache
+from typing import Generator, Optional, Sequence, Union
 import re
 
 import jsonpath_ng
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from sqlalchemy import desc
+from sqlalchemy import and_, desc, distinct, exists, func, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import array, insert
 from sqlalchemy.orm import Session, joinedload
 
 from dispatch.exceptions import NotFoundError
 from dispatch.project import service as project_service
 from dispatch.case.models import Case
-from dispatch.entity.models import Entity, EntityCreate, EntityUpdate, EntityRead
+from dispatch.entity.models import Entity, EntityCreate, EntitySighting, EntityUpdate, EntityRead
 from dispatch.entity_type import service as entity_type_service
-from dispatch.entity_type.models import EntityType
+from dispatch.entity_type.models import EntityType, EntityTypeCreate
 from dispatch.signal.models import Signal, SignalInstance
 
 
@@ -129,6 +131,71 @@ def get_by_value_or_create(*, db_session: Session, entity_in: EntityCreate) -> E
     return create(db_session=db_session, entity_in=entity_in)
 
 
+# advisory lock namespace used to serialize bulk entity upserts per project
+ENTITY_UPSERT_LOCK_KEY = 7311
+
+
+def get_by_values_or_create(
+    *, db_session: Session, project_id: int, values: Sequence[tuple[str, int]]
+) -> list[Entity]:
+    """Gets or creates the entities for many (value, entity type id) pairs at once.
+
+    Missing entities are created with a single INSERT ... SELECT ... ON CONFLICT DO NOTHING,
+    all entities are then fetched with a single SELECT and the session is committed once.
+    """
+    pairs = list(dict.fromkeys(values))
+    if not pairs:
+        return []
+
+    # there is no unique constraint on (value, entity_type_id), so we make
+    # concurrent upserts for the same project wait for each other
+    db_session.execute(select([func.pg_advisory_xact_lock(ENTITY_UPSERT_LOCK_KEY, project_id)]))
+
+    entity_table = Entity.__table__
+    candidates = select(
+        [
+            func.unnest(array([value for value, _ in pairs])).label("value"),
+            func.unnest(array([entity_type_id for _, entity_type_id in pairs])).label(
+                "entity_type_id"
+            ),
+        ]
+    ).alias("candidates")
+
+    now = datetime.utcnow()
+    missing = select(
+        [
+            candidates.c.value,
+            candidates.c.entity_type_id,
+            literal(project_id),
+            literal(now),
+            literal(now),
+        ]
+    ).where(
+        ~exists().where(
+            and_(
+                entity_table.c.value == candidates.c.value,
+                entity_table.c.entity_type_id == candidates.c.entity_type_id,
+            )
+        )
+    )
+    db_session.execute(
+        insert(entity_table)
+        .from_select(["value", "entity_type_id", "project_id", "created_at", "updated_at"], missing)
+        .on_conflict_do_nothing()
+    )
+
+    entities = {}
+    for entity in (
+        db_session.query(Entity)
+        .filter(tuple_(Entity.value, Entity.entity_type_id).in_(pairs))
+        .order_by(Entity.id)
+    ):
+        entities.setdefault((entity.value, entity.entity_type_id), entity)
+
+    db_session.commit()
+    return [entities[pair] for pair in pairs if pair in entities]
+
+
 def update(*, db_session: Session, entity: Entity, entity_in: EntityUpdate) -> Entity:
     """Updates an existing entity."""
     entity_data = entity.dict()
@@ -157,34 +224,63 @@ def delete(*, db_session: Session, entity_id: int):
     db_session.commit()
 
 
+def record_sightings(*, db_session: Session, signal_instance: SignalInstance) -> None:
+    """Counts the entities of a signal instance as seen in its case on the day it was created."""
+    if not signal_instance.case_id or not signal_instance.entities:
+        return
+
+    table = EntitySighting.__table__
+    day = (signal_instance.created_at or datetime.utcnow()).date()
+    stmt = insert(table).values(
+        [
+            {"entity_id": entity_id, "day": day, "case_id": signal_instance.case_id, "count": 1}
+            for entity_id in sorted({entity.id for entity in signal_instance.entities})
+        ]
+    )
+    db_session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[table.c.entity_id, table.c.day, table.c.case_id],
+            set_={"count": table.c.count + stmt.excluded.count},
+        )
+    )
+    db_session.commit()
+
+
 def get_cases_with_entity(db_session: Session, entity_id: int, days_back: int) -> list[Case]:
-    """Searches for cases with the same entity within a given timeframe."""
-    # Calculate the datetime for the start of the search window
-    start_date = datetime.utcnow() - timedelta(days=days_back)
+    """Searches for cases with the same entity within a given number of days."""
+    start_day = (datetime.utcnow() - timedelta(days=days_back)).date()
 
-    cases = (
-        db_session.query(Case)
-        .join(Case.signal_instances)
-        .join(SignalInstance.entities)
-        .filter(Entity.id == entity_id, SignalInstance.created_at >= start_date)
-        .all()
+    case_ids = (
+        db_session.query(EntitySighting.case_id)
+        .filter(EntitySighting.entity_id == entity_id, EntitySighting.day >= start_day)
+        .distinct()
+    )
+    return db_session.query(Case).filter(Case.id.in_(case_ids.subquery())).all()
+
+
+def get_case_counts_with_entities(
+    db_session: Session, entity_ids: Sequence[int], days_back: int
+) -> dict[int, int]:
+    """Counts the cases each entity was seen in within a given number of days, in one query."""
+    counts = {entity_id: 0 for entity_id in entity_ids}
+    if not counts:
+        return counts
+
+    start_day = (datetime.utcnow() - timedelta(days=days_back)).date()
+    rows = (
+        db_session.query(EntitySighting.entity_id, func.count(distinct(EntitySighting.case_id)))
+        .filter(EntitySighting.entity_id.in_(list(counts)), EntitySighting.day >= start_day)
+        .group_by(EntitySighting.entity_id)
     )
-    return cases
+    counts.update(rows)
+    return counts
 
 
 def get_case_count_with_entity(db_session: Session, entity_id: int, days_back: int) -> int:
     """Calculate the count of cases with a given Entity by it's ID."""
-    # Calculate the datetime for the start of the search window
-    start_date = datetime.utcnow() - timedelta(days=days_back)
-
-    count = (
-        db_session.query(Case)
-        .join(Case.signal_instances)
-        .join(SignalInstance.entities)
-        .filter(Entity.id == entity_id, SignalInstance.created_at >= start_date)
-        .count()
-    )
-    return count
+    return get_case_counts_with_entities(
+        db_session=db_session, entity_ids=[entity_id], days_back=days_back
+    )[entity_id]
 
 
 def get_signal_instances_with_entity(
@@ -227,17 +323,90 @@ def get_signal_instances_with_entities(
     return signal_instances
 
 
-EntityTypePair = NewType(
-    "EntityTypePair",
-    NamedTuple(
-        "EntityTypePairTuple",
-        [
-            ("entity_type", EntityType),
-            ("regex", Union[re.Pattern[str], None]),
-            ("json_path", Union[jsonpath_ng.JSONPath, None]),
-        ],
-    ),
-)
+# matches numbered and named backreferences, which can't be combined into one pattern
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+@lru_cache(maxsize=256)
+def get_regex_scanner(patterns: tuple[str, ...]) -> Optional[re.Pattern[str]]:
+    """Combines regular expressions into a single pattern matching any of them.
+
+    The scanner is used to skip strings that can't match any of the
+    patterns in a single pass. Returns None if the patterns can't be combined.
+    """
+    if not patterns:
+        return None
+    try:
+        return re.compile("|".join(f"(?:{pattern})" for pattern in patterns))
+    except re.error:
+        return None
+
+
+def _flatten_strings(val: Union[dict, str, list]) -> Generator[str, None, None]:
+    """Yields all string values nested in dictionaries and lists."""
+    if isinstance(val, dict):
+        for subval in val.values():
+            yield from _flatten_strings(subval)
+    elif isinstance(val, list):
+        for item in val:
+            yield from _flatten_strings(item)
+    elif isinstance(val, str):
+        yield val
+
+
+def extract_entities(raw: dict, entity_types: Sequence[EntityType]) -> list[tuple[str, EntityType]]:
+    """
+    Extracts (value, entity type) pairs from a raw signal payload.
+
+    Entity types with a JSONPath field are matched against the values the path
+    selects, optionally narrowed by their regular expression. Entity types with
+    only a regular expression are matched against every string in the payload,
+    which is flattened once and pre-screened with a combined scanner.
+    """
+    entity_type_pairs = []
+    for entity_type in entity_types:
+        regex, json_path = entity_type_service.get_expressions(entity_type)
+        if regex or json_path:
+            entity_type_pairs.append((entity_type, regex, json_path))
+
+    # we preserve the order in which entities are found while removing duplicates
+    found = {}
+
+    regex_only_pairs = [pair for pair in entity_type_pairs if not pair[2]]
+    if regex_only_pairs:
+        scannable_pairs = [
+            pair for pair in regex_only_pairs if not _BACKREFERENCE.search(pair[1].pattern)
+        ]
+        unscannable_pairs = [pair for pair in regex_only_pairs if pair not in scannable_pairs]
+        scanner = get_regex_scanner(tuple(pair[1].pattern for pair in scannable_pairs))
+
+        for val in _flatten_strings(raw):
+            candidate_pairs = unscannable_pairs
+            if scanner is None or scanner.search(val):
+                candidate_pairs = scannable_pairs + unscannable_pairs
+
+            for entity_type, entity_regex, _ in candidate_pairs:
+                if match := entity_regex.search(val):
+                    found.setdefault((match.group(0), id(entity_type)), entity_type)
+
+    for entity_type, entity_regex, json_path in entity_type_pairs:
+        if not json_path:
+            continue
+        try:
+            matches = json_path.find(raw)
+        except jsonpath_ng.PathNotFound:
+            # field not found in the raw payload
+            continue
+
+        for match in matches:
+            if not isinstance(match.value, str):
+                continue
+            if entity_regex is None:
+                found.setdefault((match.value, id(entity_type)), entity_type)
+            elif regex_match := entity_regex.search(match.value):
+                found.setdefault((regex_match.group(0), id(entity_type)), entity_type)
+
+    return [(value, entity_type) for (value, _), entity_type in found.items()]
 
 
 def find_entities(
@@ -254,150 +423,22 @@ def find_entities(
     Returns:
         list[Entity]: A list of entities found in the SignalInstance.
     """
-
-    def _find_entites_by_regex(
-        val: Union[dict, str, list],
-        signal_instance: SignalInstance,
-        entity_type_pairs: list[EntityTypePair],
-    ) -> Generator[EntityCreate, None, None]:
-        """
-        Find entities in a value using regular expressions.
-
-        Args:
-            val: The value to search for entities in.
-            signal_instance (SignalInstance): The SignalInstance being processed.
-            entity_type_pairs (list): A list of (entity_type, entity_regex, field) tuples to search for.
-
-        Yields:
-            EntityCreate: An entity found in the value.
-
-        Examples:
-            >>> entity_type_pairs = [
-            ...     (
-            ...         EntityType("PERSON", r"([A-Z][a-z]+)+"),
-            ...         re.compile(r"([A-Z][a-z]+)+"),
-            ...         None
-            ...     ),
-            ...     (
-            ...         EntityType("DATE", r"(\d{4}(-\d{2}){2}|\d{4}\/\d{2}\/\d{2})"), # noqa
-            ...         re.compile(r"(\d{4}(-\d{2}){2}|\\d{4}\/\d{2}\/\d{2})"), # noqa
-            ...         None
-            ...     )
-            ... ]
-
-            >>> signal_instance = SignalInstance(raw={"text": "John Doe was born on 1987-05-12."})
-
-            >>> entities = list(_find_entites_by_regex(signal_instance.raw, signal_instance, entity_type_pairs))
-
-            >>> entities[0].value
-            'John Doe'
-            >>> entities[0].entity_type.name
-            'PERSON'
-            >>> entities[1].value
-            '1987-05-12'
-            >>> entities[1].entity_type.name
-            'DATE'
-        """
-        # If the value is a dictionary, search its key-value pairs recursively
-        if isinstance(val, dict):
-            for _, subval in val.items():
-                yield from _find_entites_by_regex(
-                    subval,
-                    signal_instance,
-                    entity_type_pairs,
-                )
-
-        # If the value is a list, search its items recursively
-        elif isinstance(val, list):
-            for item in val:
-                yield from _find_entites_by_regex(
-                    item,
-                    signal_instance,
-                    entity_type_pairs,
-                )
-
-        # If the value is a string, search it for entity matches
-        elif isinstance(val, str):
-            for entity_type, entity_regex, _ in entity_type_pairs:
-                # Search the string for matches to the entity type's regular expression
-                if match := entity_regex.search(val):
-                    yield EntityCreate(
-                        value=match.group(0),
-                        entity_type=entity_type,
-                        project=signal_instance.project,
-                    )
-
-    def _find_entities_by_regex_and_jsonpath_expression(
-        signal_instance: SignalInstance,
-        entity_type_pairs: list[EntityTypePair],
-    ) -> Generator[EntityCreate, None, None]:
-        """
-        Yield entities found in a SignalInstance by searching its fields using regular expressions and JSONPath expressions.
-
-        Args:
-            signal_instance: The SignalInstance to extract entities from.
-            entity_type_pairs: A list of (entity_type, entity_regex, field) tuples to search for.
-
-        Yields:
-            EntityCreate: An entity found in the SignalInstance.
-        """
-        for entity_type, entity_regex, field in entity_type_pairs:
-            if field:
-                try:
-                    matches = field.find(signal_instance.raw)
-                    for match in matches:
-                        if isinstance(match.value, str):
-                            if entity_regex is None:
-                                yield EntityCreate(
-                                    value=match.value,
-                                    entity_type=entity_type,
-                                    project=signal_instance.project,
-                                )
-                            else:
-                                if match := entity_regex.search(match.value):
-                                    yield EntityCreate(
-                                        value=match.group(0),
-                                        entity_type=entity_type,
-                                        project=signal_instance.project,
-                                    )
-                except jsonpath_ng.PathNotFound:
-                    # field not found in signal_instance.raw
-                    pass
-
-    # Create a list of (entity type, regular expression, field) tuples
-    entity_type_pairs = [
-        (
-            type,
-            re.compile(type.regular_expression) if type.regular_expression else None,
-            jsonpath_ng.parse(type.field) if type.field else None,
-        )
-        for type in entity_types
-        if isinstance(type.regular_expression, str) or type.field is not None
-    ]
-
-    # Filter the entity type pairs based on the field
-    filtered_entity_type_pairs = [
-        (entity_type, entity_regex, field)
-        for entity_type, entity_regex, field in entity_type_pairs
-        if not field
-    ]
-
-    # Use the recursive search function to find entities in the raw data
-    entities = [
-        entity
-        for _, val in signal_instance.raw.items()
-        for entity in _find_entites_by_regex(val, signal_instance, filtered_entity_type_pairs)
-    ]
-
-    entities.extend(
-        _find_entities_by_regex_and_jsonpath_expression(signal_instance, entity_type_pairs)
+    extracted = extract_entities(signal_instance.raw, entity_types)
+
+    # entity types that haven't been persisted yet are created first
+    entity_type_ids = {}
+    for _, entity_type in extracted:
+        if id(entity_type) in entity_type_ids:
+            continue
+        entity_type_id = entity_type.id
+        if entity_type_id is None:
+            entity_type_id = entity_type_service.get_or_create(
+                db_session=db_session, entity_type_in=EntityTypeCreate.from_orm(entity_type)
+            ).id
+        entity_type_ids[id(entity_type)] = entity_type_id
+
+    return get_by_values_or_create(
+        db_session=db_session,
+        project_id=signal_instance.project.id,
+        values=[(value, entity_type_ids[id(entity_type)]) for value, entity_type in extracted],
     )
-
-    # Filter out duplicate entities
-    entities = list(set(entities))
-
-    entities_out = [
-        get_by_value_or_create(db_session=db_session, entity_in=entity_in) for entity_in in entities
-    ]
-
-    return entities_out
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, HTTPException, status
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.entity.service import get_cases_with_entity, get_signal_instances_with_entity
 from dispatch.models import PrimaryKey
 
@@ -22,6 +26,9 @@ def get_entities(common: CommonParameters):
     return search_filter_sort_paginate(model="Entity", **common)
 
 
+add_export_route(router, model="Entity", item_model=EntityRead)
+
+
 @router.get("/{entity_id}", response_model=EntityRead)
 def get_entity(db_session: DbSession, entity_id: PrimaryKey):
     """Given its unique id, retrieve details about a single entity."""
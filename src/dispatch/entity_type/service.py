@@ -1,5 +1,9 @@
-from typing import Optional
+import re
+import threading
+from typing import NamedTuple, Optional
 
+import jsonpath_ng
+from cachetools import LRUCache
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
 from sqlalchemy.orm import Query, Session
 
@@ -8,6 +12,44 @@ from dispatch.project import service as project_service
 from .models import EntityType, EntityTypeCreate, EntityTypeRead, EntityTypeUpdate
 
 
+class EntityTypeExpressions(NamedTuple):
+    regex: Optional[re.Pattern]
+    json_path: Optional[jsonpath_ng.JSONPath]
+
+
+# compiled expressions keyed by entity type id and the expressions themselves
+_expressions_cache = LRUCache(maxsize=1024)
+_expressions_cache_lock = threading.Lock()
+
+
+def get_expressions(entity_type: EntityType) -> EntityTypeExpressions:
+    """Returns the compiled regular expression and JSONPath of an entity type."""
+    key = (entity_type.id, entity_type.regular_expression, entity_type.field)
+
+    with _expressions_cache_lock:
+        expressions = _expressions_cache.get(key)
+    if expressions:
+        return expressions
+
+    expressions = EntityTypeExpressions(
+        regex=re.compile(entity_type.regular_expression)
+        if entity_type.regular_expression
+        else None,
+        json_path=jsonpath_ng.parse(entity_type.field) if entity_type.field else None,
+    )
+
+    with _expressions_cache_lock:
+        _expressions_cache[key] = expressions
+    return expressions
+
+
+def invalidate_expressions(entity_type_id: int) -> None:
+    """Evicts the compiled expressions of an entity type."""
+    with _expressions_cache_lock:
+        for key in [k for k in _expressions_cache.keys() if k[0] == entity_type_id]:
+            del _expressions_cache[key]
+
+
 def get(*, db_session, entity_type_id: int) -> Optional[EntityType]:
     """Gets a entity type by its id."""
     return db_session.query(EntityType).filter(EntityType.id == entity_type_id).one_or_none()
@@ -88,6 +130,7 @@ def update(
             setattr(entity_type, field, update_data[field])
 
     db_session.commit()
+    invalidate_expressions(entity_type.id)
     return entity_type
 
 
@@ -96,3 +139,4 @@ def delete(*, db_session: Session, entity_type_id: int) -> None:
     entity_type = db_session.query(EntityType).filter(EntityType.id == entity_type_id).one()
     db_session.delete(entity_type)
     db_session.commit()
+    invalidate_expressions(entity_type_id)
@@ -4,7 +4,11 @@ from sqlalchemy.exc import IntegrityError
 
 from dispatch.database.core import DbSession
 from dispatch.exceptions import ExistsError
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import PrimaryKey
 
 from .models import (
@@ -24,6 +28,9 @@ def get_entity_types(common: CommonParameters):
     return search_filter_sort_paginate(model="EntityType", **common)
 
 
+add_export_route(router, model="EntityType", item_model=EntityTypeRead)
+
+
 @router.get("/{entity_type_id}", response_model=EntityTypeRead)
 def get_entity_type(db_session: DbSession, entity_type_id: PrimaryKey):
     """Get a entity by its id."""
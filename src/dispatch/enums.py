@@ -6,6 +6,11 @@ class DispatchEnum(str, Enum):
         return str.__str__(self)
 
 
+class ExportFormat(DispatchEnum):
+    csv = "csv"
+    ndjson = "ndjson"
+
+
 class Visibility(DispatchEnum):
     open = "Open"
     restricted = "Restricted"
@@ -39,6 +39,11 @@ class InvalidFilterError(PydanticValueError):
     msg_template = "{msg}"
 
 
+class InvalidCursorError(PydanticValueError):
+    code = "invalid.cursor"
+    msg_template = "{msg}"
+
+
 class InvalidUsernameError(PydanticValueError):
     code = "invalid.username"
     msg_template = "{msg}"
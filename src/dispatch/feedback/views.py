@@ -1,7 +1,11 @@
 from fastapi import APIRouter, HTTPException, status
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import search_filter_sort_paginate, CommonParameters
+from dispatch.database.service import (
+    add_export_route,
+    search_filter_sort_paginate,
+    CommonParameters,
+)
 from dispatch.models import PrimaryKey
 
 
@@ -23,6 +27,9 @@ def get_feedback_entries(commons: CommonParameters):
     return search_filter_sort_paginate(model="Feedback", **commons)
 
 
+add_export_route(router, model="Feedback", item_model=FeedbackRead)
+
+
 @router.get("/{feedback_id}", response_model=FeedbackRead)
 def get_feedback(db_session: DbSession, feedback_id: PrimaryKey):
     """Get a feedback entry by its id."""
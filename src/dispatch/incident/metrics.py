@@ -1,18 +1,25 @@
 import math
 import logging
-from typing import List
-from itertools import groupby
+import threading
+from typing import Dict, List, Tuple
 
 from datetime import date
 
 from calendar import monthrange
 
 import pandas as pd
+from cachetools import TTLCache
+from dateutil.relativedelta import relativedelta
 from statsmodels.tsa.api import ExponentialSmoothing
 
-from sqlalchemy import and_
+from sqlalchemy import distinct, func
 
-from dispatch.database.service import apply_filters, apply_filter_specific_joins
+from dispatch.database.core import get_session_schema_name
+from dispatch.database.service import (
+    apply_filters,
+    apply_filter_specific_joins,
+    get_filter_spec_hash,
+)
 from dispatch.incident.type.models import IncidentType
 
 from .models import Incident
@@ -20,51 +27,57 @@ from .models import Incident
 
 log = logging.getLogger(__name__)
 
+# number of months the forecast endpoint compares predictions with actual counts for
+FORECAST_MONTHS = 4
 
-def month_grouper(item):
+# seconds forecasts are cached for, they only depend on completed months
+FORECAST_CACHE_TTL = 3600
+
+# maps (schema, filter spec hash, current month) to the forecast
+_forecast_cache = TTLCache(maxsize=256, ttl=FORECAST_CACHE_TTL)
+_forecast_cache_lock = threading.Lock()
+
+
+def last_day_of_month(day: date) -> date:
     """Determines the last day of a given month."""
-    key = date(
-        item.reported_at.year,
-        item.reported_at.month,
-        monthrange(item.reported_at.year, item.reported_at.month)[-1],
-    )
-    return key
+    return day.replace(day=monthrange(day.year, day.month)[-1])
 
 
-def create_incident_metric_query(
+def get_incident_counts_by_month(
     db_session,
     end_date: date,
-    start_date: date = None,
     filter_spec: List[dict] = None,
-):
-    """Fetches eligible incidents."""
-    query = db_session.query(Incident)
+) -> Dict[date, int]:
+    """Counts eligible incidents per month up to the month of the end date, in a single query.
+
+    Months are keyed by their last day, months without incidents are omitted.
+    """
+    query = db_session.query(Incident.id)
 
     if filter_spec:
         query = apply_filter_specific_joins(Incident, filter_spec, query)
         query = apply_filters(query, filter_spec)
 
-    if start_date:
-        query = query.filter(
-            and_(Incident.reported_at <= end_date, Incident.reported_at >= start_date)
-        )
-    else:
-        query = query.filter(Incident.reported_at <= end_date)
-
-    # exclude incident types
-    query = query.filter(IncidentType.exclude_from_metrics.isnot(True))
-    return query.all()
-
+    month = func.date_trunc("month", Incident.reported_at).label("month")
+    end = end_date.replace(day=1) + relativedelta(months=1)
+    rows = (
+        query.filter(Incident.reported_at < end)
+        # exclude incident types
+        .filter(~Incident.incident_type.has(IncidentType.exclude_from_metrics.is_(True)))
+        .with_entities(month, func.count(distinct(Incident.id)))
+        .group_by(month)
+        .all()
+    )
+    return {last_day_of_month(month.date()): count for month, count in rows}
 
-def make_forecast(incidents: List[Incident]):
-    """Makes an incident forecast."""
-    incidents_sorted = sorted(incidents, key=month_grouper)
 
+def make_forecast(month_counts: Dict[date, int]) -> Tuple[List[str], List[int]]:
+    """Makes an incident forecast from the incident counts per month."""
     dataframe_dict = {"ds": [], "y": []}
 
-    for last_day, items in groupby(incidents_sorted, month_grouper):
+    for last_day in sorted(month_counts):
         dataframe_dict["ds"].append(str(last_day))
-        dataframe_dict["y"].append(len(list(items)))
+        dataframe_dict["y"].append(month_counts[last_day])
 
     dataframe = pd.DataFrame.from_dict(dataframe_dict)
 
@@ -102,3 +115,72 @@ def make_forecast(incidents: List[Incident]):
         return categories, predicted_counts
     else:
         return [], []
+
+
+def _create_incident_forecast(db_session, filter_spec: List[dict], today: date) -> dict:
+    months = [
+        last_day_of_month(today - relativedelta(months=i))
+        for i in reversed(range(1, FORECAST_MONTHS + 1))
+    ]
+    month_counts = get_incident_counts_by_month(
+        db_session=db_session, end_date=months[-1], filter_spec=filter_spec
+    )
+
+    categories = []
+    predicted = []
+    actual = []
+
+    for month in months:
+        # each window is forecast from the counts of the months up to and including its own
+        predicted_months, predicted_counts = make_forecast(
+            {day: count for day, count in month_counts.items() if day <= month}
+        )
+
+        if month == months[-1]:
+            categories = categories + predicted_months
+            predicted = predicted + predicted_counts
+
+        # get only first predicted month for completed months
+        elif predicted_months and predicted_counts:
+            categories.append(predicted_months[0])
+            predicted.append(predicted_counts[0])
+
+        # get actual month counts
+        actual.append(month_counts.get(month, 0))
+
+    if not (len(predicted)):
+        return {
+            "categories": categories,
+            "series": [
+                {"name": "Predicted", "data": []},
+                {"name": "Actual", "data": []},
+            ],
+        }
+
+    return {
+        "categories": categories,
+        "series": [
+            {"name": "Predicted", "data": predicted},
+            {"name": "Actual", "data": actual[1:]},
+        ],
+    }
+
+
+def create_incident_forecast(db_session, filter_spec: List[dict] = None) -> dict:
+    """Creates the incident forecast of the past months, cached per organization, filter and month."""
+    today = date.today()
+    key = (
+        get_session_schema_name(db_session),
+        get_filter_spec_hash(filter_spec),
+        today.replace(day=1),
+    )
+
+    with _forecast_cache_lock:
+        forecast = _forecast_cache.get(key)
+    if forecast is not None:
+        return forecast
+
+    forecast = _create_incident_forecast(db_session, filter_spec, today)
+    with _forecast_cache_lock:
+        _forecast_cache[key] = forecast
+    return forecast
@@ -376,6 +376,7 @@ class IncidentExpandedPagination(DispatchBase):
     total: int
     itemsPerPage: int
     page: int
+    next: Optional[str] = None
     items: List[IncidentRead] = []
 
 
@@ -383,4 +384,5 @@ class IncidentPagination(DispatchBase):
     total: int
     itemsPerPage: int
     page: int
+    next: Optional[str] = None
     items: List[IncidentReadMinimal] = []
@@ -9,13 +9,13 @@ from sqlalchemy import func
 from dispatch.conversation.enums import ConversationButtonActions
 from dispatch.database.core import SessionLocal, resolve_attr
 from dispatch.decorators import scheduled_project_task
+from dispatch.document.extraction import extract_terms_from_documents
 from dispatch.messaging.strings import (
     INCIDENT,
     INCIDENT_DAILY_REPORT,
     INCIDENT_DAILY_REPORT_TITLE,
     MessageType,
 )
-from dispatch.nlp import build_phrase_matcher, build_term_vocab, extract_terms_from_text
 from dispatch.notification import service as notification_service
 from dispatch.plugin import service as plugin_service
 from dispatch.project.models import Project
@@ -52,34 +52,30 @@ def auto_tagger(db_session: SessionLocal, project: Project):
 
     tags = tag_service.get_all(db_session=db_session, project_id=project.id).all()
     tag_strings = [t.name.lower() for t in tags if t.discoverable]
-    phrases = build_term_vocab(tag_strings)
-    matcher = build_phrase_matcher("dispatch-tag", phrases)
 
     incidents = get_all(db_session=db_session, project_id=project.id).all()
+    incidents_by_document = {i.incident_document.id: i for i in incidents if i.incident_document}
 
-    for incident in incidents:
+    for document, extracted_tags in extract_terms_from_documents(
+        db_session=db_session,
+        plugin=plugin,
+        documents=[i.incident_document for i in incidents_by_document.values()],
+        name="dispatch-tag",
+        terms=tag_strings,
+    ):
+        incident = incidents_by_document[document.id]
         log.debug(f"Processing incident {incident.name}...")
 
-        if incident.incident_document:
-            try:
-                mime_type = "text/plain"
-                text = plugin.instance.get(incident.incident_document.resource_id, mime_type)
-            except Exception as e:
-                log.warn(e)
-                continue
-
-            extracted_tags = list(set(extract_terms_from_text(text, matcher)))
-
-            matched_tags = (
-                db_session.query(Tag)
-                .filter(func.upper(Tag.name).in_([func.upper(t) for t in extracted_tags]))
-                .all()
-            )
+        matched_tags = (
+            db_session.query(Tag)
+            .filter(func.upper(Tag.name).in_([func.upper(t) for t in extracted_tags]))
+            .all()
+        )
 
-            incident.tags.extend(matched_tags)
-            db_session.commit()
+        incident.tags.extend([t for t in matched_tags if t not in incident.tags])
+        db_session.commit()
 
-            log.debug(f"Associating tags with incident {incident.name}. Tags: {extracted_tags}")
+        log.debug(f"Associating tags with incident {incident.name}. Tags: {extracted_tags}")
 
 
 @scheduler.add(every(1).day.at("18:00"), name="incident-daily-report")
@@ -109,16 +105,14 @@ def daily_report(db_session: SessionLocal, project: Project):
     notifications = notification_service.get_all_enabled(
         db_session=db_session, project_id=project.id
     )
+    search_filters = [f for notification in notifications for f in notification.filters]
     for incident in incidents:
+        matched_filter_ids = search_filter_service.match_filters(
+            db_session=db_session, search_filters=search_filters, class_instance=incident
+        )
         for notification in notifications:
             for search_filter in notification.filters:
-                match = search_filter_service.match(
-                    db_session=db_session,
-                    subject=search_filter.subject,
-                    filter_spec=search_filter.expression,
-                    class_instance=incident,
-                )
-                if match:
+                if search_filter.id in matched_filter_ids:
                     incidents_notification_filters_mapping[notification.id][
                         search_filter.id
                     ].append(incident)
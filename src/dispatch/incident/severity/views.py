@@ -2,7 +2,11 @@ from fastapi import APIRouter, Depends, HTTPException, status
 
 from dispatch.auth.permissions import SensitiveProjectActionPermission, PermissionsDependency
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import PrimaryKey
 
 from .models import (
@@ -23,6 +27,9 @@ def get_incident_severities(common: CommonParameters):
     return search_filter_sort_paginate(model="IncidentSeverity", **common)
 
 
+add_export_route(router, model="IncidentSeverity", item_model=IncidentSeverityRead)
+
+
 @router.post(
     "",
     response_model=IncidentSeverityRead,
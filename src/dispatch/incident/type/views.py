@@ -1,7 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.auth.permissions import SensitiveProjectActionPermission, PermissionsDependency
 from dispatch.models import PrimaryKey
 
@@ -18,6 +22,9 @@ def get_incident_types(common: CommonParameters):
     return search_filter_sort_paginate(model="IncidentType", **common)
 
 
+add_export_route(router, model="IncidentType", item_model=IncidentTypeRead)
+
+
 @router.post(
     "",
     response_model=IncidentTypeRead,
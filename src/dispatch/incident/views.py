@@ -1,10 +1,7 @@
-import calendar
 import json
 import logging
-from datetime import date
 from typing import Annotated, List
 
-from dateutil.relativedelta import relativedelta
 
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
 from starlette.requests import Request
@@ -20,7 +17,12 @@ from dispatch.auth.permissions import (
 from dispatch.auth.service import CurrentUser
 from dispatch.common.utils.views import create_pydantic_include
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    Cursor,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.incident.enums import IncidentStatus
 from dispatch.individual.models import IndividualContactRead
 from dispatch.models import OrganizationSlug, PrimaryKey
@@ -37,13 +39,14 @@ from .flows import (
     incident_subscribe_participant_flow,
     incident_update_flow,
 )
-from .metrics import create_incident_metric_query, make_forecast
+from .metrics import create_incident_forecast
 from .models import (
     Incident,
     IncidentCreate,
     IncidentExpandedPagination,
     IncidentPagination,
     IncidentRead,
+    IncidentReadMinimal,
     IncidentUpdate,
 )
 from .service import create, delete, get, update
@@ -72,9 +75,10 @@ def get_incidents(
     common: CommonParameters,
     include: List[str] = Query([], alias="include[]"),
     expand: bool = Query(default=False),
+    cursor: Cursor = None,
 ):
     """Retrieves a list of incidents."""
-    pagination = search_filter_sort_paginate(model="Incident", **common)
+    pagination = search_filter_sort_paginate(model="Incident", cursor=cursor, **common)
 
     if expand:
         return json.loads(IncidentExpandedPagination(**pagination).json())
@@ -88,11 +92,15 @@ def get_incidents(
             "itemsPerPage": ...,
             "page": ...,
             "total": ...,
+            "next": ...,
         }
         return json.loads(IncidentPagination(**pagination).json(include=include_fields))
     return json.loads(IncidentPagination(**pagination).json())
 
 
+add_export_route(router, model="Incident", item_model=IncidentReadMinimal)
+
+
 @router.get(
     "/{incident_id}",
     response_model=IncidentRead,
@@ -300,72 +308,10 @@ def create_executive_report(
     )
 
 
-def get_month_range(relative):
-    today = date.today()
-    relative_month = today - relativedelta(months=relative)
-    _, month_end_day = calendar.monthrange(relative_month.year, relative_month.month)
-    month_start = relative_month.replace(day=1)
-    month_end = relative_month.replace(day=month_end_day)
-    return month_start, month_end
-
-
 @router.get("/metric/forecast", summary="Gets incident forecast data.")
 def get_incident_forecast(
     db_session: DbSession,
     common: CommonParameters,
 ):
     """Gets incident forecast data."""
-    categories = []
-    predicted = []
-    actual = []
-
-    for i in reversed(range(1, 5)):
-        start_date, end_date = get_month_range(i)
-
-        if i == 1:
-            incidents = create_incident_metric_query(
-                db_session=db_session,
-                filter_spec=common["filter_spec"],
-                end_date=end_date,
-            )
-            predicted_months, predicted_counts = make_forecast(incidents=incidents)
-            categories = categories + predicted_months
-            predicted = predicted + predicted_counts
-
-        else:
-            incidents = create_incident_metric_query(
-                db_session=db_session, filter_spec=common["filter_spec"], end_date=end_date
-            )
-
-            # get only first predicted month for completed months
-            predicted_months, predicted_counts = make_forecast(incidents=incidents)
-            if predicted_months and predicted_counts:
-                categories.append(predicted_months[0])
-                predicted.append(predicted_counts[0])
-
-        # get actual month counts
-        incidents = create_incident_metric_query(
-            db_session=db_session,
-            filter_spec=common["filter_spec"],
-            end_date=end_date,
-            start_date=start_date,
-        )
-
-        actual.append(len(incidents))
-
-    if not (len(predicted)):
-        return {
-            "categories": categories,
-            "series": [
-                {"name": "Predicted", "data": []},
-                {"name": "Actual", "data": []},
-            ],
-        }
-
-    return {
-        "categories": categories,
-        "series": [
-            {"name": "Predicted", "data": predicted},
-            {"name": "Actual", "data": actual[1:]},
-        ],
-    }
+    return create_incident_forecast(db_session=db_session, filter_spec=common["filter_spec"])
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.auth.permissions import SensitiveProjectActionPermission, PermissionsDependency
 from dispatch.models import PrimaryKey
 
@@ -23,6 +27,9 @@ def get_incident_cost_types(common: CommonParameters):
     return search_filter_sort_paginate(model="IncidentCostType", **common)
 
 
+add_export_route(router, model="IncidentCostType", item_model=IncidentCostTypeRead)
+
+
 @router.get("/{incident_cost_type_id}", response_model=IncidentCostTypeRead)
 def get_incident_cost_type(db_session: DbSession, incident_cost_type_id: PrimaryKey):
     """Get an incident cost type by its id."""
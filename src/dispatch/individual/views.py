@@ -3,7 +3,11 @@ from pydantic.error_wrappers import ErrorWrapper, ValidationError
 
 from dispatch.auth.permissions import PermissionsDependency, SensitiveProjectActionPermission
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.exceptions import ExistsError
 from dispatch.models import PrimaryKey
 
@@ -18,6 +22,9 @@ from .service import get, get_by_email_and_project, create, update, delete
 
 router = APIRouter()
 
+# registered first, `/{individual_contact_id}` would match it otherwise
+add_export_route(router, model="IndividualContact", item_model=IndividualContactRead)
+
 
 @router.get("/{individual_contact_id}", response_model=IndividualContactRead)
 def get_individual(db_session: DbSession, individual_contact_id: PrimaryKey):
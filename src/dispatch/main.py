@@ -2,7 +2,7 @@ import time
 import logging
 from os import path
 from uuid import uuid1
-from typing import Optional, Final
+from typing import Final, List, Optional, Pattern
 from contextvars import ContextVar
 
 from fastapi import FastAPI, status
@@ -12,8 +12,6 @@ from pydantic.error_wrappers import ValidationError
 from sentry_asgi import SentryMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
-from sqlalchemy import inspect
-from sqlalchemy.orm import scoped_session
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.routing import compile_path
@@ -26,7 +24,12 @@ from .common.utils.cli import install_plugins, install_plugin_events
 from .config import (
     STATIC_DIR,
 )
-from .database.core import engine, sessionmaker
+from .database.core import (
+    get_organization_pool_statistics,
+    get_organization_schema_name,
+    get_organization_sessionmaker,
+    schema_exists,
+)
 from .extensions import configure_extensions
 from .logging import configure_logging
 from .metrics import provider as metric_provider
@@ -79,15 +82,25 @@ api = FastAPI(
 )
 
 
+_route_regexes: Optional[List[Pattern]] = None
+
+
+def compile_route_table() -> List[Pattern]:
+    """Compiles the path regexes of all API routes once so requests don't have to."""
+    global _route_regexes
+    # the last matching route wins, so we keep the routes in reverse registration order
+    _route_regexes = [compile_path(r.path)[0] for r in reversed(api_router.routes)]
+    return _route_regexes
+
+
 def get_path_params_from_request(request: Request) -> str:
-    path_params = {}
-    for r in api_router.routes:
-        path_regex, path_format, param_converters = compile_path(r.path)
-        path = request["path"].removeprefix("/api/v1")  # remove the /api/v1 for matching
+    route_regexes = _route_regexes if _route_regexes is not None else compile_route_table()
+    path = request["path"].removeprefix("/api/v1")  # remove the /api/v1 for matching
+    for path_regex in route_regexes:
         match = path_regex.match(path)
         if match:
-            path_params = match.groupdict()
-    return path_params
+            return match.groupdict()
+    return {}
 
 
 def get_path_template(request: Request) -> str:
@@ -117,16 +130,11 @@ async def db_session_middleware(request: Request, call_next):
     organization_slug = path_params.get("organization")
     if organization_slug:
         request.state.organization = organization_slug
-        schema = f"dispatch_organization_{organization_slug}"
+        schema = get_organization_schema_name(organization_slug)
         # validate slug exists
-        schema_names = inspect(engine).get_schema_names()
-        if schema in schema_names:
+        if schema_exists(schema):
             # add correct schema mapping depending on the request
-            schema_engine = engine.execution_options(
-                schema_translate_map={
-                    None: schema,
-                }
-            )
+            session_factory = get_organization_sessionmaker(organization_slug)
         else:
             return JSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -136,14 +144,9 @@ async def db_session_middleware(request: Request, call_next):
         # add correct schema mapping depending on the request
         # can we set some default here?
         request.state.organization = "default"
-        schema_engine = engine.execution_options(
-            schema_translate_map={
-                None: "dispatch_organization_default",
-            }
-        )
+        session_factory = get_organization_sessionmaker("default")
     try:
-        session = scoped_session(sessionmaker(bind=schema_engine), scopefunc=get_request_id)
-        request.state.db = session()
+        request.state.db = session_factory()
         response = await call_next(request)
     except Exception as e:
         raise e from None
@@ -161,8 +164,43 @@ async def add_security_headers(request: Request, call_next):
     return response
 
 
+# seconds between two reports of the database pool usage
+POOL_METRICS_INTERVAL = 60
+
+
+def emit_pool_metrics():
+    """Reports the shared database pool usage and the connections held by each organization."""
+    statistics = get_organization_pool_statistics()
+    for name, value in statistics["pool"].items():
+        metric_provider.gauge(f"database.pool.{name}", value)
+
+    for organization_slug, usage in statistics["organizations"].items():
+        tags = {"organization": organization_slug}
+        metric_provider.gauge(
+            "database.pool.organization.checked_out", usage["checked_out"], tags=tags
+        )
+        metric_provider.gauge("database.pool.organization.checkouts", usage["checkouts"], tags=tags)
+
+
 class MetricsMiddleware(BaseHTTPMiddleware):
+    pool_metrics_emitted_at: Optional[float] = None
+
+    def emit_pool_metrics(self):
+        now = time.monotonic()
+        if (
+            self.pool_metrics_emitted_at is not None
+            and now - self.pool_metrics_emitted_at < POOL_METRICS_INTERVAL
+        ):
+            return
+
+        self.pool_metrics_emitted_at = now
+        try:
+            emit_pool_metrics()
+        except Exception as e:
+            log.warning(f"Unable to report database pool metrics. Reason: {e}")
+
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        self.emit_pool_metrics()
         path_template = get_path_template(request)
 
         method = request.method
@@ -226,6 +264,9 @@ install_plugin_events(api_router)
 # we add all API routes to the Web API framework
 api.include_router(api_router)
 
+# we compile the route table used for tenant resolution now that all routes are registered
+compile_route_table()
+
 # we mount the frontend and app
 if STATIC_DIR and path.isdir(STATIC_DIR):
     frontend.mount("/", StaticFiles(directory=STATIC_DIR), name="app")
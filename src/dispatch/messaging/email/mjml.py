@@ -0,0 +1,252 @@
+"""
+.. module: dispatch.messaging.email.mjml
+    :platform: Unix
+    :copyright: (c) 2022 by Netflix Inc., see AUTHORS for more
+    :license: Apache, see LICENSE for more details.
+"""
+import atexit
+import hashlib
+import itertools
+import json
+import logging
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+from typing import Dict, List, Optional
+
+from cachetools import LRUCache
+
+from dispatch.config import MJML_PATH, MJML_WORKERS
+
+log = logging.getLogger(__name__)
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.realpath(__file__)), "mjml_worker.js")
+WORKER_COMMAND = ["node", WORKER_SCRIPT]
+
+# maximum number of rendered html bodies kept in memory
+RENDER_CACHE_SIZE = 512
+
+# seconds a worker may take to answer a request before it's killed
+RENDER_TIMEOUT = 30
+
+
+class MJMLRenderError(Exception):
+    pass
+
+
+class MJMLWorkerError(Exception):
+    pass
+
+
+class MJMLWorkerCrashedError(MJMLWorkerError):
+    pass
+
+
+def render_with_cli(template: str) -> str:
+    """Uses the mjml cli to create html."""
+    with tempfile.NamedTemporaryFile("w+") as fp:
+        fp.write(template)
+        fp.flush()
+        process = subprocess.run(
+            ["./mjml", fp.name, "-s"],
+            cwd=MJML_PATH,
+            capture_output=True,
+        )
+        if process.stderr:
+            log.error(process.stderr.decode("utf-8"))
+            raise MJMLRenderError("MJML template processing failed.")
+        return process.stdout.decode("utf-8")
+
+
+class MJMLWorker:
+    """A persistent node process rendering batches of templates."""
+
+    def __init__(self):
+        self._process = None
+        self._ids = itertools.count()
+
+    def _start(self):
+        self._process = subprocess.Popen(
+            WORKER_COMMAND,
+            cwd=MJML_PATH,
+            env=dict(os.environ, NODE_PATH=os.path.dirname(MJML_PATH)),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+        )
+        log.debug(f"Started MJML worker with pid {self._process.pid}.")
+
+    def render(self, templates: List[str]) -> List[dict]:
+        """Renders the templates, returning their html and validation errors.
+
+        Raises `MJMLWorkerCrashedError` if the process died or couldn't be
+        started, and `MJMLWorkerError` if it timed out or misbehaved.
+        """
+        try:
+            if self._process is None or self._process.poll() is not None:
+                self._start()
+        except OSError as e:
+            raise MJMLWorkerCrashedError(f"MJML worker failed to start. Reason: {e}") from e
+
+        process = self._process
+        timed_out = threading.Event()
+
+        def _kill():
+            timed_out.set()
+            process.kill()
+
+        request_id = next(self._ids)
+        timer = threading.Timer(RENDER_TIMEOUT, _kill)
+        timer.start()
+        try:
+            process.stdin.write(json.dumps({"id": request_id, "templates": templates}))
+            process.stdin.write("\n")
+            process.stdin.flush()
+            line = process.stdout.readline()
+        except OSError as e:
+            self.stop()
+            if timed_out.is_set():
+                raise MJMLWorkerError(
+                    f"MJML worker didn't answer within {RENDER_TIMEOUT} seconds."
+                ) from e
+            raise MJMLWorkerCrashedError(f"MJML worker failed. Reason: {e}") from e
+        finally:
+            timer.cancel()
+
+        if not line:
+            self.stop()
+            if timed_out.is_set():
+                raise MJMLWorkerError(f"MJML worker didn't answer within {RENDER_TIMEOUT} seconds.")
+            raise MJMLWorkerCrashedError("MJML worker exited unexpectedly.")
+
+        try:
+            response = json.loads(line)
+        except ValueError:
+            response = {}
+
+        if response.get("id") != request_id:
+            self.stop()
+            raise MJMLWorkerError(f"MJML worker returned an invalid response: {line[:200]}")
+
+        return response["results"]
+
+    def stop(self):
+        if self._process is None:
+            return
+
+        process, self._process = self._process, None
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+
+
+class MJMLRenderer:
+    """Renders MJML templates with a small pool of persistent node processes.
+
+    Rendered html is cached by a hash of the MJML source, which holds both the
+    template and the context it was rendered with, so identical bodies sent to
+    many recipients are only rendered once. Falls back to the mjml cli when
+    node or the mjml package can't be found, or a worker keeps failing, times
+    out or doesn't become available in time.
+    """
+
+    def __init__(self, size: int = MJML_WORKERS, cache_size: int = RENDER_CACHE_SIZE):
+        self.size = size
+        self._workers = [MJMLWorker() for _ in range(size)]
+        self._idle = queue.LifoQueue()
+        for worker in self._workers:
+            self._idle.put(worker)
+        self._cache = LRUCache(maxsize=cache_size)
+        self._cache_lock = threading.Lock()
+        self._available: Optional[bool] = None
+
+    @property
+    def available(self) -> bool:
+        """Whether templates can be rendered with the worker pool."""
+        if self._available is None:
+            self._available = bool(
+                self.size
+                and shutil.which("node")
+                and os.path.isdir(os.path.join(os.path.dirname(MJML_PATH), "mjml"))
+            )
+            if not self._available:
+                log.info("MJML worker pool unavailable, rendering templates with the mjml cli.")
+        return self._available
+
+    def _render_with_pool(self, templates: List[str]) -> List[dict]:
+        try:
+            worker = self._idle.get(timeout=RENDER_TIMEOUT)
+        except queue.Empty:
+            raise MJMLWorkerError(
+                f"No MJML worker became available within {RENDER_TIMEOUT} seconds."
+            ) from None
+
+        try:
+            try:
+                return worker.render(templates)
+            except MJMLWorkerCrashedError as e:
+                # the worker is restarted on the next request, retry once. timeouts
+                # aren't retried, the same templates would likely time out again
+                log.warning(e)
+                return worker.render(templates)
+        finally:
+            self._idle.put(worker)
+
+    def _render(self, templates: List[str]) -> List[str]:
+        if self.available:
+            try:
+                results = self._render_with_pool(templates)
+            except MJMLWorkerError as e:
+                log.exception(e)
+            else:
+                rendered = []
+                for result in results:
+                    if result["errors"]:
+                        log.error("\n".join(result["errors"]))
+                        raise MJMLRenderError("MJML template processing failed.")
+                    rendered.append(result["html"])
+                return rendered
+
+        return [render_with_cli(template) for template in templates]
+
+    def render_many(self, templates: List[str]) -> List[str]:
+        """Renders the templates in a single request to the pool."""
+        keys = [hashlib.sha256(template.encode("utf-8")).hexdigest() for template in templates]
+
+        rendered: Dict[str, str] = {}
+        with self._cache_lock:
+            for key in keys:
+                if key in self._cache:
+                    rendered[key] = self._cache[key]
+
+        missing = {key: template for key, template in zip(keys, templates) if key not in rendered}
+        if missing:
+            for key, html in zip(missing.keys(), self._render(list(missing.values()))):
+                rendered[key] = html
+
+            with self._cache_lock:
+                for key in missing.keys():
+                    self._cache[key] = rendered[key]
+
+        return [rendered[key] for key in keys]
+
+    def render(self, template: str) -> str:
+        return self.render_many([template])[0]
+
+    def clear(self):
+        with self._cache_lock:
+            self._cache.clear()
+
+    def stop(self):
+        for worker in self._workers:
+            worker.stop()
+
+
+mjml_renderer = MJMLRenderer()
+atexit.register(mjml_renderer.stop)
@@ -0,0 +1,31 @@
+// Long-lived MJML renderer used by dispatch.messaging.email.mjml.
+//
+// Reads newline delimited JSON requests of the form {"id": 1, "templates": ["<mjml>..."]}
+// from stdin and answers each with {"id": 1, "results": [{"html": "...", "errors": []}]}
+// on stdout, in order. The mjml package is resolved through NODE_PATH.
+const readline = require("readline")
+const mjml2html = require("mjml")
+
+function render(template) {
+  try {
+    const { html, errors } = mjml2html(template, { validationLevel: "soft" })
+    return { html, errors: errors.map((error) => error.formattedMessage) }
+  } catch (error) {
+    return { html: null, errors: [String(error)] }
+  }
+}
+
+const input = readline.createInterface({ input: process.stdin, terminal: false })
+
+input.on("line", (line) => {
+  let response
+  try {
+    const request = JSON.parse(line)
+    response = { id: request.id, results: request.templates.map(render) }
+  } catch (error) {
+    response = { id: null, error: String(error) }
+  }
+  process.stdout.write(JSON.stringify(response) + "\n")
+})
+
+input.on("close", () => process.exit(0))
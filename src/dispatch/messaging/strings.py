@@ -1,7 +1,8 @@
-import copy
-
+from functools import lru_cache
 from typing import List
 
+from jinja2 import Template
+
 from dispatch.messaging.email.filters import env
 from dispatch.conversation.enums import ConversationButtonActions
 from dispatch.incident.enums import IncidentStatus
@@ -722,19 +723,33 @@ INCIDENT_OPEN_TASKS = [
 ]
 
 
+@lru_cache(maxsize=1024)
+def get_compiled_template(source: str) -> Template:
+    """Returns the compiled jinja template for a template string, each string is parsed once."""
+    return env.from_string(source)
+
+
+def render_template_string(source: str, /, **kwargs) -> str:
+    """Renders a template string using its compiled template."""
+    return get_compiled_template(source).render(**kwargs)
+
+
 def render_message_template(message_template: List[dict], **kwargs):
-    """Renders the jinja data included in the template itself."""
+    """Renders the jinja data included in the template itself.
+
+    The message template is left untouched, rendered blocks are shallow copies.
+    """
     data = []
-    new_copy = copy.deepcopy(message_template)
-    for d in new_copy:
+    for block in message_template:
+        d = dict(block)
         if d.get("header"):
-            d["header"] = env.from_string(d["header"]).render(**kwargs)
+            d["header"] = render_template_string(d["header"], **kwargs)
 
         if d.get("title"):
-            d["title"] = env.from_string(d["title"]).render(**kwargs)
+            d["title"] = render_template_string(d["title"], **kwargs)
 
         if d.get("title_link"):
-            d["title_link"] = env.from_string(d["title_link"]).render(**kwargs)
+            d["title_link"] = render_template_string(d["title_link"], **kwargs)
 
             if d["title_link"] == "None":  # skip blocks with no content
                 continue
@@ -744,7 +759,7 @@ def render_message_template(message_template: List[dict], **kwargs):
                 continue
 
         if d.get("text"):
-            d["text"] = env.from_string(d["text"]).render(**kwargs)
+            d["text"] = render_template_string(d["text"], **kwargs)
 
             # NOTE: we truncate the string to 2500 characters
             # to prevent hitting limits on SaaS integrations (e.g. Slack)
@@ -752,17 +767,18 @@ def render_message_template(message_template: List[dict], **kwargs):
 
         # render a new button array given the template
         if d.get("buttons"):
+            d["buttons"] = [dict(button) for button in d["buttons"]]
             for button in d["buttons"]:
-                button["button_text"] = env.from_string(button["button_text"]).render(**kwargs)
-                button["button_value"] = env.from_string(button["button_value"]).render(**kwargs)
+                button["button_text"] = render_template_string(button["button_text"], **kwargs)
+                button["button_value"] = render_template_string(button["button_value"], **kwargs)
 
                 if button.get("button_action"):
-                    button["button_action"] = env.from_string(button["button_action"]).render(
-                        **kwargs
+                    button["button_action"] = render_template_string(
+                        button["button_action"], **kwargs
                     )
 
                 if button.get("button_url"):
-                    button["button_url"] = env.from_string(button["button_url"]).render(**kwargs)
+                    button["button_url"] = render_template_string(button["button_url"], **kwargs)
 
         if d.get("visibility_mapping"):
             d["text"] = d["visibility_mapping"][kwargs["visibility"]]
@@ -771,10 +787,10 @@ def render_message_template(message_template: List[dict], **kwargs):
             d["text"] = d["status_mapping"][kwargs["status"]]
 
         if d.get("datetime"):
-            d["datetime"] = env.from_string(d["datetime"]).render(**kwargs)
+            d["datetime"] = render_template_string(d["datetime"], **kwargs)
 
         if d.get("context"):
-            d["context"] = env.from_string(d["context"]).render(**kwargs)
+            d["context"] = render_template_string(d["context"], **kwargs)
 
         data.append(d)
 
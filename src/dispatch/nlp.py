@@ -1,14 +1,24 @@
+import hashlib
 import logging
-from typing import List
+import threading
+from typing import Iterable, List, Tuple
 
 import spacy
+from cachetools import LRUCache
 from spacy.matcher import PhraseMatcher
+from spacy.util import filter_spans
 
 log = logging.getLogger(__name__)
 
 nlp = spacy.blank("en")
 nlp.vocab.lex_attr_getters = {}
 
+# maximum number of phrase matchers kept, one per distinct term or tag set
+PHRASE_MATCHER_CACHE_SIZE = 32
+
+_phrase_matcher_cache = LRUCache(maxsize=PHRASE_MATCHER_CACHE_SIZE)
+_phrase_matcher_lock = threading.Lock()
+
 
 def build_term_vocab(terms: List[str]):
     """Builds nlp vocabulary."""
@@ -29,27 +39,47 @@ def build_phrase_matcher(name: str, phrases: List[str]) -> PhraseMatcher:
     return matcher
 
 
-def extract_terms_from_text(text: str, matcher: PhraseMatcher) -> List[str]:
-    """Extracts key terms out of test."""
-    terms = []
-    doc = nlp.tokenizer(text)
-    for w in doc:
-        _ = doc.vocab[
-            w.text.lower()
-        ]  # We normalize our docs so that vocab doesn't take so long to build.
+def get_phrase_matcher_key(name: str, terms: Iterable[str]) -> str:
+    """Returns a hash identifying the matcher of a name and set of terms."""
+    normalized_terms = "\n".join(sorted({t for t in terms if t}))
+    return hashlib.sha256(f"{name}\n{normalized_terms}".encode("utf-8")).hexdigest()
+
+
+def get_phrase_matcher(name: str, terms: Iterable[str]) -> Tuple[str, PhraseMatcher]:
+    """Returns the key and the cached PhraseMatcher for the given terms, building it on a miss."""
+    terms = list(terms)
+    key = get_phrase_matcher_key(name, terms)
+
+    with _phrase_matcher_lock:
+        matcher = _phrase_matcher_cache.get(key)
+        if matcher is None:
+            matcher = build_phrase_matcher(name, list(build_term_vocab(terms)))
+            _phrase_matcher_cache[key] = matcher
 
-    matches = matcher(doc)
-    for _, start, end in matches:
-        with doc.retokenize() as retokenizer:
-            retokenizer.merge(doc[start:end])
+    return key, matcher
 
+
+def _extract_terms_from_doc(doc, matcher: PhraseMatcher) -> List[str]:
+    terms = []
+    spans = filter_spans([doc[start:end] for _, start, end in matcher(doc)])
+    for span in spans:
         # We try to filter out common stop words unless
         # we have surrounding context that would suggest they are not stop words.
-        span = doc[start:end]
-        for token in span:
-            if token.is_stop:
-                continue
+        if all(token.is_stop for token in span):
+            continue
 
-            terms.append(token.text.lower())
+        terms.append(span.text.lower())
 
     return terms
+
+
+def extract_terms_from_texts(
+    texts: Iterable[str], matcher: PhraseMatcher, batch_size: int = 32
+) -> List[List[str]]:
+    """Extracts key terms out of many texts, tokenizing them in batches."""
+    return [_extract_terms_from_doc(doc, matcher) for doc in nlp.pipe(texts, batch_size=batch_size)]
+
+
+def extract_terms_from_text(text: str, matcher: PhraseMatcher) -> List[str]:
+    """Extracts key terms out of test."""
+    return _extract_terms_from_doc(nlp.tokenizer(text), matcher)
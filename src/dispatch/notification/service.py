@@ -139,15 +139,14 @@ def filter_and_send(
 ):
     """Sends notifications."""
     notifications = get_all_enabled(db_session=db_session, project_id=project_id)
+    matched_filter_ids = search_filter_service.match_filters(
+        db_session=db_session,
+        search_filters=[f for notification in notifications for f in notification.filters],
+        class_instance=class_instance,
+    )
     for notification in notifications:
         for search_filter in notification.filters:
-            match = search_filter_service.match(
-                db_session=db_session,
-                subject=search_filter.subject,
-                filter_spec=search_filter.expression,
-                class_instance=class_instance,
-            )
-            if match:
+            if search_filter.id in matched_filter_ids:
                 send(
                     db_session=db_session,
                     project_id=project_id,
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.auth.permissions import SensitiveProjectActionPermission, PermissionsDependency
 from dispatch.models import PrimaryKey
 
@@ -23,6 +27,9 @@ def get_notifications(common: CommonParameters):
     return search_filter_sort_paginate(model="Notification", **common)
 
 
+add_export_route(router, model="Notification", item_model=NotificationRead)
+
+
 @router.get("/{notification_id}", response_model=NotificationRead)
 def get_notification(db_session: DbSession, notification_id: PrimaryKey):
     """Get a notification by its id."""
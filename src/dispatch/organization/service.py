@@ -4,7 +4,7 @@ from pydantic.error_wrappers import ErrorWrapper, ValidationError
 from sqlalchemy.sql.expression import true
 
 from dispatch.auth.models import DispatchUser, DispatchUserOrganization
-from dispatch.database.core import engine
+from dispatch.database.core import engine, invalidate_schema_names
 from dispatch.database.manage import init_schema
 from dispatch.enums import UserRoles
 from dispatch.exceptions import NotFoundError
@@ -151,6 +151,9 @@ def delete(*, db_session, organization_id: int):
     db_session.delete(organization)
     db_session.commit()
 
+    # the organization's schema may be dropped along with it
+    invalidate_schema_names()
+
 
 def add_user(
     *,
@@ -9,7 +9,11 @@ from dispatch.auth.permissions import (
 )
 from dispatch.auth.service import CurrentUser
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.enums import UserRoles
 from dispatch.exceptions import ExistsError
 from dispatch.models import PrimaryKey
@@ -35,6 +39,9 @@ def get_organizations(common: CommonParameters):
     return search_filter_sort_paginate(model="Organization", **common)
 
 
+add_export_route(router, model="Organization", item_model=OrganizationRead)
+
+
 @router.post(
     "",
     response_model=OrganizationRead,
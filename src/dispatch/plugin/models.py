@@ -1,4 +1,7 @@
+import threading
 from typing import Any, List, Optional
+
+from cachetools import LRUCache
 from pydantic import Field, SecretStr
 from pydantic.json import pydantic_encoder
 
@@ -25,6 +28,29 @@ def show_secrets_encoder(obj):
         return pydantic_encoder(obj)
 
 
+# parsed configurations keyed by plugin slug and their decrypted json
+_configuration_cache = LRUCache(maxsize=1024)
+_configuration_cache_lock = threading.Lock()
+
+
+def parse_configuration(slug: str, configuration: str):
+    """Parses a plugin's stored configuration. Parsed objects are shared, don't mutate them."""
+    key = (slug, configuration)
+    with _configuration_cache_lock:
+        config_object = _configuration_cache.get(key)
+    if config_object is None:
+        plugin = plugins.get(slug)
+        config_object = plugin.configuration_schema.parse_raw(configuration)
+        with _configuration_cache_lock:
+            _configuration_cache[key] = config_object
+    return config_object
+
+
+# plugin objects bound to a plugin instance's configuration, keyed by
+# plugin instance id, plugin slug, project id and decrypted configuration
+_configured_plugins = LRUCache(maxsize=1024)
+
+
 class Plugin(Base):
     __table_args__ = {"schema": "dispatch_core"}
     id = Column(Integer, primary_key=True)
@@ -70,9 +96,15 @@ class PluginInstance(Base, ProjectMixin):
     @property
     def instance(self):
         """Fetches a plugin instance that matches this record."""
-        plugin = plugins.get(self.plugin.slug)
-        plugin.configuration = self.configuration
-        plugin.project_id = self.project_id
+        key = (self.id, self.plugin.slug, self.project_id, self._configuration)
+        with _configuration_cache_lock:
+            plugin = _configured_plugins.get(key)
+        if plugin is None:
+            plugin = plugins.configure(
+                self.plugin.slug, configuration=self.configuration, project_id=self.project_id
+            )
+            with _configuration_cache_lock:
+                _configured_plugins[key] = plugin
         return plugin
 
     @property
@@ -85,8 +117,7 @@ class PluginInstance(Base, ProjectMixin):
     def configuration(self):
         """Property that correctly returns a plugins configuration object."""
         if self._configuration:
-            plugin = plugins.get(self.plugin.slug)
-            return plugin.configuration_schema.parse_raw(self._configuration)
+            return parse_configuration(self.plugin.slug, self._configuration)
 
     @configuration.setter
     def configuration(self, configuration):
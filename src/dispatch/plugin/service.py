@@ -1,9 +1,18 @@
 import logging
+import threading
 
 from typing import List, Optional
 
+from cachetools import TTLCache
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
-
+from sqlalchemy import event
+from sqlalchemy.orm.attributes import set_committed_value
+
+from dispatch.database.core import (
+    get_detached_copy,
+    get_session_schema_name,
+    merge_detached_copy,
+)
 from dispatch.exceptions import InvalidConfigurationError
 from dispatch.plugins.bases import OncallPlugin
 from dispatch.project import service as project_service
@@ -14,6 +23,59 @@ from .models import Plugin, PluginInstance, PluginInstanceCreate, PluginInstance
 
 log = logging.getLogger(__name__)
 
+# number of seconds other processes may serve a plugin instance after it changed
+PLUGIN_INSTANCE_CACHE_TTL = 60
+PLUGIN_INSTANCE_CACHE_SIZE = 1024
+
+# maps (schema, project id, "type" or "slug", plugin type or slug) to a detached copy
+# of the active plugin instance, or None if there is no active instance
+_active_instance_cache = TTLCache(maxsize=PLUGIN_INSTANCE_CACHE_SIZE, ttl=PLUGIN_INSTANCE_CACHE_TTL)
+_active_instance_cache_lock = threading.Lock()
+_missing = object()
+
+
+def _copy_plugin_instance(plugin_instance: PluginInstance) -> PluginInstance:
+    plugin = get_detached_copy(plugin_instance.plugin)
+    copy = get_detached_copy(plugin_instance)
+    # bypasses the backref, the copy must not show up in the plugin's instances
+    set_committed_value(copy, "plugin", plugin)
+    return copy
+
+
+def _get_cached_active_instance(*, db_session, key: tuple, query) -> Optional[PluginInstance]:
+    """Resolves an active plugin instance through the cache.
+
+    Cached copies are merged into the session without emitting any SQL.
+    """
+    key = (get_session_schema_name(db_session),) + key
+    with _active_instance_cache_lock:
+        cached = _active_instance_cache.get(key, _missing)
+
+    if cached is _missing:
+        plugin_instance = query.one_or_none()
+        cached = _copy_plugin_instance(plugin_instance) if plugin_instance else None
+        with _active_instance_cache_lock:
+            _active_instance_cache[key] = cached
+        return plugin_instance
+
+    if cached is None:
+        return None
+
+    return merge_detached_copy(db_session, cached)
+
+
+def invalidate_active_instances():
+    """Drops all cached plugin instance resolutions."""
+    with _active_instance_cache_lock:
+        _active_instance_cache.clear()
+
+
+@event.listens_for(PluginInstance, "after_insert")
+@event.listens_for(PluginInstance, "after_update")
+@event.listens_for(PluginInstance, "after_delete")
+def _invalidate_active_instances_on_change(mapper, connection, target):
+    invalidate_active_instances()
+
 
 def get(*, db_session, plugin_id: int) -> Optional[Plugin]:
     """Returns a plugin based on the given plugin id."""
@@ -48,13 +110,15 @@ def get_active_instance(
     *, db_session, plugin_type: str, project_id=None
 ) -> Optional[PluginInstance]:
     """Fetches the current active plugin for the given type."""
-    return (
+    query = (
         db_session.query(PluginInstance)
         .join(Plugin)
         .filter(Plugin.type == plugin_type)
         .filter(PluginInstance.project_id == project_id)
         .filter(PluginInstance.enabled == True)  # noqa
-        .one_or_none()
+    )
+    return _get_cached_active_instance(
+        db_session=db_session, key=(project_id, "type", plugin_type), query=query
     )
 
 
@@ -76,13 +140,15 @@ def get_active_instance_by_slug(
     *, db_session, slug: str, project_id=None
 ) -> Optional[PluginInstance]:
     """Fetches the current active plugin for the given type."""
-    return (
+    query = (
         db_session.query(PluginInstance)
         .join(Plugin)
         .filter(Plugin.slug == slug)
         .filter(PluginInstance.project_id == project_id)
         .filter(PluginInstance.enabled == True)  # noqa
-        .one_or_none()
+    )
+    return _get_cached_active_instance(
+        db_session=db_session, key=(project_id, "slug", slug), query=query
     )
 
 
@@ -115,6 +181,7 @@ def create_instance(*, db_session, plugin_instance_in: PluginInstanceCreate) ->
 
     db_session.add(plugin_instance)
     db_session.commit()
+    invalidate_active_instances()
     return plugin_instance
 
 
@@ -161,6 +228,7 @@ def update_instance(
     plugin_instance.configuration = plugin_instance_in.configuration
 
     db_session.commit()
+    invalidate_active_instances()
     return plugin_instance
 
 
@@ -168,3 +236,4 @@ def delete_instance(*, db_session, plugin_instance_id: int):
     """Deletes a plugin instance."""
     db_session.query(PluginInstance).filter(PluginInstance.id == plugin_instance_id).delete()
     db_session.commit()
+    invalidate_active_instances()
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.auth.permissions import SensitiveProjectActionPermission, PermissionsDependency
 from dispatch.models import PrimaryKey
 
@@ -11,6 +15,7 @@ from .models import (
     PluginInstanceUpdate,
     PluginInstancePagination,
     PluginPagination,
+    PluginRead,
 )
 from .service import get_instance, update_instance, create_instance, delete_instance
 
@@ -24,6 +29,9 @@ def get_plugins(common: CommonParameters):
     return search_filter_sort_paginate(model="Plugin", **common)
 
 
+add_export_route(router, model="Plugin", item_model=PluginRead)
+
+
 @router.get(
     "/instances",
     response_model=PluginInstancePagination,
@@ -34,6 +42,15 @@ def get_plugin_instances(common: CommonParameters):
     return search_filter_sort_paginate(model="PluginInstance", **common)
 
 
+add_export_route(
+    router,
+    path="/instances/export",
+    model="PluginInstance",
+    item_model=PluginInstanceRead,
+    dependencies=[Depends(PermissionsDependency([SensitiveProjectActionPermission]))],
+)
+
+
 @router.get(
     "/instances/{plugin_instance_id}",
     response_model=PluginInstanceRead,
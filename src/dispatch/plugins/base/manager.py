@@ -6,40 +6,101 @@
 .. moduleauthor:: Kevin Glisson (kglisson@netflix.com)
 """
 import logging
+import threading
+from typing import Any, Dict, List, NamedTuple, Tuple
+
 from dispatch.common.managers import InstanceManager
 
 
 logger = logging.getLogger(__name__)
 
 
+class PluginIndex(NamedTuple):
+    source: List[Any]
+    ordered: Tuple[Any, ...]
+    by_slug: Dict[str, Any]
+    by_type: Dict[str, Tuple[Any, ...]]
+
+
 # inspired by https://github.com/getsentry/sentry
 class PluginManager(InstanceManager):
+    def __init__(self, class_list=None, instances=True):
+        self._index = None
+        self._index_lock = threading.Lock()
+        super(PluginManager, self).__init__(class_list=class_list, instances=instances)
+
     def __iter__(self):
         return iter(self.all())
 
     def __len__(self):
         return sum(1 for i in self.all())
 
+    def get_index(self) -> PluginIndex:
+        """Returns the plugin index, rebuilt whenever the registered plugins change."""
+        source = super(PluginManager, self).all()
+        index = self._index
+        if index is not None and index.source is source:
+            return index
+
+        with self._index_lock:
+            ordered = tuple(sorted(source, key=lambda x: x.get_title()))
+
+            by_slug = {}
+            # version 1 plugins take precedence over version 2 plugins with the same slug
+            for version in (1, 2):
+                for plugin in ordered:
+                    if plugin.__version__ == version:
+                        by_slug.setdefault(plugin.slug, plugin)
+
+            by_type = {}
+            for plugin in ordered:
+                by_type.setdefault(getattr(plugin, "type", None), []).append(plugin)
+
+            self._index = PluginIndex(
+                source=source,
+                ordered=ordered,
+                by_slug=by_slug,
+                by_type={k: tuple(v) for k, v in by_type.items()},
+            )
+            return self._index
+
     def all(self, version=1, plugin_type=None):
-        for plugin in sorted(super(PluginManager, self).all(), key=lambda x: x.get_title()):
-            if not plugin.type == plugin_type and plugin_type:
-                continue
+        index = self.get_index()
+        plugins = index.by_type.get(plugin_type, ()) if plugin_type else index.ordered
+        for plugin in plugins:
             if version is not None and plugin.__version__ != version:
                 continue
             yield plugin
 
     def get(self, slug):
-        for plugin in self.all(version=1):
-            if plugin.slug == slug:
-                return plugin
-        for plugin in self.all(version=2):
-            if plugin.slug == slug:
-                return plugin
+        plugin = self.get_index().by_slug.get(slug)
+        if plugin is not None:
+            return plugin
+
         logger.error(
-            f"Unable to find slug: {slug} in self.all version 1: {self.all(version=1)} or version 2: {self.all(version=2)}"
+            f"Unable to find slug: {slug} in registered plugins: {list(self.get_index().by_slug)}"
         )
         raise KeyError(slug)
 
+    def configure(self, slug, configuration=None, project_id=None):
+        """Returns a new plugin object bound to the given configuration and project.
+
+        Plugins are thread locals, so the configuration is set as class attributes of
+        a subclass to make it visible to every thread, the registered plugin is left untouched.
+        """
+        cls = type(self.get(slug))
+        configured_cls = type(
+            cls.__name__,
+            (cls,),
+            {
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+                "configuration": configuration,
+                "project_id": project_id,
+            },
+        )
+        return configured_cls()
+
     def first(self, func_name, *args, **kwargs):
         version = kwargs.pop("version", 1)
         for plugin in self.all(version=version):
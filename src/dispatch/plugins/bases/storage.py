@@ -14,6 +14,9 @@ class StoragePlugin(Plugin):
     def get(self, **kwargs):
         raise NotImplementedError
 
+    def get_modified_times(self, file_ids, **kwargs):
+        raise NotImplementedError
+
     def create(self, items, **kwargs):
         raise NotImplementedError
 
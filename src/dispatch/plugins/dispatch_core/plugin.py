@@ -5,10 +5,15 @@
     :license: Apache, see LICENSE for more details.
 """
 import base64
+import hashlib
 import json
 import logging
+import threading
+import time
+from typing import Optional
 
 import requests
+from cachetools import TLRUCache
 from fastapi import HTTPException
 from fastapi.security.utils import get_authorization_scheme_param
 from jose import JWTError, jwt
@@ -20,6 +25,8 @@ from dispatch.case import service as case_service
 from dispatch.config import (
     DISPATCH_AUTHENTICATION_PROVIDER_HEADER_NAME,
     DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS,
+    DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS_REFRESH_INTERVAL,
+    DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS_TTL,
     DISPATCH_JWT_AUDIENCE,
     DISPATCH_JWT_EMAIL_OVERRIDE,
     DISPATCH_JWT_SECRET,
@@ -79,6 +86,107 @@ class BasicAuthProviderPlugin(AuthenticationProviderPlugin):
         return data["email"]
 
 
+# minimum number of seconds between key set refreshes triggered by unknown key ids
+JWKS_MIN_REFRESH_INTERVAL = 30
+
+# verified tokens are cached until they expire, but no longer than this number of seconds
+VERIFIED_TOKEN_CACHE_TTL = 300
+VERIFIED_TOKEN_CACHE_SIZE = 4096
+
+
+class JWKSCache:
+    """Caches a JSON Web Key Set by key id.
+
+    The key set is fetched when it's older than `ttl` seconds, or when a token
+    references an unknown key id (at most every `min_refresh_interval` seconds),
+    to pick up key rotations. If a refresh fails, the current keys are kept.
+    """
+
+    def __init__(self, url: str, ttl: int, min_refresh_interval: int = JWKS_MIN_REFRESH_INTERVAL):
+        self.url = url
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self._keys = {}
+        self._fetched_at = None
+        self._attempted_at = None
+        self._lock = threading.Lock()
+        self._refresher = None
+
+    def _refresh(self):
+        self._attempted_at = time.monotonic()
+        try:
+            keys = requests.get(self.url, timeout=10).json()["keys"]
+        except Exception as e:
+            log.warning(f"Unable to fetch JWKS from {self.url}. Reason: {e}")
+            return
+
+        self._keys = {key["kid"]: key for key in keys}
+        self._fetched_at = self._attempted_at
+
+    def get(self, kid: str) -> Optional[dict]:
+        """Returns the key with the given id, refreshing the key set if needed."""
+        key = self._keys.get(kid)
+        now = time.monotonic()
+        if key and self._fetched_at is not None and now - self._fetched_at < self.ttl:
+            return key
+
+        with self._lock:
+            expired = self._fetched_at is None or now - self._fetched_at >= self.ttl
+            unknown = kid not in self._keys
+            throttled = (
+                self._attempted_at is not None
+                and now - self._attempted_at < self.min_refresh_interval
+            )
+            if (expired or unknown) and not throttled:
+                self._refresh()
+            return self._keys.get(kid)
+
+    def start_refresher(self, interval: int):
+        """Refreshes the key set in a daemon thread every `interval` seconds."""
+        if self._refresher:
+            return
+
+        def refresh():
+            while True:
+                with self._lock:
+                    self._refresh()
+                time.sleep(interval)
+
+        self._refresher = threading.Thread(target=refresh, name="jwks-refresher", daemon=True)
+        self._refresher.start()
+
+
+_jwks_cache = None
+_jwks_cache_lock = threading.Lock()
+
+
+def get_jwks_cache() -> JWKSCache:
+    """Returns the process wide key set cache for the configured JWKS url."""
+    global _jwks_cache
+    if _jwks_cache is None:
+        with _jwks_cache_lock:
+            if _jwks_cache is None:
+                _jwks_cache = JWKSCache(
+                    DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS,
+                    ttl=DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS_TTL,
+                )
+                if DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS_REFRESH_INTERVAL:
+                    _jwks_cache.start_refresher(
+                        DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS_REFRESH_INTERVAL
+                    )
+    return _jwks_cache
+
+
+def _verified_token_ttu(_key, data, now):
+    """Expires cached tokens with the token itself, converting `exp` to the cache's clock."""
+    return now + min(data["exp"] - time.time(), VERIFIED_TOKEN_CACHE_TTL)
+
+
+# maps the hash of a verified token to its claims
+_verified_tokens = TLRUCache(maxsize=VERIFIED_TOKEN_CACHE_SIZE, ttu=_verified_token_ttu)
+_verified_tokens_lock = threading.Lock()
+
+
 class PKCEAuthProviderPlugin(AuthenticationProviderPlugin):
     title = "Dispatch Plugin - PKCE Authentication Provider"
     slug = "dispatch-auth-provider-pkce"
@@ -101,28 +209,44 @@ class PKCEAuthProviderPlugin(AuthenticationProviderPlugin):
             raise credentials_exception
 
         token = authorization.split()[1]
+        token_hash = hashlib.sha256(token.encode("utf-8")).hexdigest()
 
-        # Parse out the Key information. Add padding just in case
-        key_info = json.loads(base64.b64decode(token.split(".")[0] + "=========").decode("utf-8"))
+        with _verified_tokens_lock:
+            data = _verified_tokens.get(token_hash)
 
-        # Grab all possible keys to account for key rotation and find the right key
-        keys = requests.get(DISPATCH_AUTHENTICATION_PROVIDER_PKCE_JWKS).json()["keys"]
-        for potential_key in keys:
-            if potential_key["kid"] == key_info["kid"]:
-                key = potential_key
-
-        try:
-            jwt_opts = {}
-            if DISPATCH_PKCE_DONT_VERIFY_AT_HASH:
-                jwt_opts = {"verify_at_hash": False}
-            # If DISPATCH_JWT_AUDIENCE is defined, the we must include audience in the decode
-            if DISPATCH_JWT_AUDIENCE:
-                data = jwt.decode(token, key, audience=DISPATCH_JWT_AUDIENCE, options=jwt_opts)
-            else:
-                data = jwt.decode(token, key, options=jwt_opts)
-        except JWTError as err:
-            log.debug("JWT Decode error: {}".format(err))
-            raise credentials_exception
+        if data is None:
+            try:
+                # Parse out the Key information. Add padding just in case
+                key_info = json.loads(
+                    base64.b64decode(token.split(".")[0] + "=========").decode("utf-8")
+                )
+            except ValueError as err:
+                log.debug("JWT header decode error: {}".format(err))
+                raise credentials_exception from None
+
+            # Keys are cached by id, unknown ids refresh the key set to account for key rotation
+            key = get_jwks_cache().get(key_info.get("kid"))
+            if not key:
+                log.debug("No JWKS key found for key id: {}".format(key_info.get("kid")))
+                raise credentials_exception
+
+            try:
+                jwt_opts = {}
+                if DISPATCH_PKCE_DONT_VERIFY_AT_HASH:
+                    jwt_opts = {"verify_at_hash": False}
+                # If DISPATCH_JWT_AUDIENCE is defined, the we must include audience in the decode
+                if DISPATCH_JWT_AUDIENCE:
+                    data = jwt.decode(token, key, audience=DISPATCH_JWT_AUDIENCE, options=jwt_opts)
+                else:
+                    data = jwt.decode(token, key, options=jwt_opts)
+            except JWTError as err:
+                log.debug("JWT Decode error: {}".format(err))
+                raise credentials_exception
+
+            # only tokens that expire are cached, and never beyond their expiration
+            if isinstance(data.get("exp"), (int, float)) and data["exp"] > time.time():
+                with _verified_tokens_lock:
+                    _verified_tokens[token_hash] = data
 
         # Support overriding where email is returned in the id token
         if DISPATCH_JWT_EMAIL_OVERRIDE:
@@ -1,7 +1,10 @@
+import hashlib
 import json
 import socket
-import tempfile
+import threading
+from typing import Optional
 
+from cachetools import LRUCache
 from google.oauth2 import service_account
 import googleapiclient.discovery
 
@@ -11,10 +14,22 @@ TIMEOUT = 300
 
 socket.setdefaulttimeout(TIMEOUT)
 
+# maximum number of delegated credentials kept, shared by all threads
+CREDENTIALS_CACHE_SIZE = 64
 
-def get_service(config: GoogleConfiguration, service_name: str, version: str, scopes: list):
+# maximum number of clients kept per thread
+SERVICE_CACHE_SIZE = 32
+
+_credentials_cache = LRUCache(maxsize=CREDENTIALS_CACHE_SIZE)
+_credentials_lock = threading.Lock()
+
+# clients wrap an httplib2 connection which isn't thread-safe, so each thread builds its own
+_services = threading.local()
+
+
+def get_service_account_info(config: GoogleConfiguration) -> dict:
     """Formats specified credentials for Google clients."""
-    data = {
+    return {
         "type": "service_account",
         "project_id": config.service_account_project_id,
         "private_key_id": config.service_account_private_key_id,
@@ -24,20 +39,54 @@ def get_service(config: GoogleConfiguration, service_name: str, version: str, sc
         "token_uri": "https://oauth2.googleapis.com/token",
     }
 
-    with tempfile.NamedTemporaryFile() as service_account_file:
-        service_account_file.write(json.dumps(data).encode())
-        service_account_file.seek(0)
 
-        credentials = service_account.Credentials.from_service_account_file(
-            service_account_file.name, scopes=scopes
-        )
+def get_config_hash(config: GoogleConfiguration) -> str:
+    """Returns a digest of the values used to build credentials and clients."""
+    data = get_service_account_info(config)
+    data.update(
+        {
+            "delegated_account": config.service_account_delegated_account,
+            "developer_key": config.developer_key.get_secret_value(),
+        }
+    )
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
 
-        delegated_credentials = credentials.with_subject(config.service_account_delegated_account)
+def get_delegated_credentials(
+    config: GoogleConfiguration, scopes: list, config_hash: Optional[str] = None
+):
+    """Returns delegated credentials, shared so their access token is reused until it expires."""
+    key = (config_hash or get_config_hash(config), tuple(sorted(scopes)))
 
-        return googleapiclient.discovery.build(
+    with _credentials_lock:
+        credentials = _credentials_cache.get(key)
+        if credentials is None:
+            credentials = service_account.Credentials.from_service_account_info(
+                get_service_account_info(config), scopes=scopes
+            ).with_subject(config.service_account_delegated_account)
+            _credentials_cache[key] = credentials
+
+    return credentials
+
+
+def get_service(config: GoogleConfiguration, service_name: str, version: str, scopes: list):
+    """Returns a client for the given Google service, cached per thread."""
+    config_hash = get_config_hash(config)
+    key = (config_hash, service_name, version, tuple(sorted(scopes)))
+
+    services = getattr(_services, "cache", None)
+    if services is None:
+        services = _services.cache = LRUCache(maxsize=SERVICE_CACHE_SIZE)
+
+    service = services.get(key)
+    if service is None:
+        service = googleapiclient.discovery.build(
             service_name,
             version,
-            credentials=delegated_credentials,
+            credentials=get_delegated_credentials(config, scopes, config_hash),
             cache_discovery=False,
             developerKey=config.developer_key.get_secret_value(),
         )
+        services[key] = service
+
+    return service
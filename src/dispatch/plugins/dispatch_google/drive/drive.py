@@ -9,7 +9,7 @@ import functools
 import io
 import json
 import logging
-from typing import Any, List
+from typing import Any, Dict, List
 from datetime import datetime, timedelta, timezone
 
 from googleapiclient.errors import HttpError
@@ -22,6 +22,9 @@ from dispatch.enums import DispatchEnum
 
 log = logging.getLogger(__name__)
 
+# maximum number of calls in a single batch request
+BATCH_REQUEST_SIZE = 100
+
 
 class UserTypes(DispatchEnum):
     user = "user"
@@ -141,6 +144,34 @@ def get_file(client: Any, file_id: str):
     )
 
 
+def get_modified_times(client: Any, file_ids: List[str]) -> Dict[str, str]:
+    """Gets the time files were last modified, in RFC 3339 format, with batch requests.
+
+    Files whose metadata can't be fetched are left out.
+    """
+    modified_times = {}
+
+    def callback(request_id, response, exception):
+        if exception:
+            log.warning(
+                f"Unable to fetch modification time of file {request_id}. Reason: {exception}"
+            )
+            return
+        modified_times[request_id] = response["modifiedTime"]
+
+    file_ids = list(dict.fromkeys(file_ids))
+    for start in range(0, len(file_ids), BATCH_REQUEST_SIZE):
+        batch = client.new_batch_http_request(callback=callback)
+        for file_id in file_ids[start : start + BATCH_REQUEST_SIZE]:  # noqa
+            batch.add(
+                client.files().get(fileId=file_id, fields="modifiedTime", supportsAllDrives=True),
+                request_id=file_id,
+            )
+        batch.execute()
+
+    return modified_times
+
+
 @paginated("activities")
 def get_activity(
     client: Any, file_id: str, activity: Activity = Activity.comment, lookback: int = 60
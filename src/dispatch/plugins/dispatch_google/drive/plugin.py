@@ -17,6 +17,7 @@ from .drive import (
     create_file,
     delete_file,
     download_google_document,
+    get_modified_times,
     list_files,
     mark_as_readonly,
     move_file,
@@ -66,6 +67,11 @@ class GoogleDriveStoragePlugin(StoragePlugin):
         client = get_service(self.configuration, "drive", "v3", self.scopes)
         return download_google_document(client, file_id, mime_type=mime_type)
 
+    def get_modified_times(self, file_ids: List[str]):
+        """Fetches the time the documents were last modified."""
+        client = get_service(self.configuration, "drive", "v3", self.scopes)
+        return get_modified_times(client, file_ids)
+
     def add_participant(
         self,
         team_drive_or_file_id: str,
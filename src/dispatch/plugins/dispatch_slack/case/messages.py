@@ -214,22 +214,26 @@ def create_signal_messages(case_id: int, channel_id: str, db_session: Session) -
         )
         return Message(blocks=signal_metadata_blocks).build()["blocks"]
 
-    entity_groups = defaultdict(list)
-    processed_entities = set()
-
+    # we keep the first entity of each value, the case counts of all of them are fetched at once
+    entities = {}
     for entity_id, entity_value, entity_type_name in entities_query:
-        if entity_value not in processed_entities:
-            processed_entities.add(entity_value)
-            # Fetch the count of related cases with entities in the past 14 days
-            entity_case_counts = entity_service.get_case_count_with_entity(
-                db_session=db_session, entity_id=entity_id, days_back=14
-            )
-            entity_groups[entity_type_name].append(
-                EntityGroup(
-                    value=entity_value,
-                    related_case_count=entity_case_counts,
-                )
+        entities.setdefault(entity_value, (entity_id, entity_type_name))
+
+    # Fetch the count of related cases with entities in the past 14 days
+    entity_case_counts = entity_service.get_case_counts_with_entities(
+        db_session=db_session,
+        entity_ids=[entity_id for entity_id, _ in entities.values()],
+        days_back=14,
+    )
+
+    entity_groups = defaultdict(list)
+    for entity_value, (entity_id, entity_type_name) in entities.items():
+        entity_groups[entity_type_name].append(
+            EntityGroup(
+                value=entity_value,
+                related_case_count=entity_case_counts[entity_id],
             )
+        )
 
     for k, v in entity_groups.items():
         if v:
@@ -41,7 +41,7 @@ from dispatch.individual import service as individual_service
 from dispatch.individual.models import IndividualContactRead
 from dispatch.monitor import service as monitor_service
 from dispatch.monitor.models import MonitorCreate
-from dispatch.nlp import build_phrase_matcher, build_term_vocab, extract_terms_from_text
+from dispatch.nlp import extract_terms_from_text, get_phrase_matcher
 from dispatch.participant import service as participant_service
 from dispatch.participant.models import ParticipantUpdate
 from dispatch.participant_role import service as participant_role_service
@@ -817,8 +817,7 @@ def handle_message_tagging(
     incident = incident_service.get(db_session=db_session, incident_id=context["subject"].id)
     tags = tag_service.get_all(db_session=db_session, project_id=incident.project.id).all()
     tag_strings = [t.name.lower() for t in tags if t.discoverable]
-    phrases = build_term_vocab(tag_strings)
-    matcher = build_phrase_matcher("dispatch-tag", phrases)
+    _, matcher = get_phrase_matcher("dispatch-tag", tag_strings)
     extracted_tags = list(set(extract_terms_from_text(text, matcher)))
 
     matched_tags = (
@@ -9,7 +9,11 @@ from dispatch.auth.permissions import (
 )
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.exceptions import ExistsError
 from dispatch.models import OrganizationSlug, PrimaryKey
 
@@ -32,6 +36,9 @@ def get_projects(common: CommonParameters):
     return search_filter_sort_paginate(model="Project", **common)
 
 
+add_export_route(router, model="Project", item_model=ProjectRead)
+
+
 @router.post(
     "",
     response_model=ProjectRead,
@@ -22,24 +22,22 @@ def get_resource_matches(
         .all()
     )
 
+    # all filters are evaluated at once
+    matched_filter_ids = search_filter_service.match_filters(
+        db_session=db_session,
+        search_filters=[f for resource in resources for f in resource.filters],
+        class_instance=class_instance,
+    )
+
     matched_resources = []
     for resource in resources:
-        for f in resource.filters:
-            match = search_filter_service.match(
-                db_session=db_session,
-                subject=f.subject,
-                filter_spec=f.expression,
-                class_instance=class_instance,
-            )
-
-            if match:
-                matched_resources.append(
-                    RecommendationMatch(
-                        resource_state=json.loads(model_state(**resource.__dict__).json()),
-                        resource_type=model_cls.__name__,
-                    )
+        if any(f.id in matched_filter_ids for f in resource.filters):
+            matched_resources.append(
+                RecommendationMatch(
+                    resource_state=json.loads(model_state(**resource.__dict__).json()),
+                    resource_type=model_cls.__name__,
                 )
-                break
+            )
 
     return matched_resources
 
@@ -1,5 +1,7 @@
-from typing import List, Optional
+import logging
+from typing import List, Optional, Set
 
+from sqlalchemy import literal
 from sqlalchemy_filters import apply_filters
 
 from dispatch.database.core import Base, get_class_by_tablename, get_table_name_by_class_instance
@@ -8,6 +10,11 @@ from dispatch.project import service as project_service
 
 from .models import SearchFilter, SearchFilterCreate, SearchFilterUpdate
 
+log = logging.getLogger(__name__)
+
+# maximum number of filters evaluated by a single query
+MATCH_BATCH_SIZE = 100
+
 
 def get(*, db_session, search_filter_id: int) -> Optional[SearchFilter]:
     """Gets a search filter by id."""
@@ -40,6 +47,45 @@ def match(*, db_session, subject: str, filter_spec: List[dict], class_instance:
     return query.filter(model_cls.id == class_instance.id).one_or_none()
 
 
+def match_filters(
+    *, db_session, search_filters: List[SearchFilter], class_instance: Base
+) -> Set[int]:
+    """Returns the ids of the search filters matching a class instance.
+
+    Each filter becomes a branch of a UNION ALL selecting its id, so all filters
+    are evaluated in a single round trip instead of one query per filter. Filters
+    for other subjects never match, invalid filters are logged and skipped.
+    """
+    table_name = get_table_name_by_class_instance(class_instance)
+    model_cls = get_class_by_tablename(table_name)
+
+    queries = []
+    for search_filter in {f.id: f for f in search_filters}.values():
+        # this filter doesn't apply to the current class_instance
+        if search_filter.subject != table_name:
+            continue
+
+        try:
+            query = db_session.query(model_cls)
+            query = apply_filter_specific_joins(model_cls, search_filter.expression, query)
+            query = apply_filters(query, search_filter.expression)
+        except Exception as e:
+            log.warning(f"Unable to evaluate search filter {search_filter.id}. Reason: {e}")
+            continue
+
+        queries.append(
+            query.filter(model_cls.id == class_instance.id).with_entities(
+                literal(search_filter.id).label("search_filter_id")
+            )
+        )
+
+    matches = set()
+    for i in range(0, len(queries), MATCH_BATCH_SIZE):
+        first, *rest = queries[i : i + MATCH_BATCH_SIZE]
+        matches.update(search_filter_id for (search_filter_id,) in first.union_all(*rest))
+    return matches
+
+
 def get_or_create(*, db_session, search_filter_in) -> SearchFilter:
     if search_filter_in.id:
         q = db_session.query(SearchFilter).filter(SearchFilter.id == search_filter_in.id)
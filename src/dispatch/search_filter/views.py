@@ -6,7 +6,11 @@ from sqlalchemy.exc import IntegrityError
 from dispatch.auth.permissions import SensitiveProjectActionPermission, PermissionsDependency
 from dispatch.auth.service import CurrentUser
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.exceptions import ExistsError
 from dispatch.models import PrimaryKey
 
@@ -28,6 +32,9 @@ def get_filters(common: CommonParameters):
     return search_filter_sort_paginate(model="SearchFilter", **common)
 
 
+add_export_route(router, model="SearchFilter", item_model=SearchFilterRead)
+
+
 @router.post("", response_model=SearchFilterRead)
 def create_search_filter(
     db_session: DbSession,
@@ -4,7 +4,11 @@ from pydantic.error_wrappers import ErrorWrapper, ValidationError
 from sqlalchemy.exc import IntegrityError
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.exceptions import ExistsError
 from dispatch.models import PrimaryKey
 
@@ -21,6 +25,9 @@ def get_services(common: CommonParameters):
     return search_filter_sort_paginate(model="Service", **common)
 
 
+add_export_route(router, model="Service", item_model=ServiceRead)
+
+
 @router.post("", response_model=ServiceRead)
 def create_service(
     db_session: DbSession,
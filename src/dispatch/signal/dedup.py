@@ -0,0 +1,315 @@
+"""
+.. module: dispatch.signal.dedup
+    :platform: Unix
+    :copyright: (c) 2022 by Netflix Inc., see AUTHORS for more
+    :license: Apache, see LICENSE for more details.
+"""
+import logging
+import threading
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Set
+
+from cachetools import TLRUCache
+from sqlalchemy import asc
+from sqlalchemy.orm import Session
+
+from dispatch.case.models import Case
+from dispatch.database.core import get_session_schema_name
+from dispatch.entity.models import Entity
+from dispatch.metrics import provider as metrics_provider
+
+from .models import Signal, SignalFilterAction, SignalFilterMode, SignalInstance
+
+log = logging.getLogger(__name__)
+
+# maximum number of (signal, entity) keys held by the index
+SIGNAL_DEDUP_INDEX_SIZE = 100_000
+
+# lookback of the default deduplication rule, in minutes
+DEFAULT_DEDUP_WINDOW = 60
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def get_retention(signal: Signal) -> timedelta:
+    """Returns how long instances of a signal are relevant for deduplication."""
+    windows = [
+        f.window
+        for f in signal.filters
+        if f.action == SignalFilterAction.deduplicate
+        and f.mode == SignalFilterMode.active
+        and f.window
+    ]
+    return timedelta(minutes=max(windows + [DEFAULT_DEDUP_WINDOW]))
+
+
+class _Run:
+    """Consecutive instances that were associated with the same case."""
+
+    __slots__ = ("first_seen", "last_seen", "case_id")
+
+    def __init__(self, first_seen: datetime, last_seen: datetime, case_id: int):
+        self.first_seen = first_seen
+        self.last_seen = last_seen
+        self.case_id = case_id
+
+
+class _Entry:
+    __slots__ = ("runs", "retention")
+
+    def __init__(self, retention: timedelta):
+        self.runs = deque()
+        self.retention = retention
+
+    def add(self, created_at: datetime, case_id: int):
+        if self.runs and self.runs[-1].case_id == case_id:
+            run = self.runs[-1]
+            run.first_seen = min(run.first_seen, created_at)
+            run.last_seen = max(run.last_seen, created_at)
+        else:
+            self.runs.append(_Run(created_at, created_at, case_id))
+
+    def prune(self, now: datetime):
+        expired_before = now - self.retention
+        while self.runs and self.runs[0].last_seen < expired_before:
+            self.runs.popleft()
+
+    def earliest(self, since: datetime) -> Optional[_Run]:
+        for run in self.runs:
+            if run.last_seen >= since:
+                return run
+
+    def latest(self, since: datetime) -> Optional[_Run]:
+        if self.runs and self.runs[-1].last_seen >= since:
+            return self.runs[-1]
+
+
+class SignalDedupIndex:
+    """In-process index of recently processed signal instances.
+
+    Maps (schema, signal id, entity id) to the runs of cases recent instances
+    were associated with, and (schema, signal id) to all recent instances for the
+    default deduplication rule. Entries expire after the widest deduplication
+    window of their signal. The index is warmed from the database at startup,
+    signals created afterwards are warmed the first time they're looked up.
+
+    Cases deleted in this process are discarded right away, `reconcile` drops the
+    cases deleted by other processes periodically. A miss is not authoritative,
+    as instances may be processed by other processes, callers fall back to the
+    database.
+    """
+
+    def __init__(self, maxsize: int = SIGNAL_DEDUP_INDEX_SIZE):
+        self._entries = TLRUCache(
+            maxsize=maxsize,
+            ttu=lambda _key, entry, now: now + entry.retention.total_seconds(),
+        )
+        self._warmed = set()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def _add(
+        self,
+        schema: Optional[str],
+        signal_id: int,
+        created_at: datetime,
+        case_id: int,
+        entity_ids: Iterable[int],
+        retention: timedelta,
+    ):
+        created_at = _as_utc(created_at)
+        for key in [(schema, signal_id, None)] + [(schema, signal_id, i) for i in entity_ids]:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry(retention)
+            entry.retention = retention
+            entry.add(created_at, case_id)
+            # re-inserting refreshes the entry's expiration
+            self._entries[key] = entry
+
+    def _warm(self, *, db_session: Session, schema: Optional[str], signal: Signal):
+        with self._lock:
+            if (schema, signal.id) in self._warmed:
+                return
+
+        # the query runs without the lock, so lookups of other signals aren't held up
+        retention = get_retention(signal)
+        since = datetime.now(timezone.utc) - retention
+        rows = (
+            db_session.query(
+                SignalInstance.id, SignalInstance.created_at, SignalInstance.case_id, Entity.id
+            )
+            .outerjoin(SignalInstance.entities)
+            .filter(
+                SignalInstance.signal_id == signal.id,
+                SignalInstance.created_at >= since,
+                SignalInstance.case_id.isnot(None),  # noqa
+            )
+            .order_by(asc(SignalInstance.created_at), asc(SignalInstance.id))
+            .all()
+        )
+
+        instances: Dict[str, List] = {}
+        for instance_id, created_at, case_id, entity_id in rows:
+            instance = instances.setdefault(instance_id, [created_at, case_id, []])
+            if entity_id:
+                instance[2].append(entity_id)
+
+        with self._lock:
+            # another thread may have warmed the signal in the meantime
+            if (schema, signal.id) in self._warmed:
+                return
+
+            for created_at, case_id, entity_ids in instances.values():
+                self._add(schema, signal.id, created_at, case_id, entity_ids, retention)
+            self._warmed.add((schema, signal.id))
+
+        log.debug(
+            f"Warmed signal dedup index for signal {signal.id} with {len(instances)} instances."
+        )
+
+    def warm(self, *, db_session: Session):
+        """Loads the recent instances of all signals of the session's organization."""
+        schema = get_session_schema_name(db_session)
+        for signal in db_session.query(Signal).all():
+            self._warm(db_session=db_session, schema=schema, signal=signal)
+
+    def _lookup(self, keys: List[tuple], since: datetime, latest: bool) -> Optional[int]:
+        now = datetime.now(timezone.utc)
+        found = None
+        for key in keys:
+            entry = self._entries.get(key)
+            if entry is None:
+                continue
+
+            entry.prune(now)
+            run = entry.latest(since) if latest else entry.earliest(since)
+            if run is None:
+                continue
+
+            if found is None or (
+                run.last_seen > found.last_seen
+                if latest
+                else max(run.first_seen, since) < max(found.first_seen, since)
+            ):
+                found = run
+
+        if found:
+            self.hits += 1
+            metrics_provider.counter("signal.dedup_index.hit")
+            return found.case_id
+
+        self.misses += 1
+        metrics_provider.counter("signal.dedup_index.miss")
+
+    def get_earliest_case_id(
+        self, *, db_session: Session, signal: Signal, entity_ids: Iterable[int], since: datetime
+    ) -> Optional[int]:
+        """Returns the case of the earliest instance since `since` sharing one of the entities."""
+        schema = get_session_schema_name(db_session)
+        self._warm(db_session=db_session, schema=schema, signal=signal)
+        with self._lock:
+            keys = [(schema, signal.id, entity_id) for entity_id in entity_ids]
+            return self._lookup(keys, _as_utc(since), latest=False)
+
+    def get_latest_case_id(
+        self, *, db_session: Session, signal: Signal, since: datetime
+    ) -> Optional[int]:
+        """Returns the case of the latest instance of the signal since the given time."""
+        schema = get_session_schema_name(db_session)
+        self._warm(db_session=db_session, schema=schema, signal=signal)
+        with self._lock:
+            return self._lookup([(schema, signal.id, None)], _as_utc(since), latest=True)
+
+    def add(self, *, db_session: Session, signal_instance: SignalInstance):
+        """Records a processed signal instance, instances without a case are ignored."""
+        if not signal_instance.case_id or not signal_instance.created_at:
+            return
+
+        schema = get_session_schema_name(db_session)
+        with self._lock:
+            # signals that aren't warmed yet load the instance from the database instead
+            if (schema, signal_instance.signal_id) not in self._warmed:
+                return
+
+            self._add(
+                schema,
+                signal_instance.signal_id,
+                signal_instance.created_at,
+                signal_instance.case_id,
+                [e.id for e in signal_instance.entities],
+                get_retention(signal_instance.signal),
+            )
+
+    def _discard_cases(self, schema: Optional[str], case_ids: Set[int]) -> int:
+        discarded = 0
+        for key, entry in list(self._entries.items()):
+            if key[0] != schema:
+                continue
+            runs = len(entry.runs)
+            entry.runs = deque(run for run in entry.runs if run.case_id not in case_ids)
+            discarded += runs - len(entry.runs)
+        return discarded
+
+    def discard_case(self, *, db_session: Session, case_id: int):
+        """Removes all references to a case, e.g. when it's deleted."""
+        schema = get_session_schema_name(db_session)
+        with self._lock:
+            self._discard_cases(schema, {case_id})
+
+    def reconcile(self, *, db_session: Session) -> int:
+        """Removes the cases of the session's organization that no longer exist.
+
+        Cases deleted by other processes aren't discarded as they're deleted, this
+        is meant to be run periodically. Returns the number of runs removed.
+        """
+        schema = get_session_schema_name(db_session)
+        with self._lock:
+            case_ids = {
+                run.case_id
+                for key, entry in self._entries.items()
+                if key[0] == schema
+                for run in entry.runs
+            }
+        if not case_ids:
+            return 0
+
+        existing_case_ids = {
+            case_id for case_id, in db_session.query(Case.id).filter(Case.id.in_(case_ids))
+        }
+        deleted_case_ids = case_ids - existing_case_ids
+        if not deleted_case_ids:
+            return 0
+
+        with self._lock:
+            discarded = self._discard_cases(schema, deleted_case_ids)
+
+        metrics_provider.counter("signal.dedup_index.discarded", value=discarded)
+        log.debug(f"Discarded {len(deleted_case_ids)} deleted cases from the signal dedup index.")
+        return discarded
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._warmed.clear()
+            self.hits = self.misses = 0
+
+    def statistics(self) -> dict:
+        """Returns the index size and hit rate."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+signal_dedup_index = SignalDedupIndex()
@@ -1,8 +1,12 @@
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 import logging
+import uuid
+from typing import Dict, List, Optional
+
 from cachetools import TTLCache
 
 from email_validator import validate_email, EmailNotValidError
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 
 from dispatch.auth.models import DispatchUser, UserRegister
@@ -16,6 +20,7 @@ from dispatch.plugin import service as plugin_service
 from dispatch.project.models import Project
 from dispatch.signal import service as signal_service
 from dispatch.signal import flows as signal_flows
+from dispatch.signal.dedup import signal_dedup_index
 from dispatch.signal.enums import SignalEngagementStatus
 from dispatch.signal.models import SignalInstance, SignalInstanceCreate, SignalFilterAction
 from dispatch.workflow import flows as workflow_flows
@@ -47,6 +52,9 @@ def signal_instance_create_flow(
         db_session=db_session,
         signal_instance=signal_instance,
     ):
+        signal_dedup_index.add(db_session=db_session, signal_instance=signal_instance)
+        entity_service.record_sightings(db_session=db_session, signal_instance=signal_instance)
+
         # If the signal was deduplicated, we can assume a case exists,
         # and we need to update the corresponding signal message
         if _should_update_signal_message(signal_instance):
@@ -81,6 +89,8 @@ def signal_instance_create_flow(
     signal_instance.case = case
 
     db_session.commit()
+    signal_dedup_index.add(db_session=db_session, signal_instance=signal_instance)
+    entity_service.record_sightings(db_session=db_session, signal_instance=signal_instance)
 
     service_id = None
     if signal_instance.signal.oncall_service:
@@ -118,6 +128,59 @@ def signal_instance_create_flow(
     return signal_instance
 
 
+def process_signal_instances(
+    *,
+    connection: Connection,
+    db_session: Session,
+    since: datetime,
+    batch_size: int,
+    exclude_signal_ids: List[int],
+    failed_instance_ids: Dict[uuid.UUID, datetime],
+) -> Optional[int]:
+    """Claims a signal with pending instances and runs the create flow of its oldest ones.
+
+    Returns the number of instances processed successfully, or None when there's no
+    signal left to claim. The claimed signal is added to `exclude_signal_ids`, and
+    instances whose flow fails are added to `failed_instance_ids` with the time they
+    failed at. Neither is handed out again while they're in these collections.
+    """
+    signal_id = signal_service.claim_signal_with_pending_instances(
+        connection=connection,
+        since=since,
+        exclude_signal_ids=exclude_signal_ids,
+        exclude_instance_ids=failed_instance_ids.keys(),
+    )
+    if not signal_id:
+        return None
+
+    exclude_signal_ids.append(signal_id)
+    signal_instance_ids = [
+        i.id
+        for i in signal_service.get_pending_instances(
+            db_session=db_session,
+            signal_id=signal_id,
+            since=since,
+            limit=batch_size,
+            exclude_instance_ids=failed_instance_ids.keys(),
+        )
+    ]
+
+    processed = 0
+    for signal_instance_id in signal_instance_ids:
+        try:
+            signal_instance_create_flow(
+                db_session=db_session, signal_instance_id=signal_instance_id
+            )
+        except Exception as e:
+            db_session.rollback()
+            failed_instance_ids[signal_instance_id] = datetime.now(timezone.utc)
+            log.warning(f"Unable to process signal instance {signal_instance_id}.")
+            log.exception(e)
+            continue
+        processed += 1
+    return processed
+
+
 def create_signal_instance(
     db_session: Session,
     project: Project,
@@ -384,6 +384,26 @@ class SignalInstanceRead(SignalInstanceBase):
     signal: SignalRead
 
 
+# maximum number of signal instances created in a single request
+SIGNAL_INSTANCE_BATCH_MAX_SIZE = 500
+
+
+class SignalInstanceBatchCreate(DispatchBase):
+    project: Optional[ProjectRead]
+    instances: List[dict[str, Any]] = Field([], max_items=SIGNAL_INSTANCE_BATCH_MAX_SIZE)
+
+
+class SignalInstanceBatchError(DispatchBase):
+    index: int
+    msg: str
+
+
+class SignalInstanceBatchRead(DispatchBase):
+    created: List[uuid.UUID] = []
+    errors: List[SignalInstanceBatchError] = []
+
+
 class SignalInstancePagination(DispatchBase):
     items: List[SignalInstanceRead]
     total: int
+    next: Optional[str] = None
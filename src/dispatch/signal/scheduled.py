@@ -5,17 +5,21 @@
     :license: Apache, see LICENSE for more details.
 """
 import logging
+from itertools import islice
 
 from schedule import every
 from dispatch.database.core import SessionLocal
 from dispatch.scheduler import scheduler
 from dispatch.project.models import Project
 from dispatch.plugin import service as plugin_service
-from dispatch.signal import flows as signal_flows
+from dispatch.signal import service as signal_service
 from dispatch.decorators import scheduled_project_task
 
 log = logging.getLogger(__name__)
 
+# number of consumed signal instances inserted per batch
+SIGNAL_CONSUME_BATCH_SIZE = 500
+
 
 # TODO do we want per signal source flexibility?
 @scheduler.add(every(1).minutes, name="signal-consume")
@@ -34,15 +38,21 @@ def consume_signals(db_session: SessionLocal, project: Project):
 
     for plugin in plugins:
         log.debug(f"Consuming signals. Signal Consumer: {plugin.plugin.slug}")
-        signal_instances = plugin.instance.consume()
-        for signal_instance_data in signal_instances:
-            log.info(f"Attempting to process the following signal: {signal_instance_data}")
+        signal_instances = iter(plugin.instance.consume())
+        while batch := list(islice(signal_instances, SIGNAL_CONSUME_BATCH_SIZE)):
+            log.info(f"Attempting to process a batch of {len(batch)} signals.")
             try:
-                signal_flows.create_signal_instance(
+                result = signal_service.create_instances(
                     db_session=db_session,
                     project=project,
-                    signal_instance_data=signal_instance_data,
+                    raw_instances=batch,
+                    external_id_key="id",
                 )
             except Exception as e:
-                log.debug(signal_instance_data)
+                db_session.rollback()
                 log.exception(e)
+                continue
+
+            for error in result.errors:
+                log.debug(batch[error.index])
+                log.warning(f"Failed to create signal instance: {error.msg}")
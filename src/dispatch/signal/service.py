@@ -1,24 +1,35 @@
 import json
+import uuid
+import zlib
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Iterable, List, Optional
 
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
-from sqlalchemy import desc, asc
-from sqlalchemy.orm import Session
+from sqlalchemy import asc, desc, func, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, selectinload
 
 from dispatch.auth.models import DispatchUser
 from dispatch.case.priority import service as case_priority_service
 from dispatch.case.type import service as case_type_service
 from dispatch.case.type.models import CaseType
-from dispatch.database.service import apply_filter_specific_joins, apply_filters
+from dispatch.database.service import (
+    apply_filter_specific_joins,
+    apply_filters,
+    compile_filter_predicate,
+    get_filter_spec_models,
+)
 from dispatch.entity_type import service as entity_type_service
 from dispatch.exceptions import NotFoundError
 from dispatch.project import service as project_service
+from dispatch.project.models import Project
 from dispatch.service import service as service_service
 from dispatch.tag import service as tag_service
 from dispatch.workflow import service as workflow_service
 from dispatch.entity.models import Entity
 
+from .dedup import signal_dedup_index
 from .models import (
     Signal,
     SignalCreate,
@@ -32,10 +43,16 @@ from .models import (
     SignalFilterRead,
     SignalFilterUpdate,
     SignalInstance,
+    SignalInstanceBatchError,
+    SignalInstanceBatchRead,
     SignalInstanceCreate,
     SignalUpdate,
 )
 
+# models of the rows filter expressions are evaluated against in memory, expressions
+# on any other model are joined and evaluated by the database
+SIGNAL_FILTER_ROW_MODELS = frozenset({"SignalInstance", "Entity", "EntityType"})
+
 
 def create_signal_engagement(
     *, db_session: Session, creator: DispatchUser, signal_engagement_in: SignalEngagementCreate
@@ -476,6 +493,267 @@ def create_instance(
     return signal_instance
 
 
+def create_instances(
+    *,
+    db_session: Session,
+    project: Project,
+    raw_instances: List[dict],
+    external_id_key: str = "externalId",
+) -> SignalInstanceBatchRead:
+    """Creates many signal instances with a single insert and commit.
+
+    Signal definitions are resolved once per batch by variant or external id
+    (read from `external_id_key`). Instances that can't be created are
+    reported by their index in the batch instead of failing the whole batch.
+    """
+    signals = db_session.query(Signal).filter(Signal.project_id == project.id).all()
+    signals_by_variant = {s.variant: s for s in signals if s.variant}
+    signals_by_external_id = {s.external_id: s for s in signals if s.external_id}
+
+    now = datetime.utcnow()
+    rows = {}
+    row_indexes = {}
+    errors = []
+    for index, raw in enumerate(raw_instances):
+        variant = raw.get("variant")
+        external_id = raw.get(external_id_key)
+
+        if not (external_id or variant):
+            errors.append(
+                SignalInstanceBatchError(
+                    index=index, msg="An externalId or variant must be provided."
+                )
+            )
+            continue
+
+        if variant:
+            signal = signals_by_variant.get(variant)
+        else:
+            signal = signals_by_external_id.get(external_id)
+
+        if not signal:
+            errors.append(
+                SignalInstanceBatchError(
+                    index=index,
+                    msg=f"No signal definition found. External Id: {external_id} Variant: {variant}",
+                )
+            )
+            continue
+
+        if not signal.enabled:
+            errors.append(
+                SignalInstanceBatchError(
+                    index=index, msg=f"Signal definition not enabled. Signal Name: {signal.name}"
+                )
+            )
+            continue
+
+        # if the signal has an existing uuid we propgate it as our primary key
+        try:
+            instance_id = uuid.UUID(str(raw["id"])) if raw.get("id") else uuid.uuid4()
+        except ValueError:
+            errors.append(
+                SignalInstanceBatchError(
+                    index=index, msg=f"Invalid signal instance id: {raw['id']}"
+                )
+            )
+            continue
+
+        if instance_id in rows:
+            errors.append(
+                SignalInstanceBatchError(
+                    index=index, msg=f"Duplicate signal instance id: {instance_id}"
+                )
+            )
+            continue
+
+        row_indexes[instance_id] = index
+        rows[instance_id] = {
+            "id": instance_id,
+            "raw": raw,
+            "signal_id": signal.id,
+            "project_id": project.id,
+            "created_at": now,
+            "updated_at": now,
+        }
+
+    created = []
+    if rows:
+        statement = (
+            insert(SignalInstance.__table__)
+            .values(list(rows.values()))
+            .on_conflict_do_nothing(index_elements=["id"])
+            .returning(SignalInstance.__table__.c.id)
+        )
+        created = [instance_id for (instance_id,) in db_session.execute(statement)]
+        db_session.commit()
+
+        # rows that hit an existing primary key are skipped by the insert
+        for instance_id in rows.keys() - set(created):
+            errors.append(
+                SignalInstanceBatchError(
+                    index=row_indexes[instance_id],
+                    msg=f"Signal instance already exists: {instance_id}",
+                )
+            )
+        errors.sort(key=lambda e: e.index)
+
+    return SignalInstanceBatchRead(created=created, errors=errors)
+
+
+def get_pending_instances(
+    *,
+    db_session: Session,
+    signal_id: int,
+    since: datetime,
+    limit: int,
+    exclude_instance_ids: Iterable[uuid.UUID] = None,
+) -> List[SignalInstance]:
+    """Gets the oldest signal instances of a signal that have not been processed yet."""
+    query = (
+        db_session.query(SignalInstance)
+        .filter(SignalInstance.signal_id == signal_id)
+        .filter(SignalInstance.filter_action == None)  # noqa
+        .filter(SignalInstance.case_id == None)  # noqa
+        .filter(SignalInstance.created_at >= since)
+    )
+    if exclude_instance_ids:
+        query = query.filter(SignalInstance.id.notin_(list(exclude_instance_ids)))
+
+    return query.order_by(asc(SignalInstance.created_at)).limit(limit).all()
+
+
+def get_signal_claim_lock_key(connection: Connection) -> int:
+    """Returns the first key of the advisory locks claiming signals, one per organization schema."""
+    schema_translate_map = connection.get_execution_options().get("schema_translate_map") or {}
+    key = zlib.crc32(f"signal-claim:{schema_translate_map.get(None)}".encode("utf-8"))
+    # advisory lock keys are signed 32 bit integers
+    return key - 2**32 if key >= 2**31 else key
+
+
+def claim_signal_with_pending_instances(
+    *,
+    connection: Connection,
+    since: datetime,
+    exclude_signal_ids: List[int] = None,
+    exclude_instance_ids: Iterable[uuid.UUID] = None,
+) -> Optional[int]:
+    """Claims a signal that has unprocessed instances and returns its id.
+
+    The claim is a transaction level advisory lock on the signal's id, taken with
+    `pg_try_advisory_xact_lock` so concurrent workers claim different signals.
+    It lasts until the connection's transaction ends, which keeps all instances
+    of a signal processed in order by a single worker. No row is locked, so the
+    signal can still be updated and new instances inserted in the meantime.
+    """
+    signal_instance = SignalInstance.__table__
+
+    statement = (
+        select([signal_instance.c.signal_id])
+        .where(signal_instance.c.filter_action == None)  # noqa
+        .where(signal_instance.c.case_id == None)  # noqa
+        .where(signal_instance.c.created_at >= since)
+        .distinct()
+        .order_by(signal_instance.c.signal_id)
+    )
+    if exclude_signal_ids:
+        statement = statement.where(signal_instance.c.signal_id.notin_(exclude_signal_ids))
+    if exclude_instance_ids:
+        statement = statement.where(signal_instance.c.id.notin_(list(exclude_instance_ids)))
+
+    lock_key = get_signal_claim_lock_key(connection)
+    for (signal_id,) in connection.execute(statement).fetchall():
+        claimed = connection.execute(
+            select([func.pg_try_advisory_xact_lock(lock_key, signal_id)])
+        ).scalar()
+        if claimed:
+            return signal_id
+
+
+def get_instances_sharing_entities(
+    *, db_session: Session, signal_instance: SignalInstance, since: datetime
+) -> List[SignalInstance]:
+    """Returns the instances of the same signal created since the given time that share
+    at least one entity with the signal instance, oldest first."""
+    entity_ids = [e.id for e in signal_instance.entities]
+    if not entity_ids:
+        return []
+
+    return (
+        db_session.query(SignalInstance)
+        .options(selectinload(SignalInstance.entities).joinedload(Entity.entity_type))
+        .filter(
+            SignalInstance.signal_id == signal_instance.signal_id,
+            SignalInstance.created_at >= since,
+            SignalInstance.id != signal_instance.id,
+            SignalInstance.entities.any(Entity.id.in_(entity_ids)),
+        )
+        .order_by(asc(SignalInstance.created_at))
+        .all()
+    )
+
+
+def signal_instance_matches_filter(
+    *,
+    db_session: Session,
+    signal_instance: SignalInstance,
+    signal_filter: SignalFilter,
+    entity_ids: set = None,
+) -> bool:
+    """Checks whether the signal instance matches the filter's expression.
+
+    The expression is evaluated against one row per entity of the instance, as the
+    equivalent database join would, optionally limited to the given entity ids.
+    Expressions that can't be evaluated in memory are sent to the database.
+    """
+    predicate = compile_filter_predicate(
+        signal_filter.expression, "SignalInstance", SIGNAL_FILTER_ROW_MODELS
+    )
+
+    entities = [e for e in signal_instance.entities if entity_ids is None or e.id in entity_ids]
+
+    if predicate is None:
+        query = db_session.query(SignalInstance).filter(SignalInstance.id == signal_instance.id)
+        query = apply_filter_specific_joins(SignalInstance, signal_filter.expression, query)
+        query = apply_filters(query, signal_filter.expression)
+        if entity_ids is not None:
+            query = query.filter(
+                SignalInstance.entities.any(Entity.id.in_([e.id for e in entities]))
+            )
+        return db_session.query(query.exists()).scalar()
+
+    rows = [
+        {"SignalInstance": signal_instance, "Entity": e, "EntityType": e.entity_type}
+        for e in entities
+    ] or [{"SignalInstance": signal_instance, "Entity": None, "EntityType": None}]
+
+    return any(predicate(row) for row in rows)
+
+
+def get_indexed_entity_ids(
+    *, signal_instance: SignalInstance, signal_filter: SignalFilter
+) -> Optional[set]:
+    """Returns the ids of the instance's entities matching a deduplication filter.
+
+    Returns None when the filter's expression depends on the instances themselves,
+    in which case it can't be answered by the deduplication index.
+    """
+    predicate = compile_filter_predicate(
+        signal_filter.expression, "SignalInstance", SIGNAL_FILTER_ROW_MODELS
+    )
+    if predicate is None:
+        return None
+
+    if "SignalInstance" in get_filter_spec_models(signal_filter.expression, "SignalInstance"):
+        return None
+
+    return {
+        e.id
+        for e in signal_instance.entities
+        if predicate({"SignalInstance": None, "Entity": e, "EntityType": e.entity_type})
+    }
+
+
 def filter_signal(*, db_session: Session, signal_instance: SignalInstance) -> bool:
     """
     Apply filter actions to the signal instance.
@@ -495,16 +773,15 @@ def filter_signal(*, db_session: Session, signal_instance: SignalInstance) -> bo
     """
 
     filtered = False
-    for f in signal_instance.signal.filters:
-        if f.mode != SignalFilterMode.active:
-            continue
+    filters = [f for f in signal_instance.signal.filters if f.mode == SignalFilterMode.active]
 
-        query = db_session.query(SignalInstance).filter(
-            SignalInstance.signal_id == signal_instance.signal_id
-        )
-        query = apply_filter_specific_joins(SignalInstance, f.expression, query)
-        query = apply_filters(query, f.expression)
+    # deduplication candidates are fetched once for the widest window and shared by all filters
+    dedup_candidates = None
+    dedup_windows = [f.window for f in filters if f.action == SignalFilterAction.deduplicate]
 
+    entity_ids = {e.id for e in signal_instance.entities}
+
+    for f in filters:
         # order matters, check for snooze before deduplication
         # we check to see if the current instances match's it's signals snooze filter
         if f.action == SignalFilterAction.snooze:
@@ -512,35 +789,58 @@ def filter_signal(*, db_session: Session, signal_instance: SignalInstance) -> bo
                 continue
 
             # an expression is not required for snoozing, if absent we snooze regardless of entity
-            if f.expression:
-                instances = query.filter(SignalInstance.id == signal_instance.id).all()
-
-                if instances:
-                    signal_instance.filter_action = SignalFilterAction.snooze
-                    filtered = True
-                    break
-            else:
+            if not f.expression or signal_instance_matches_filter(
+                db_session=db_session, signal_instance=signal_instance, signal_filter=f
+            ):
                 signal_instance.filter_action = SignalFilterAction.snooze
                 filtered = True
                 break
 
         elif f.action == SignalFilterAction.deduplicate:
             window = datetime.now(timezone.utc) - timedelta(minutes=f.window)
-            query = query.filter(SignalInstance.created_at >= window)
-            query = query.join(SignalInstance.entities).filter(
-                Entity.id.in_([e.id for e in signal_instance.entities])
+
+            # recent instances sharing a matching entity are usually in the index
+            indexed_entity_ids = get_indexed_entity_ids(
+                signal_instance=signal_instance, signal_filter=f
             )
-            query = query.filter(SignalInstance.id != signal_instance.id)
+            if indexed_entity_ids:
+                case_id = signal_dedup_index.get_earliest_case_id(
+                    db_session=db_session,
+                    signal=signal_instance.signal,
+                    entity_ids=indexed_entity_ids,
+                    since=window,
+                )
+                if case_id:
+                    signal_instance.case_id = case_id
+                    signal_instance.filter_action = SignalFilterAction.deduplicate
+                    filtered = True
+                    break
 
-            # get the earliest instance
-            query = query.order_by(asc(SignalInstance.created_at))
-            instances = query.all()
+            if dedup_candidates is None:
+                dedup_candidates = get_instances_sharing_entities(
+                    db_session=db_session,
+                    signal_instance=signal_instance,
+                    since=datetime.now(timezone.utc) - timedelta(minutes=max(dedup_windows)),
+                )
 
-            if instances:
-                # associate with existing case
-                signal_instance.case_id = instances[0].case_id
-                signal_instance.filter_action = SignalFilterAction.deduplicate
-                filtered = True
+            # candidates are ordered by creation, so the first match is the earliest instance
+            for candidate in dedup_candidates:
+                if candidate.created_at.replace(tzinfo=timezone.utc) < window:
+                    continue
+
+                if signal_instance_matches_filter(
+                    db_session=db_session,
+                    signal_instance=candidate,
+                    signal_filter=f,
+                    entity_ids=entity_ids,
+                ):
+                    # associate with existing case
+                    signal_instance.case_id = candidate.case_id
+                    signal_instance.filter_action = SignalFilterAction.deduplicate
+                    filtered = True
+                    break
+
+            if filtered:
                 break
     else:
         # Check if there's a deduplication rule set on the signal
@@ -551,20 +851,26 @@ def filter_signal(*, db_session: Session, signal_instance: SignalInstance) -> bo
         # and the signal instance is not snoozed
         if not has_dedup_filter and not filtered:
             default_dedup_window = datetime.now(timezone.utc) - timedelta(hours=1)
-            instance = (
-                db_session.query(SignalInstance)
-                .filter(
-                    SignalInstance.signal_id == signal_instance.signal_id,
-                    SignalInstance.created_at >= default_dedup_window,
-                    SignalInstance.id != signal_instance.id,
-                    SignalInstance.case_id.isnot(None),  # noqa
-                )
-                .with_entities(SignalInstance.case_id)
-                .order_by(desc(SignalInstance.created_at))
-                .first()
+            case_id = signal_dedup_index.get_latest_case_id(
+                db_session=db_session, signal=signal_instance.signal, since=default_dedup_window
             )
-            if instance:
-                signal_instance.case_id = instance.case_id
+            if not case_id:
+                instance = (
+                    db_session.query(SignalInstance)
+                    .filter(
+                        SignalInstance.signal_id == signal_instance.signal_id,
+                        SignalInstance.created_at >= default_dedup_window,
+                        SignalInstance.id != signal_instance.id,
+                        SignalInstance.case_id.isnot(None),  # noqa
+                    )
+                    .with_entities(SignalInstance.case_id)
+                    .order_by(desc(SignalInstance.created_at))
+                    .first()
+                )
+                case_id = instance.case_id if instance else None
+
+            if case_id:
+                signal_instance.case_id = case_id
                 signal_instance.filter_action = SignalFilterAction.deduplicate
                 filtered = True
 
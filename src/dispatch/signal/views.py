@@ -6,7 +6,12 @@ from sqlalchemy.exc import IntegrityError
 
 from dispatch.auth.service import CurrentUser
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    Cursor,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.exceptions import ExistsError
 from dispatch.rate_limiter import limiter
 from dispatch.models import OrganizationSlug, PrimaryKey
@@ -22,6 +27,8 @@ from .models import (
     SignalFilterPagination,
     SignalFilterRead,
     SignalFilterUpdate,
+    SignalInstanceBatchCreate,
+    SignalInstanceBatchRead,
     SignalInstanceCreate,
     SignalInstancePagination,
     SignalInstanceRead,
@@ -47,9 +54,14 @@ log = logging.getLogger(__name__)
 
 
 @router.get("/instances", response_model=SignalInstancePagination)
-def get_signal_instances(common: CommonParameters):
+def get_signal_instances(common: CommonParameters, cursor: Cursor = None):
     """Get all signal instances."""
-    return search_filter_sort_paginate(model="SignalInstance", **common)
+    return search_filter_sort_paginate(model="SignalInstance", cursor=cursor, **common)
+
+
+add_export_route(
+    router, path="/instances/export", model="SignalInstance", item_model=SignalInstanceRead
+)
 
 
 @router.post("/instances", response_model=SignalInstanceRead)
@@ -112,18 +124,45 @@ def create_signal_instance(
     return signal_instance
 
 
+@router.post("/instances/batch", response_model=SignalInstanceBatchRead)
+@limiter.limit("1000/minute")
+def create_signal_instances(
+    db_session: DbSession,
+    organization: OrganizationSlug,
+    signal_instances_in: SignalInstanceBatchCreate,
+    request: Request,
+    response: Response,
+):
+    """Create many signal instances at once."""
+    project = project_service.get_by_name_or_default(
+        db_session=db_session, project_in=signal_instances_in.project
+    )
+
+    return signal_service.create_instances(
+        db_session=db_session, project=project, raw_instances=signal_instances_in.instances
+    )
+
+
 @router.get("/filters", response_model=SignalFilterPagination)
 def get_signal_filters(common: CommonParameters):
     """Get all signal filters."""
     return search_filter_sort_paginate(model="SignalFilter", **common)
 
 
+add_export_route(router, path="/filters/export", model="SignalFilter", item_model=SignalFilterRead)
+
+
 @router.get("/engagements", response_model=SignalEngagementPagination)
 def get_signal_engagements(common: CommonParameters):
     """Get all signal engagements."""
     return search_filter_sort_paginate(model="SignalEngagement", **common)
 
 
+add_export_route(
+    router, path="/engagements/export", model="SignalEngagement", item_model=SignalEngagementRead
+)
+
+
 @router.get("/engagements/{engagement_id}", response_model=SignalEngagementRead)
 def get_signal_engagement(
     db_session: DbSession,
@@ -233,6 +272,9 @@ def get_signals(common: CommonParameters):
     return search_filter_sort_paginate(model="Signal", **common)
 
 
+add_export_route(router, model="Signal", item_model=SignalRead)
+
+
 @router.get("/{signal_id}", response_model=SignalRead)
 def get_signal(db_session: DbSession, signal_id: PrimaryKey):
     """Get a signal by it's ID."""
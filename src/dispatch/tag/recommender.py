@@ -5,139 +5,127 @@
     :license: Apache, see LICENSE for more details.
 """
 import logging
-from typing import List, Any
-from collections import defaultdict
-
+import os
 import tempfile
-import pandas as pd
-from pandas.core.frame import DataFrame
+import threading
+from typing import Any, List
+
+import numpy as np
+from cachetools import LRUCache
+from scipy import sparse
 
 from dispatch.database.core import SessionLocal
-from dispatch.tag import service as tag_service
+from dispatch.tag.models import Tag
 
 log = logging.getLogger(__name__)
 
+# number of neighbours kept per tag
+TOP_K = 20
 
-def save_model(dataframe: DataFrame, organization_slug: str, project_slug: str, model_name: str):
-    """Saves a correlation dataframe to disk."""
-    file_name = f"{tempfile.gettempdir()}/{organization_slug}-{project_slug}-{model_name}.pkl"
-    dataframe.to_pickle(file_name)
-
-
-def load_model(organization_slug: str, project_slug: str, model_name: str):
-    """Loads a correlation dataframe from disk."""
-    file_name = f"{tempfile.gettempdir()}/{organization_slug}-{project_slug}-{model_name}.pkl"
-    return pd.read_pickle(file_name)
-
-
-def correlation(df, tag_a, tag_b):
-    """Determine the probability of correlation/association."""
-    # Find all rows where a AND b == True
-    a_and_b = df[(df[tag_a]) & (df[tag_b])]
-
-    # Find all rows where a == True AND b != True
-    a_not_b = df[(df[tag_a]) & ~(df[tag_b])]
-    # Find all rows where b == True AND a != True
-    b_not_a = df[(df[tag_b]) & ~(df[tag_a])]
-
-    # Calculate the number of positive and possible outcomes using the shape attribute
-    possible_outcomes = (
-        a_and_b.shape[0] + a_not_b.shape[0] + b_not_a.shape[0]
-    )  # shape[0] returns the number of rows
-    positive_outcomes = a_and_b.shape[0]
-
-    # Calculate the final correlation coefficient
-    r = positive_outcomes / possible_outcomes
-
-    return r
-
-
-def correlate_with_every_tag(df, tag_a):
-    """Create correlations between every tag."""
-
-    unique_tags = list(df.columns)
-    # Loop through every tag and store the correlation in a list
-    correlation_list = []
-    for tag_b in unique_tags:
-        correlation_list.append(correlation(df, tag_a, tag_b))
-    return correlation_list
-
-
-def get_unique_tags(items: List[Any]):
-    """Get unique tags."""
-    unique_tags = {}
-    for i in items:
-        for t in i.tags:
-            unique_tags[t.id] = t.id
-    return unique_tags
-
-
-def create_correlation_dataframe(dataframe):
-    """Create the correlation dataframe based on the boolean dataframe."""
-    unique_tags = list(dataframe.columns)
+# maximum number of memory mapped models kept open
+MODEL_CACHE_SIZE = 64
 
-    correlation_matrix_dict = {}
+_model_cache = LRUCache(maxsize=MODEL_CACHE_SIZE)
+_model_cache_lock = threading.Lock()
 
-    for tag_a in unique_tags:
-        correlation_matrix_dict[tag_a] = correlate_with_every_tag(dataframe, tag_a)
 
-    correlated_dataframe = pd.DataFrame(correlation_matrix_dict)
-    correlated_dataframe["index"] = unique_tags
-    return correlated_dataframe.set_index("index")
+def get_model_dtype(k: int = TOP_K) -> np.dtype:
+    """Returns the record type of a model, one record per tag sorted by tag id."""
+    return np.dtype([("tag_id", "<i8"), ("neighbors", "<i8", (k,)), ("scores", "<f4", (k,))])
 
 
-def create_boolean_dataframe(items: List[Any]):
-    """Create a boolean dataframe with tag and item data."""
-    unique_tags = get_unique_tags(items)
-    boolean_df = pd.DataFrame(columns=unique_tags.values())
+def get_model_file_name(organization_slug: str, project_slug: str, model_name: str) -> str:
+    return f"{tempfile.gettempdir()}/{organization_slug}-{project_slug}-{model_name}.npy"
 
-    data_dict = defaultdict(list)
-    for col in boolean_df:
-        for i in items:
-            tag_ids = [t.id for t in i.tags]
-            data_dict[col].append(col in tag_ids)
 
-    for col in boolean_df:
-        boolean_df[col] = data_dict[col]
-
-    return boolean_df
-
-
-def find_correlations(dataframe, tag):
-    """Find all correlations for the given tag."""
-    # Setup empty list
-    correlations = []
-    columns = []
-
-    # Loop through all column at the row with the tag as its index
-    for i, corr in enumerate(dataframe.loc[tag, :]):
-        # Find the column
-        col = dataframe.columns[i]
-
-        # Append the correlation to the list
-        correlations.append(corr)
-        columns.append(col)
-
-    # Create a df out of the lists
-    results_df = pd.DataFrame({"tag": columns, "correlation": correlations})
-
-    return results_df
-
-
-def find_highest_correlations(correlated_dataframe, recommendations):
-    """Find the correlations with the highest relevancy."""
-    # Sort the input df
-    corr_df_sorted = correlated_dataframe.sort_values(by=["correlation"], ascending=False)
-
-    # Extract the relevant correlations
-    corr_df_sliced = corr_df_sorted.iloc[1 : recommendations + 1]  # noqa
-
-    return corr_df_sliced
+def save_model(model: np.ndarray, organization_slug: str, project_slug: str, model_name: str):
+    """Saves a model to disk, replacing the previous one atomically."""
+    file_name = get_model_file_name(organization_slug, project_slug, model_name)
+    fd, tmp_file_name = tempfile.mkstemp(dir=os.path.dirname(file_name), suffix=".npy")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, model, allow_pickle=False)
+        os.replace(tmp_file_name, file_name)
+    except BaseException:
+        os.unlink(tmp_file_name)
+        raise
+
+
+def load_model(organization_slug: str, project_slug: str, model_name: str) -> np.ndarray:
+    """Memory maps a model from disk, the mapping is reused until the model is rebuilt."""
+    file_name = get_model_file_name(organization_slug, project_slug, model_name)
+    key = (file_name, os.stat(file_name).st_mtime_ns)
+
+    with _model_cache_lock:
+        model = _model_cache.get(key)
+        if model is None:
+            model = np.load(file_name, mmap_mode="r", allow_pickle=False)
+            _model_cache[key] = model
+    return model
+
+
+def create_incidence_matrix(items: List[Any]):
+    """Creates a sparse (items x tags) boolean matrix and the tag id of every column."""
+    rows = []
+    tag_ids = []
+    for row, item in enumerate(items):
+        for tag_id in {t.id for t in item.tags}:
+            rows.append(row)
+            tag_ids.append(tag_id)
+
+    unique_tag_ids, columns = np.unique(np.array(tag_ids, dtype=np.int64), return_inverse=True)
+    matrix = sparse.csr_matrix(
+        (np.ones(len(rows), dtype=np.int32), (np.array(rows, dtype=np.int64), columns)),
+        shape=(len(items), len(unique_tag_ids)),
+    )
+    return matrix, unique_tag_ids
+
+
+def create_model(items: List[Any], k: int = TOP_K) -> np.ndarray:
+    """Computes the k tags with the highest Jaccard index for every tag.
+
+    The co-occurrence of all tag pairs is computed with a single sparse matrix
+    product, only pairs that occur together are considered.
+    """
+    matrix, tag_ids = create_incidence_matrix(items)
+    model = np.zeros(len(tag_ids), dtype=get_model_dtype(k))
+    model["tag_id"] = tag_ids
+    model["neighbors"] = -1
+
+    # number of items tagged with a and b, and with a or b
+    co_occurrences = (matrix.T @ matrix).tocoo()
+    counts = np.asarray(matrix.sum(axis=0)).ravel()
+    off_diagonal = co_occurrences.row != co_occurrences.col
+    a = co_occurrences.row[off_diagonal]
+    b = co_occurrences.col[off_diagonal]
+    intersection = co_occurrences.data[off_diagonal]
+    jaccard = intersection / (counts[a] + counts[b] - intersection)
+
+    similarities = sparse.csr_matrix((jaccard, (a, b)), shape=(len(tag_ids), len(tag_ids)))
+    for row in range(len(tag_ids)):
+        start, end = similarities.indptr[row], similarities.indptr[row + 1]
+        scores = similarities.data[start:end]
+        columns = similarities.indices[start:end]
+
+        # highest scores first, ties broken by tag id
+        top = np.lexsort((tag_ids[columns], -scores))[:k]
+        model["neighbors"][row, : len(top)] = tag_ids[columns[top]]
+        model["scores"][row, : len(top)] = scores[top]
+
+    return model
+
+
+def get_neighbors(model: np.ndarray, tag_id: int) -> List[int]:
+    """Returns the neighbours of a tag, most similar first."""
+    index = np.searchsorted(model["tag_id"], tag_id)
+    if index == len(model) or model["tag_id"][index] != tag_id:
+        return []
+    return [int(n) for n in model["neighbors"][index] if n != -1]
 
 
 def get_recommendations(
     db_session: SessionLocal,
-    tag_ids: List[str],
+    tag_ids: List[int],
     organization_slug: str,
     project_slug: str,
     model_name: str,
@@ -145,28 +133,26 @@ def get_recommendations(
 ):
     """Get recommendations based on current tag."""
     try:
-        correlation_dataframe = load_model(organization_slug, project_slug, model_name)
+        model = load_model(organization_slug, project_slug, model_name)
     except FileNotFoundError:
         log.warning(
-            f"Unable to recommend tag(s). No correlation dataframe file found for project name {project_slug} and model name {model_name}."
+            f"Unable to recommend tag(s). No model file found for project name {project_slug} and model name {model_name}."
         )
         return []
 
-    recommendations_dataframe = pd.DataFrame()
+    recommended_tag_ids = []
     for tag_id in tag_ids:
-        correlated_dataframe = find_correlations(correlation_dataframe, tag_id)
-        recommendations_dataframe = pd.concat(
-            [
-                recommendations_dataframe,
-                find_highest_correlations(correlated_dataframe, recommendations),
-            ],
-            ignore_index=True,
-        )
+        for neighbor in get_neighbors(model, int(tag_id)):
+            if neighbor not in tag_ids and neighbor not in recommended_tag_ids:
+                recommended_tag_ids.append(neighbor)
+
+    recommended_tag_ids = recommended_tag_ids[:recommendations]
+    if not recommended_tag_ids:
+        return []
 
     # convert back to tag objects
-    tags = []
-    for t in recommendations_dataframe["tag"][:recommendations]:
-        tags.append(tag_service.get(db_session=db_session, tag_id=int(t)))
+    tags = {t.id: t for t in db_session.query(Tag).filter(Tag.id.in_(recommended_tag_ids))}
+    tags = [tags[tag_id] for tag_id in recommended_tag_ids if tag_id in tags]
 
     log.debug(
         f"Recommending the following tag(s) for model name {model_name}: {','.join([t.name for t in tags])}"
@@ -175,7 +161,5 @@ def get_recommendations(
 
 
 def build_model(items: List[Any], organization_slug: str, project_slug: str, model_name: str):
-    """Builds the correlation dataframe for items."""
-    boolean_dataframe = create_boolean_dataframe(items)
-    correlation_dataframe = create_correlation_dataframe(boolean_dataframe)
-    save_model(correlation_dataframe, organization_slug, project_slug, model_name)
+    """Builds the tag co-occurrence model for items."""
+    save_model(create_model(items), organization_slug, project_slug, model_name)
@@ -1,7 +1,11 @@
 from fastapi import APIRouter, HTTPException, status
 
 from dispatch.database.core import DbSession, get_class_by_tablename
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import PrimaryKey
 from dispatch.tag.recommender import get_recommendations
 
@@ -22,6 +26,9 @@ def get_tags(common: CommonParameters):
     return search_filter_sort_paginate(model="Tag", **common)
 
 
+add_export_route(router, model="Tag", item_model=TagRead)
+
+
 @router.get("/{tag_id}", response_model=TagRead)
 def get_tag(db_session: DbSession, tag_id: PrimaryKey):
     """Given its unique id, retrieve details about a single tag."""
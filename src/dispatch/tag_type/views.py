@@ -4,7 +4,11 @@ from sqlalchemy.exc import IntegrityError
 
 from dispatch.database.core import DbSession
 from dispatch.exceptions import ExistsError
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import PrimaryKey
 
 from .models import (
@@ -24,6 +28,9 @@ def get_tag_types(common: CommonParameters):
     return search_filter_sort_paginate(model="TagType", **common)
 
 
+add_export_route(router, model="TagType", item_model=TagTypeRead)
+
+
 @router.get("/{tag_type_id}", response_model=TagTypeRead)
 def get_tag_type(db_session: DbSession, tag_type_id: PrimaryKey):
     """Get a tag type by its id."""
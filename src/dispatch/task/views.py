@@ -6,7 +6,11 @@ from fastapi import APIRouter, HTTPException, Query, status
 from dispatch.auth.service import CurrentUser
 from dispatch.common.utils.views import create_pydantic_include
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import PrimaryKey
 
 from .models import TaskCreate, TaskUpdate, TaskRead, TaskPagination
@@ -36,6 +40,9 @@ def get_tasks(common: CommonParameters, include: List[str] = Query([], alias="in
     return json.loads(TaskPagination(**pagination).json())
 
 
+add_export_route(router, model="Task", item_model=TaskRead)
+
+
 @router.post("", response_model=TaskRead, tags=["tasks"])
 def create_task(
     db_session: DbSession,
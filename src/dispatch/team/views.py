@@ -3,7 +3,11 @@ from pydantic.error_wrappers import ErrorWrapper, ValidationError
 
 from dispatch.database.core import DbSession
 from dispatch.exceptions import ExistsError
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import PrimaryKey
 
 from .models import (
@@ -23,6 +27,9 @@ def get_teams(common: CommonParameters):
     return search_filter_sort_paginate(model="TeamContact", **common)
 
 
+add_export_route(router, model="TeamContact", item_model=TeamContactRead)
+
+
 @router.post("", response_model=TeamContactRead)
 def create_team(db_session: DbSession, team_contact_in: TeamContactCreate):
     """Create a new team contact."""
@@ -3,7 +3,11 @@ from pydantic.error_wrappers import ErrorWrapper, ValidationError
 
 from dispatch.database.core import DbSession
 from dispatch.exceptions import ExistsError
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.models import PrimaryKey
 
 from .models import TermCreate, TermPagination, TermRead, TermUpdate
@@ -18,6 +22,9 @@ def get_terms(common: CommonParameters):
     return search_filter_sort_paginate(model="Term", **common)
 
 
+add_export_route(router, model="Term", item_model=TermRead)
+
+
 @router.post("", response_model=TermRead)
 def create_term(db_session: DbSession, term_in: TermCreate):
     """Create a new term."""
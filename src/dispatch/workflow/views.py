@@ -2,7 +2,11 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic.error_wrappers import ErrorWrapper, ValidationError
 
 from dispatch.database.core import DbSession
-from dispatch.database.service import CommonParameters, search_filter_sort_paginate
+from dispatch.database.service import (
+    CommonParameters,
+    add_export_route,
+    search_filter_sort_paginate,
+)
 from dispatch.exceptions import NotFoundError
 from dispatch.models import PrimaryKey
 from dispatch.plugin import service as plugin_service
@@ -27,6 +31,9 @@ def get_workflows(common: CommonParameters):
     return search_filter_sort_paginate(model="Workflow", **common)
 
 
+add_export_route(router, model="Workflow", item_model=WorkflowRead)
+
+
 @router.get("/{workflow_id}", response_model=WorkflowRead)
 def get_workflow(db_session: DbSession, workflow_id: PrimaryKey):
     """Get a workflow."""
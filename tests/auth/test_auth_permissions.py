@@ -0,0 +1,213 @@
+import pytest
+
+
+def create_request(session, user, principal=None, **path_params):
+    from starlette.requests import Request
+
+    request = Request({"type": "http", "headers": [], "path_params": path_params})
+    request.state.db = session
+    request.state.current_user = user
+    request.state.principal = principal
+    return request
+
+
+def set_organization_role(session, user, organization, role):
+    from dispatch.auth.models import DispatchUserOrganization
+
+    session.add(DispatchUserOrganization(dispatch_user=user, organization=organization, role=role))
+    session.flush()
+
+
+def is_permitted(permission, request):
+    from fastapi import HTTPException
+
+    try:
+        permission(request=request)
+    except HTTPException:
+        return False
+    return True
+
+
+@pytest.mark.parametrize("minimum", ["Member", "Admin", "Manager", "Owner"])
+@pytest.mark.parametrize("role", ["Member", "Admin", "Manager", "Owner"])
+def test_has_role(role, minimum):
+    from dispatch.auth.permissions import has_role
+
+    hierarchy = ["Member", "Admin", "Manager", "Owner"]
+    assert has_role(role, minimum) == (hierarchy.index(role) >= hierarchy.index(minimum))
+
+
+@pytest.mark.parametrize("minimum", ["Member", "Admin", "Manager", "Owner"])
+def test_has_role_unknown(minimum):
+    from dispatch.auth.permissions import has_role
+
+    assert not has_role(None, minimum)
+    assert not has_role("Superuser", minimum)
+
+
+@pytest.mark.parametrize("role", ["Member", "Admin", "Manager", "Owner"])
+def test_organization_permissions(session, user, organization, role):
+    from dispatch.auth.permissions import (
+        OrganizationAdminPermission,
+        OrganizationManagerPermission,
+        OrganizationMemberPermission,
+        OrganizationOwnerPermission,
+        ProjectCreatePermission,
+        SensitiveProjectActionPermission,
+        has_role,
+    )
+
+    set_organization_role(session, user, organization, role)
+    request = create_request(session, user, organization=organization.slug)
+
+    for permission, minimum in [
+        (OrganizationMemberPermission, "Member"),
+        (OrganizationAdminPermission, "Admin"),
+        (SensitiveProjectActionPermission, "Admin"),
+        (OrganizationManagerPermission, "Manager"),
+        (ProjectCreatePermission, "Manager"),
+        (OrganizationOwnerPermission, "Owner"),
+    ]:
+        assert is_permitted(permission, request) == has_role(role, minimum), permission
+
+
+def test_organization_permissions_without_role(session, user, organization):
+    from dispatch.auth.permissions import OrganizationMemberPermission
+
+    request = create_request(session, user, organization=organization.slug)
+    assert not is_permitted(OrganizationMemberPermission, request)
+
+
+def test_organization_not_found(session, user):
+    from fastapi import HTTPException
+
+    from dispatch.auth.permissions import OrganizationMemberPermission
+
+    request = create_request(session, user, organization_id=-1)
+    with pytest.raises(HTTPException) as e:
+        OrganizationMemberPermission(request=request)
+    assert e.value.status_code == 404
+
+
+@pytest.mark.parametrize(
+    "relation, role, visible",
+    [
+        ("commander", "Member", True),
+        ("reporter", "Member", True),
+        ("participant", "Member", False),
+        (None, "Member", False),
+        (None, "Admin", True),
+    ],
+)
+def test_restricted_incident_view(
+    session, user, organization, incident, participant, relation, role, visible
+):
+    from dispatch.auth.permissions import IncidentEditPermission, IncidentViewPermission
+
+    set_organization_role(session, user, organization, role)
+    participant.individual.email = user.email
+    incident.visibility = "Restricted"
+    if relation:
+        incident.participants.append(participant)
+    if relation == "commander":
+        incident.commander = participant
+    elif relation == "reporter":
+        incident.reporter = participant
+    session.flush()
+
+    request = create_request(session, user, organization=organization.slug, incident_id=incident.id)
+    assert is_permitted(IncidentViewPermission, request) == visible
+    assert is_permitted(IncidentEditPermission, request) == visible
+
+    # open incidents are visible to every member
+    incident.visibility = "Open"
+    request = create_request(session, user, organization=organization.slug, incident_id=incident.id)
+    assert is_permitted(IncidentViewPermission, request)
+
+
+@pytest.mark.parametrize(
+    "is_participant, role, visible",
+    [(True, "Member", True), (False, "Member", False), (False, "Admin", True)],
+)
+def test_restricted_case_view(
+    session, user, organization, case, participant, is_participant, role, visible
+):
+    from dispatch.auth.permissions import CaseEditPermission, CaseViewPermission
+
+    set_organization_role(session, user, organization, role)
+    case.visibility = "Restricted"
+    if is_participant:
+        participant.individual.email = user.email
+        case.participants.append(participant)
+    session.flush()
+
+    request = create_request(session, user, organization=organization.slug, case_id=case.id)
+    assert is_permitted(CaseViewPermission, request) == visible
+    assert is_permitted(CaseEditPermission, request) == visible
+
+
+def test_permission_context_reused(session, user, organization, incident, monkeypatch):
+    from dispatch.auth import permissions
+    from dispatch.auth.permissions import (
+        IncidentEditPermission,
+        IncidentViewPermission,
+        OrganizationMemberPermission,
+        PermissionsDependency,
+        get_permission_context,
+    )
+
+    calls = {"incident": 0, "organization": 0}
+
+    def counted(name, fn):
+        def wrapper(**kwargs):
+            calls[name] += 1
+            return fn(**kwargs)
+
+        return wrapper
+
+    monkeypatch.setattr(
+        permissions.incident_service, "get", counted("incident", permissions.incident_service.get)
+    )
+    monkeypatch.setattr(
+        permissions.organization_service,
+        "get_by_slug_or_raise",
+        counted("organization", permissions.organization_service.get_by_slug_or_raise),
+    )
+
+    set_organization_role(session, user, organization, "Admin")
+    request = create_request(session, user, organization=organization.slug, incident_id=incident.id)
+    PermissionsDependency(
+        [OrganizationMemberPermission, IncidentViewPermission, IncidentEditPermission]
+    )(request)
+
+    assert calls == {"incident": 1, "organization": 1}
+    context = get_permission_context(request)
+    assert context is request.state.permission_context
+    assert context.incident.id == incident.id
+
+
+def test_principal_of_other_user(session, user, organization):
+    from dispatch.auth.models import DispatchUser, hash_password
+    from dispatch.auth.permissions import OrganizationOwnerPermission, get_permission_context
+    from dispatch.auth.service import Principal
+
+    set_organization_role(session, user, organization, "Member")
+    other_user = DispatchUser(email=f"other-{user.email}", password=hash_password("test123"))
+    session.add(other_user)
+    session.flush()
+
+    # a principal that doesn't belong to the current user must not lend it its roles
+    principal = Principal(
+        user=other_user, organization_roles={organization.slug: "Owner"}, project_roles={}
+    )
+    request = create_request(session, user, principal=principal, organization=organization.slug)
+    assert get_permission_context(request).role == "Member"
+    assert not is_permitted(OrganizationOwnerPermission, request)
+
+    # the current user's own principal is used as is
+    principal = Principal(
+        user=user, organization_roles={organization.slug: "Owner"}, project_roles={}
+    )
+    request = create_request(session, user, principal=principal, organization=organization.slug)
+    assert get_permission_context(request).role == "Owner"
+    assert is_permitted(OrganizationOwnerPermission, request)
@@ -519,6 +519,11 @@ def incident(session):
     return IncidentFactory()
 
 
+@pytest.fixture
+def incidents(session):
+    return [IncidentFactory() for _ in range(5)]
+
+
 @pytest.fixture
 def event(session):
     return EventFactory()
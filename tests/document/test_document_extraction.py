@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+
+class StorageStub:
+    def __init__(self, modified_times: dict, texts: dict):
+        self.modified_times = modified_times
+        self.texts = texts
+        self.downloads = []
+
+    def get_modified_times(self, file_ids):
+        return {i: self.modified_times[i] for i in file_ids if i in self.modified_times}
+
+    def get(self, file_id, mime_type):
+        self.downloads.append(file_id)
+        return self.texts[file_id]
+
+
+def test_extract_terms_from_documents(session, document):
+    from dispatch.document.extraction import extract_terms_from_documents
+    from dispatch.document.models import DocumentExtraction
+
+    storage = StorageStub(
+        modified_times={document.resource_id: "2023-05-01T00:00:00.000Z"},
+        texts={document.resource_id: "phishing and more phishing"},
+    )
+    plugin = SimpleNamespace(instance=storage)
+
+    def extract(terms):
+        return list(
+            extract_terms_from_documents(
+                db_session=session,
+                plugin=plugin,
+                documents=[document],
+                name="dispatch-term",
+                terms=terms,
+            )
+        )
+
+    assert extract(["phishing"]) == [(document, ["phishing"])]
+    extraction = session.query(DocumentExtraction).filter_by(document_id=document.id).one()
+    assert extraction.modified_time == "2023-05-01T00:00:00.000Z"
+
+    # unmodified documents are skipped
+    assert extract(["phishing"]) == []
+    assert storage.downloads == [document.resource_id]
+
+    # changing the terms or the document extracts it again
+    assert extract(["phishing", "malware"]) == [(document, ["phishing"])]
+    storage.modified_times[document.resource_id] = "2023-05-02T00:00:00.000Z"
+    assert extract(["phishing", "malware"]) == [(document, ["phishing"])]
+    assert len(storage.downloads) == 3
+
+    # documents without a modification time are always extracted
+    storage.modified_times.clear()
+    assert extract(["phishing", "malware"]) == [(document, ["phishing"])]
+    assert extract(["phishing", "malware"]) == [(document, ["phishing"])]
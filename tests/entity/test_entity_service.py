@@ -164,3 +164,65 @@ def test_find_entities_with_no_regex_or_field(session, signal_instance, project)
     ]
     entities = entity_service.find_entities(session, signal_instance, entity_types)
     assert len(entities) == 0
+
+
+def test_extract_entities_with_multiple_regexes(project):
+    raw = {
+        "user": {"email": "jane@example.com", "account": "123456789012"},
+        "tags": ["abcabc", "no match here"],
+    }
+    entity_types = [
+        EntityType(name="Email", regular_expression=r"[\w.]+@[\w.]+", project=project),
+        EntityType(name="AWS Account ID", regular_expression=r"\d{12}", project=project),
+        EntityType(name="Repeated", regular_expression=r"(abc)\1", project=project),
+    ]
+    entities = entity_service.extract_entities(raw, entity_types)
+    assert sorted((value, t.name) for value, t in entities) == [
+        ("123456789012", "AWS Account ID"),
+        ("abcabc", "Repeated"),
+        ("jane@example.com", "Email"),
+    ]
+
+
+def test_get_by_values_or_create(session, entity, entity_type, project):
+    entity.entity_type = entity_type
+    entity.project = project
+    session.commit()
+
+    entities = entity_service.get_by_values_or_create(
+        db_session=session,
+        project_id=project.id,
+        values=[
+            (entity.value, entity_type.id),
+            ("new-value", entity_type.id),
+            ("new-value", entity_type.id),
+        ],
+    )
+    assert len(entities) == 2
+    assert entities[0].id == entity.id
+    assert entities[1].value == "new-value"
+
+    # existing entities are returned instead of being created again
+    entities_again = entity_service.get_by_values_or_create(
+        db_session=session, project_id=project.id, values=[("new-value", entity_type.id)]
+    )
+    assert entities_again[0].id == entities[1].id
+
+
+def test_record_sightings(session, entity, signal_instance):
+    signal_instance.entities.append(entity)
+    session.commit()
+
+    entity_service.record_sightings(db_session=session, signal_instance=signal_instance)
+    entity_service.record_sightings(db_session=session, signal_instance=signal_instance)
+
+    counts = entity_service.get_case_counts_with_entities(
+        db_session=session, entity_ids=[entity.id, -1], days_back=14
+    )
+    # repeated sightings in the same case count once
+    assert counts == {entity.id: 1, -1: 0}
+
+    cases = entity_service.get_cases_with_entity(
+        db_session=session, entity_id=entity.id, days_back=14
+    )
+    assert [case.id for case in cases] == [signal_instance.case_id]
@@ -0,0 +1,181 @@
+from datetime import date, datetime
+
+import pytest
+
+
+def report_incidents(session, incidents, reported_at):
+    """Moves the incidents into one project and sets when they were reported."""
+    project = incidents[0].project
+    for incident, reported in zip(incidents, reported_at):
+        incident.project = project
+        incident.reported_at = reported
+    session.flush()
+    return [{"model": "Incident", "field": "project_id", "op": "==", "value": project.id}]
+
+
+def test_get_incident_counts_by_month(session, incidents):
+    from dispatch.incident.metrics import get_incident_counts_by_month
+
+    filter_spec = report_incidents(
+        session,
+        incidents,
+        [
+            datetime(2023, 1, 31, 23, 59),
+            datetime(2023, 2, 1),
+            datetime(2023, 2, 28, 12),
+            datetime(2023, 3, 1),
+            datetime(2022, 12, 1),
+        ],
+    )
+
+    counts = get_incident_counts_by_month(
+        db_session=session, end_date=date(2023, 2, 28), filter_spec=filter_spec
+    )
+
+    # months are keyed by their last day, the month after the end date is left out
+    assert counts == {date(2022, 12, 31): 1, date(2023, 1, 31): 1, date(2023, 2, 28): 2}
+
+    # the end date may be any day of the month
+    assert (
+        get_incident_counts_by_month(
+            db_session=session, end_date=date(2023, 2, 1), filter_spec=filter_spec
+        )
+        == counts
+    )
+
+
+def test_get_incident_counts_by_month_excluded_types(session, incidents):
+    from dispatch.incident.metrics import get_incident_counts_by_month
+
+    filter_spec = report_incidents(session, incidents, [datetime(2023, 1, 15)] * 5)
+    incidents[0].incident_type.exclude_from_metrics = True
+    incidents[1].incident_type.exclude_from_metrics = None
+    session.flush()
+
+    counts = get_incident_counts_by_month(
+        db_session=session, end_date=date(2023, 1, 31), filter_spec=filter_spec
+    )
+    assert counts == {date(2023, 1, 31): 4}
+
+
+def test_create_incident_forecast_windows(session, incidents, monkeypatch):
+    from dispatch.incident import metrics
+
+    filter_spec = report_incidents(
+        session,
+        incidents,
+        [
+            datetime(2023, 2, 10),
+            datetime(2023, 3, 5),
+            datetime(2023, 3, 31, 23),
+            datetime(2023, 5, 1),
+            # the current month isn't complete and not counted
+            datetime(2023, 6, 2),
+        ],
+    )
+
+    windows = []
+
+    def make_forecast(month_counts):
+        windows.append(month_counts)
+        last = max(month_counts)
+        return [f"after {last}", "later"], [sum(month_counts.values()), 0]
+
+    monkeypatch.setattr(metrics, "make_forecast", make_forecast)
+
+    forecast = metrics._create_incident_forecast(session, filter_spec, date(2023, 6, 15))
+
+    # each of the last four complete months is forecast from the counts up to it
+    assert windows == [
+        {date(2023, 2, 28): 1},
+        {date(2023, 2, 28): 1, date(2023, 3, 31): 2},
+        {date(2023, 2, 28): 1, date(2023, 3, 31): 2},
+        {date(2023, 2, 28): 1, date(2023, 3, 31): 2, date(2023, 5, 31): 1},
+    ]
+    # completed windows contribute their first prediction, the last one all of them
+    assert forecast == {
+        "categories": [
+            "after 2023-02-28",
+            "after 2023-03-31",
+            "after 2023-03-31",
+            "after 2023-05-31",
+            "later",
+        ],
+        "series": [
+            {"name": "Predicted", "data": [1, 3, 3, 4, 0]},
+            {"name": "Actual", "data": [2, 0, 1]},
+        ],
+    }
+
+
+def test_create_incident_forecast_short_history(session, incidents):
+    from dispatch.incident.metrics import _create_incident_forecast
+
+    # a single month of incidents is too little to forecast from
+    filter_spec = report_incidents(session, incidents, [datetime(2023, 5, 1)] * 5)
+
+    forecast = _create_incident_forecast(session, filter_spec, date(2023, 6, 15))
+    assert forecast == {
+        "categories": [],
+        "series": [{"name": "Predicted", "data": []}, {"name": "Actual", "data": []}],
+    }
+
+
+@pytest.fixture
+def forecasts(monkeypatch):
+    """Replaces forecasting with a stub recording the filter spec and day of every call."""
+    from cachetools import TTLCache
+
+    from dispatch.incident import metrics
+
+    calls = []
+
+    def _create_incident_forecast(db_session, filter_spec, today):
+        calls.append((filter_spec, today))
+        return {"call": len(calls)}
+
+    monkeypatch.setattr(metrics, "_create_incident_forecast", _create_incident_forecast)
+    monkeypatch.setattr(metrics, "_forecast_cache", TTLCache(maxsize=256, ttl=3600))
+    return calls
+
+
+def test_create_incident_forecast_cache(session, forecasts):
+    from dispatch.incident.metrics import create_incident_forecast
+
+    filter_spec = {"and": [{"model": "Incident", "field": "status", "op": "==", "value": "Closed"}]}
+    # the same filter with its keys in a different order
+    reordered_filter_spec = {
+        "and": [{"value": "Closed", "op": "==", "field": "status", "model": "Incident"}]
+    }
+    other_filter_spec = {
+        "and": [{"model": "Incident", "field": "status", "op": "==", "value": "Active"}]
+    }
+
+    assert create_incident_forecast(session, filter_spec) == {"call": 1}
+    assert create_incident_forecast(session, reordered_filter_spec) == {"call": 1}
+    assert create_incident_forecast(session, other_filter_spec) == {"call": 2}
+    assert create_incident_forecast(session) == {"call": 3}
+    assert create_incident_forecast(session) == {"call": 3}
+    assert [filter_spec for filter_spec, _ in forecasts] == [filter_spec, other_filter_spec, None]
+
+
+def test_create_incident_forecast_cache_month(session, forecasts, monkeypatch):
+    from dispatch.incident import metrics
+
+    class Today(date):
+        current = date(2023, 6, 1)
+
+        @classmethod
+        def today(cls):
+            return cls.current
+
+    monkeypatch.setattr(metrics, "date", Today)
+
+    assert metrics.create_incident_forecast(session) == {"call": 1}
+    Today.current = date(2023, 6, 30)
+    assert metrics.create_incident_forecast(session) == {"call": 1}
+
+    # a new month completes another month of counts
+    Today.current = date(2023, 7, 1)
+    assert metrics.create_incident_forecast(session) == {"call": 2}
+    assert [today for _, today in forecasts] == [date(2023, 6, 1), date(2023, 7, 1)]
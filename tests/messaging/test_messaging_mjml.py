@@ -0,0 +1,177 @@
+import json
+import sys
+
+import pytest
+
+# answers render requests like mjml_worker.js, behaving differently for a few magic templates
+STUB_WORKER = """
+import json
+import os
+import sys
+import time
+
+for line in sys.stdin:
+    request = json.loads(line)
+    with open(os.environ["MJML_STUB_LOG"], "a") as log:
+        log.write(json.dumps(request["templates"]) + "\\n")
+
+    results = []
+    for template in request["templates"]:
+        if template == "crash":
+            sys.exit(1)
+        if template == "crash once" and not os.path.exists(os.environ["MJML_STUB_LOG"] + ".crashed"):
+            open(os.environ["MJML_STUB_LOG"] + ".crashed", "w").close()
+            sys.exit(1)
+        if template == "hang":
+            time.sleep(60)
+        errors = ["invalid template"] if template == "invalid" else []
+        results.append({"html": f"<p>{template}</p>", "errors": errors})
+
+    print(json.dumps({"id": request["id"], "results": results}), flush=True)
+"""
+
+# stands in for the mjml cli, writing the template back or failing on stderr
+STUB_CLI = """#!{python}
+import sys
+
+template = open(sys.argv[1]).read()
+if template == "invalid":
+    sys.stderr.write("invalid template")
+else:
+    sys.stdout.write(f"<cli>{{template}}</cli>")
+"""
+
+
+@pytest.fixture
+def stub_log(tmp_path, monkeypatch):
+    """Makes the renderer use the stub worker, returning the templates of every request."""
+    from dispatch.messaging.email import mjml
+
+    script = tmp_path / "worker.py"
+    script.write_text(STUB_WORKER)
+    log = tmp_path / "requests.log"
+    log.touch()
+
+    monkeypatch.setattr(mjml, "WORKER_COMMAND", [sys.executable, str(script)])
+    monkeypatch.setattr(mjml, "MJML_PATH", str(tmp_path))
+    monkeypatch.setenv("MJML_STUB_LOG", str(log))
+
+    return lambda: [json.loads(line) for line in log.read_text().splitlines()]
+
+
+@pytest.fixture
+def renderer(stub_log):
+    from dispatch.messaging.email.mjml import MJMLRenderer
+
+    renderer = MJMLRenderer(size=1)
+    renderer._available = True
+    yield renderer
+    renderer.stop()
+
+
+@pytest.fixture
+def cli_calls(monkeypatch):
+    from dispatch.messaging.email import mjml
+
+    calls = []
+
+    def render_with_cli(template):
+        calls.append(template)
+        return f"<cli>{template}</cli>"
+
+    monkeypatch.setattr(mjml, "render_with_cli", render_with_cli)
+    return calls
+
+
+def test_render_with_pool(renderer, stub_log, cli_calls):
+    assert renderer.render_many(["a", "b"]) == ["<p>a</p>", "<p>b</p>"]
+    assert renderer.render("c") == "<p>c</p>"
+
+    # one request per call, answered by the same process
+    assert stub_log() == [["a", "b"], ["c"]]
+    assert not cli_calls
+
+
+def test_render_cache(renderer, stub_log):
+    assert renderer.render("a") == "<p>a</p>"
+    assert renderer.render("a") == "<p>a</p>"
+    assert renderer.render_many(["b", "a", "b"]) == ["<p>b</p>", "<p>a</p>", "<p>b</p>"]
+
+    # only templates missing from the cache are sent, each once
+    assert stub_log() == [["a"], ["b"]]
+
+    renderer.clear()
+    renderer.render("a")
+    assert stub_log()[-1] == ["a"]
+
+
+def test_render_invalid_template(renderer):
+    from dispatch.messaging.email.mjml import MJMLRenderError
+
+    with pytest.raises(MJMLRenderError):
+        renderer.render("invalid")
+
+
+def test_worker_crash_retried(renderer, stub_log, cli_calls):
+    assert renderer.render("crash once") == "<p>crash once</p>"
+
+    # the worker was restarted and the request sent again
+    assert stub_log() == [["crash once"], ["crash once"]]
+    assert not cli_calls
+
+
+def test_worker_keeps_crashing(renderer, stub_log, cli_calls):
+    assert renderer.render("crash") == "<cli>crash</cli>"
+
+    assert stub_log() == [["crash"], ["crash"]]
+    assert cli_calls == ["crash"]
+
+    # the worker pool recovers for the next request
+    assert renderer.render("a") == "<p>a</p>"
+
+
+def test_worker_timeout_not_retried(renderer, stub_log, cli_calls, monkeypatch):
+    from dispatch.messaging.email import mjml
+
+    monkeypatch.setattr(mjml, "RENDER_TIMEOUT", 1)
+
+    assert renderer.render("hang") == "<cli>hang</cli>"
+    assert stub_log() == [["hang"]]
+    assert cli_calls == ["hang"]
+
+
+def test_no_idle_worker(renderer, stub_log, cli_calls, monkeypatch):
+    from dispatch.messaging.email import mjml
+
+    monkeypatch.setattr(mjml, "RENDER_TIMEOUT", 0.1)
+
+    # another thread holds the only worker
+    worker = renderer._idle.get()
+    assert renderer.render("a") == "<cli>a</cli>"
+    renderer._idle.put(worker)
+
+    assert stub_log() == []
+    assert renderer.render("b") == "<p>b</p>"
+
+
+def test_pool_unavailable(stub_log, cli_calls):
+    from dispatch.messaging.email.mjml import MJMLRenderer
+
+    renderer = MJMLRenderer(size=0)
+    assert not renderer.available
+    assert renderer.render("a") == "<cli>a</cli>"
+    assert stub_log() == []
+
+
+def test_render_with_cli(tmp_path, monkeypatch):
+    from dispatch.messaging.email import mjml
+
+    cli = tmp_path / "mjml"
+    cli.write_text(STUB_CLI.format(python=sys.executable))
+    cli.chmod(0o755)
+    monkeypatch.setattr(mjml, "MJML_PATH", str(tmp_path))
+
+    assert mjml.render_with_cli("<mjml></mjml>") == "<cli><mjml></mjml></cli>"
+
+    with pytest.raises(mjml.MJMLRenderError):
+        mjml.render_with_cli("invalid")
@@ -0,0 +1,60 @@
+import copy
+
+
+def get_incident_item(i: int) -> dict:
+    return {
+        "commander_fullname": f"Commander {i}",
+        "commander_team": "Security",
+        "commander_weblink": f"https://example.com/commanders/{i}",
+        "incident_id": i,
+        "name": f"dispatch-default-default-{i}",
+        "organization_slug": "default",
+        "priority": "Medium",
+        "priority_description": "Medium priority.",
+        "severity": "Low",
+        "severity_description": "Low severity.",
+        "status": "Active",
+        "ticket_weblink": f"https://example.com/tickets/{i}",
+        "title": f"Incident {i}",
+        "type": "Default",
+        "type_description": "Default incident type.",
+    }
+
+
+def test_render_message_template():
+    from dispatch.messaging.strings import INCIDENT, render_message_template
+
+    template = copy.deepcopy(INCIDENT)
+    blocks = render_message_template(INCIDENT, **get_incident_item(1))
+
+    assert INCIDENT == template
+    assert blocks[0]["buttons"][0]["button_value"] == "default-1"
+    assert blocks[0]["buttons"] is not INCIDENT[0]["buttons"]
+
+
+def test_render_message_template_compiles_once():
+    from dispatch.messaging.strings import (
+        INCIDENT,
+        INCIDENT_DAILY_REPORT,
+        get_compiled_template,
+        render_message_template,
+    )
+
+    def render_daily_report(count: int):
+        items = [render_message_template(INCIDENT, **get_incident_item(i)) for i in range(count)]
+        return render_message_template(
+            INCIDENT_DAILY_REPORT, items=items, description="Daily report"
+        )
+
+    get_compiled_template.cache_clear()
+    render_daily_report(1)
+    compiled = get_compiled_template.cache_info().misses
+
+    # templates are parsed once however many incidents are reported
+    blocks = render_daily_report(50)
+    assert get_compiled_template.cache_info().misses == compiled
+    assert blocks == render_message_template(
+        INCIDENT_DAILY_REPORT,
+        items=[render_message_template(INCIDENT, **get_incident_item(i)) for i in range(50)],
+        description="Daily report",
+    )
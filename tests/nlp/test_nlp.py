@@ -0,0 +1,40 @@
+def test_extract_terms_from_text():
+    from dispatch.nlp import extract_terms_from_text, get_phrase_matcher
+
+    _, matcher = get_phrase_matcher("dispatch-term", ["incident", "incident response"])
+    text = "The incident response team started incident response and closed the incident."
+
+    # overlapping matches are reduced to the longest span, repeated matches are kept
+    assert extract_terms_from_text(text, matcher) == [
+        "incident response",
+        "incident response",
+        "incident",
+    ]
+
+
+def test_extract_terms_from_texts():
+    from dispatch.nlp import extract_terms_from_text, extract_terms_from_texts, get_phrase_matcher
+
+    _, matcher = get_phrase_matcher("dispatch-term", ["phishing", "credential theft"])
+    texts = [
+        "Phishing email leading to credential theft, then more phishing.",
+        "",
+        "Nothing to see here.",
+    ]
+
+    assert extract_terms_from_texts(texts, matcher, batch_size=2) == [
+        extract_terms_from_text(text, matcher) for text in texts
+    ]
+    assert extract_terms_from_texts(texts, matcher)[0] == [
+        "phishing",
+        "credential theft",
+        "phishing",
+    ]
+
+
+def test_get_phrase_matcher():
+    from dispatch.nlp import get_phrase_matcher
+
+    key, matcher = get_phrase_matcher("dispatch-tag", ["b", "a"])
+    assert get_phrase_matcher("dispatch-tag", ["a", "b"]) == (key, matcher)
+    assert get_phrase_matcher("dispatch-term", ["a", "b"])[0] != key
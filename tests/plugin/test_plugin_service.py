@@ -55,3 +55,41 @@ def test_delete_instance(session, plugin_instance):
 
     delete_instance(db_session=session, plugin_instance_id=plugin_instance.id)
     assert not get_instance(db_session=session, plugin_instance_id=plugin_instance.id)
+
+
+def test_get_active_instance_cached(session, plugin_instance):
+    from dispatch.plugin.models import PluginInstanceUpdate
+    from dispatch.plugin.service import get_active_instance, update_instance
+
+    kwargs = {
+        "db_session": session,
+        "plugin_type": plugin_instance.plugin.type,
+        "project_id": plugin_instance.project_id,
+    }
+    assert get_active_instance(**kwargs).id == plugin_instance.id
+
+    # resolved from the cache and merged into the session
+    session.expunge_all()
+    t_plugin_instance = get_active_instance(**kwargs)
+    assert t_plugin_instance.id == plugin_instance.id
+    assert t_plugin_instance.plugin.slug == plugin_instance.plugin.slug
+
+    update_instance(
+        db_session=session,
+        plugin_instance=t_plugin_instance,
+        plugin_instance_in=PluginInstanceUpdate(enabled=False),
+    )
+    assert not get_active_instance(**kwargs)
+
+
+def test_configure_plugin(conversation_plugin):
+    from dispatch.plugins.base import plugins
+
+    plugin = plugins.get(conversation_plugin.slug)
+    configured = plugins.configure(conversation_plugin.slug, configuration={"a": 1}, project_id=1)
+
+    assert isinstance(configured, conversation_plugin)
+    assert configured.configuration == {"a": 1}
+    assert configured.project_id == 1
+    assert plugin.configuration is None
+    assert plugin in plugins.all(plugin_type=conversation_plugin.type)
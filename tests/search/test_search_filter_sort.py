@@ -0,0 +1,345 @@
+import asyncio
+import csv
+import io
+import json
+
+import pytest
+
+
+def read_body(response):
+    async def _read():
+        return [chunk async for chunk in response.body_iterator]
+
+    return asyncio.run(_read())
+
+
+def create_tags(session, project, tag_type, names):
+    from dispatch.tag.models import Tag
+
+    tags = [Tag(name=name, project=project, tag_type=tag_type) for name in names]
+    session.add_all(tags)
+    session.flush()
+    return tags
+
+
+@pytest.fixture
+def export_sessions(session, monkeypatch):
+    """Makes exports read through sessions joined to the test transaction."""
+    from sqlalchemy.orm import Session
+
+    class ExportSession(Session):
+        closed = False
+
+        def close(self):
+            self.closed = True
+            super().close()
+
+    sessions = []
+
+    def get_organization_sessionmaker(organization_slug):
+        def make_session():
+            export_session = ExportSession(bind=session.connection())
+            sessions.append(export_session)
+            return export_session
+
+        return make_session
+
+    monkeypatch.setattr(
+        "dispatch.database.service.get_organization_sessionmaker", get_organization_sessionmaker
+    )
+    return sessions
+
+
+def export_tags(session, project, export_format, **kwargs):
+    from dispatch.database.service import search_filter_sort_export
+    from dispatch.tag.models import TagRead
+
+    return search_filter_sort_export(
+        db_session=session,
+        organization="default",
+        model="Tag",
+        item_model=TagRead,
+        export_format=export_format,
+        filter_spec={
+            "and": [{"model": "Tag", "op": "==", "field": "project_id", "value": project.id}]
+        },
+        **kwargs,
+    )
+
+
+def test_export_rows_ndjson():
+    from pydantic import BaseModel
+
+    from dispatch.database.service import _export_rows
+    from dispatch.enums import ExportFormat
+
+    class Row(BaseModel):
+        id: int
+        name: str
+
+    output = _export_rows([Row(id=1, name="a"), Row(id=2, name='b "c"')], ExportFormat.ndjson, True)
+
+    assert output.endswith("\n")
+    assert [json.loads(line) for line in output.splitlines()] == [
+        {"id": 1, "name": "a"},
+        {"id": 2, "name": 'b "c"'},
+    ]
+
+
+def test_export_rows_csv():
+    from typing import List
+
+    from pydantic import BaseModel
+
+    from dispatch.database.service import _export_rows
+    from dispatch.enums import ExportFormat
+
+    class Row(BaseModel):
+        id: int
+        name: str
+        tags: List[str] = []
+
+    rows = [Row(id=1, name='comma, "quote"\nnewline', tags=["a", "b"]), Row(id=2, name="plain")]
+
+    output = _export_rows(rows, ExportFormat.csv, True)
+    assert output.startswith("id,name,tags\r\n")
+    assert list(csv.DictReader(io.StringIO(output))) == [
+        {"id": "1", "name": 'comma, "quote"\nnewline', "tags": '["a", "b"]'},
+        {"id": "2", "name": "plain", "tags": "[]"},
+    ]
+
+    # only the first batch of an export carries the header
+    assert not _export_rows(rows, ExportFormat.csv, False).startswith("id,")
+    assert _export_rows([], ExportFormat.csv, True) == ""
+
+
+@pytest.mark.parametrize("count, batches", [(0, []), (4, [2, 2]), (5, [2, 2, 1])])
+def test_export_batches(session, project, tag_type, export_sessions, monkeypatch, count, batches):
+    from dispatch.enums import ExportFormat
+
+    monkeypatch.setattr("dispatch.database.service.EXPORT_BATCH_SIZE", 2)
+    tags = create_tags(session, project, tag_type, [f"tag{i}" for i in range(count)])
+
+    chunks = read_body(export_tags(session, project, ExportFormat.ndjson))
+
+    assert [len(chunk.splitlines()) for chunk in chunks] == batches
+    ids = [json.loads(line)["id"] for chunk in chunks for line in chunk.splitlines()]
+    assert ids == sorted(tag.id for tag in tags)
+
+
+def test_export_csv_sorted(session, project, tag_type, export_sessions, monkeypatch):
+    from dispatch.enums import ExportFormat
+
+    monkeypatch.setattr("dispatch.database.service.EXPORT_BATCH_SIZE", 2)
+    tags = create_tags(session, project, tag_type, ["b", "c", "a"])
+
+    response = export_tags(session, project, ExportFormat.csv, sort_by=["name"], descending=[True])
+    assert response.media_type == "text/csv"
+    assert response.headers["content-disposition"] == "attachment; filename=Tag.csv"
+
+    chunks = read_body(response)
+    assert len(chunks) == 2
+    assert chunks[0].startswith("name,")
+    assert not chunks[1].startswith("name,")
+
+    rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+    assert [row["name"] for row in rows] == ["c", "b", "a"]
+    assert {int(row["id"]) for row in rows} == {tag.id for tag in tags}
+
+
+def test_export_session_lifetime(session, project, tag_type, export_sessions):
+    from dispatch.enums import ExportFormat
+
+    create_tags(session, project, tag_type, ["a"])
+
+    response = export_tags(session, project, ExportFormat.ndjson)
+    # the export session is opened by the response body, not by the request
+    assert export_sessions == []
+
+    async def _read():
+        await response.body_iterator.__anext__()
+        assert len(export_sessions) == 1
+        assert not export_sessions[0].closed
+
+        with pytest.raises(StopAsyncIteration):
+            await response.body_iterator.__anext__()
+
+    asyncio.run(_read())
+    assert export_sessions[0].closed
+
+
+def test_export_session_closed_on_disconnect(session, project, tag_type, export_sessions):
+    from dispatch.enums import ExportFormat
+
+    create_tags(session, project, tag_type, ["a", "b"])
+
+    async def _read():
+        body = export_tags(session, project, ExportFormat.ndjson).body_iterator
+        await body.__anext__()
+        await body.aclose()
+
+    asyncio.run(_read())
+    assert export_sessions[0].closed
+
+
+def paginate_tags(session, project, sort_by=None, descending=None, items_per_page=2):
+    """Follows the `next` cursors and returns the ids of every page."""
+    from dispatch.database.service import search_filter_sort_paginate
+
+    pages = []
+    cursor = ""
+    while cursor is not None:
+        result = search_filter_sort_paginate(
+            db_session=session,
+            model="Tag",
+            filter_spec={
+                "and": [{"model": "Tag", "op": "==", "field": "project_id", "value": project.id}]
+            },
+            sort_by=sort_by,
+            descending=descending,
+            items_per_page=items_per_page,
+            cursor=cursor,
+        )
+        assert result["page"] == len(pages) + 1
+        pages.append([tag.id for tag in result["items"]])
+        cursor = result["next"]
+    return pages
+
+
+def test_cursor_round_trip():
+    from datetime import datetime
+
+    from dispatch.database.service import decode_cursor, encode_cursor
+    from dispatch.enums import Visibility
+
+    created_at = datetime(2023, 5, 31, 12, 30)
+    cursor = encode_cursor([Visibility.open, created_at, None, "a/b+c", 7], page=3)
+
+    assert set(cursor) <= set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-_=")
+    assert decode_cursor(cursor) == (3, ["Open", created_at.isoformat(), None, "a/b+c", 7])
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor!",
+        "bm90IGpzb24=",  # not json
+        "WzEsIDJd",  # [1, 2]
+        "eyJwYWdlIjogMCwgInZhbHVlcyI6IFtdfQ==",  # {"page": 0, "values": []}
+        "eyJwYWdlIjogIjIiLCAidmFsdWVzIjogW119",  # {"page": "2", "values": []}
+        "eyJwYWdlIjogMn0=",  # {"page": 2}
+    ],
+)
+def test_decode_cursor_invalid(cursor):
+    from pydantic.error_wrappers import ValidationError
+
+    from dispatch.database.service import decode_cursor
+
+    with pytest.raises(ValidationError):
+        decode_cursor(cursor)
+
+
+def test_keyset_ties(session, project, tag_type):
+    tags = create_tags(session, project, tag_type, ["a", "b", "c", "d", "e"])
+    for tag in tags:
+        tag.source = "same"
+    session.flush()
+
+    # equal sort values are ordered by id, so no row is skipped or repeated across pages
+    pages = paginate_tags(session, project, sort_by=["source"], descending=[False])
+    assert pages == [[tags[0].id, tags[1].id], [tags[2].id, tags[3].id], [tags[4].id]]
+
+
+def test_keyset_descending(session, project, tag_type):
+    tags = create_tags(session, project, tag_type, ["b", "d", "a", "c", "e"])
+
+    pages = paginate_tags(session, project, sort_by=["name"], descending=[True])
+    by_name = sorted(tags, key=lambda tag: tag.name, reverse=True)
+    assert sum(pages, []) == [tag.id for tag in by_name]
+    assert [len(page) for page in pages] == [2, 2, 1]
+
+    pages = paginate_tags(session, project)
+    assert sum(pages, []) == sorted(tag.id for tag in tags)
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_keyset_nulls(session, project, tag_type, descending):
+    tags = create_tags(session, project, tag_type, ["a", "b", "c", "d", "e"])
+    for tag, source in zip(tags, [None, "y", None, "x", None]):
+        tag.source = source
+    session.flush()
+
+    pages = paginate_tags(session, project, sort_by=["source"], descending=[descending])
+
+    # nulls sort last ascending and first descending, ties broken by id in the same direction
+    nulls = [tags[0].id, tags[2].id, tags[4].id]
+    if descending:
+        expected = nulls[::-1] + [tags[1].id, tags[3].id]
+    else:
+        expected = [tags[3].id, tags[1].id] + nulls
+    assert sum(pages, []) == expected
+
+
+def test_keyset_invalid_cursor(session, project, tag_type):
+    from pydantic.error_wrappers import ValidationError
+
+    from dispatch.database.service import encode_cursor, search_filter_sort_paginate
+
+    create_tags(session, project, tag_type, ["a", "b"])
+
+    # the cursor was issued for a different sort
+    with pytest.raises(ValidationError):
+        search_filter_sort_paginate(
+            db_session=session,
+            model="Tag",
+            sort_by=["name"],
+            descending=[False],
+            cursor=encode_cursor([1]),
+        )
+
+    # the cursor's value can't be compared with the sorted column
+    with pytest.raises(ValidationError):
+        search_filter_sort_paginate(
+            db_session=session, model="Tag", cursor=encode_cursor(["not an id"])
+        )
+
+    # the aborted transaction was rolled back
+    assert search_filter_sort_paginate(db_session=session, model="Tag", cursor="")["page"] == 1
+
+
+def test_keyset_total(session, incident, tag):
+    from dispatch.database.service import search_filter_sort_paginate
+
+    assert search_filter_sort_paginate(db_session=session, model="Tag", cursor="")["total"] >= 0
+    assert (
+        search_filter_sort_paginate(
+            db_session=session,
+            model="Tag",
+            filter_spec={"and": [{"model": "Tag", "op": "==", "field": "id", "value": tag.id}]},
+            cursor="",
+        )["total"]
+        == -1
+    )
+    # restricted incidents are hidden from members, the table estimate would count them
+    assert (
+        search_filter_sort_paginate(db_session=session, model="Incident", cursor="")["total"] == -1
+    )
+
+
+def test_compile_filter_spec_copies_filter_spec():
+    from dispatch.database.service import compile_filter_spec, compile_filter_predicate
+    from dispatch.tag.models import Tag
+
+    filter_spec = {"and": [{"model": "Tag", "field": "name", "op": "==", "value": "a"}]}
+    plan = compile_filter_spec(Tag, filter_spec)
+    predicate = compile_filter_predicate(filter_spec, "Tag", frozenset({"Tag"}))
+
+    # changing the caller's filter spec doesn't change the cached plan
+    filter_spec["and"][0]["value"] = "b"
+    assert plan.filters[0].filters[0].filter_spec["value"] == "a"
+    assert predicate({"Tag": Tag(name="a")})
+    assert not predicate({"Tag": Tag(name="b")})
+
+    original_filter_spec = {"and": [{"model": "Tag", "field": "name", "op": "==", "value": "a"}]}
+    assert compile_filter_spec(Tag, original_filter_spec) is plan
+    assert compile_filter_spec(Tag, filter_spec) is not plan
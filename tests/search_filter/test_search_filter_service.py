@@ -43,3 +43,34 @@ def test_delete(session, search_filter):
 
     delete(db_session=session, search_filter_id=search_filter.id)
     assert not get(db_session=session, search_filter_id=search_filter.id)
+
+
+def test_match_filters(session, incident):
+    from dispatch.search_filter.models import SearchFilter
+    from dispatch.search_filter.service import match_filters
+
+    def create_filter(name, subject, expression):
+        search_filter = SearchFilter(
+            name=name, subject=subject, expression=expression, project=incident.project
+        )
+        session.add(search_filter)
+        return search_filter
+
+    matching = create_filter(
+        "match-0",
+        "incident",
+        [{"or": [{"model": "Incident", "field": "id", "op": "==", "value": incident.id}]}],
+    )
+    not_matching = create_filter(
+        "match-1",
+        "incident",
+        [{"or": [{"model": "Incident", "field": "id", "op": "==", "value": incident.id + 1}]}],
+    )
+    other_subject = create_filter("match-2", "case", [{}])
+    session.commit()
+
+    assert match_filters(
+        db_session=session,
+        search_filters=[matching, not_matching, other_subject],
+        class_instance=incident,
+    ) == {matching.id}
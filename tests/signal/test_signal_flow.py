@@ -59,3 +59,114 @@ def test_create_signal_instance_not_enabled(session, signal, case_severity, case
             signal_instance_data=instance_data,
             current_user=user,
         )
+
+
+def create_pending_instance(session, signal):
+    from dispatch.signal.models import SignalInstance
+
+    signal_instance = SignalInstance(raw={"id": "foo"}, project=signal.project, signal=signal)
+    session.add(signal_instance)
+    session.commit()
+    return signal_instance
+
+
+def test_claim_signal_with_pending_instances(session, signal):
+    from datetime import datetime, timedelta, timezone
+
+    from sqlalchemy import func, select
+
+    from dispatch.signal.service import (
+        claim_signal_with_pending_instances,
+        get_signal_claim_lock_key,
+    )
+
+    signal_instance = create_pending_instance(session, signal)
+    since = datetime.now(timezone.utc) - timedelta(hours=1)
+    connection = session.connection()
+
+    assert not claim_signal_with_pending_instances(
+        connection=connection, since=since, exclude_signal_ids=[signal.id]
+    )
+    assert not claim_signal_with_pending_instances(
+        connection=connection, since=since, exclude_instance_ids=[signal_instance.id]
+    )
+
+    # signals claimed by another worker are skipped
+    other_connection = session.get_bind().connect()
+    try:
+        with other_connection.begin():
+            lock_key = get_signal_claim_lock_key(other_connection)
+            assert other_connection.execute(
+                select([func.pg_try_advisory_xact_lock(lock_key, signal.id)])
+            ).scalar()
+            assert not claim_signal_with_pending_instances(connection=connection, since=since)
+    finally:
+        other_connection.close()
+
+    assert claim_signal_with_pending_instances(connection=connection, since=since) == signal.id
+
+
+def test_process_signal_instances(session, signal, monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    from dispatch.signal import flows
+    from dispatch.signal.models import SignalFilterAction
+
+    signal_instance = create_pending_instance(session, signal)
+    since = datetime.now(timezone.utc) - timedelta(hours=1)
+
+    def signal_instance_create_flow(db_session, signal_instance_id):
+        signal_instance.filter_action = SignalFilterAction.none
+        db_session.commit()
+
+    monkeypatch.setattr(flows, "signal_instance_create_flow", signal_instance_create_flow)
+
+    exclude_signal_ids = []
+    failed_instance_ids = {}
+    kwargs = {
+        "connection": session.connection(),
+        "db_session": session,
+        "since": since,
+        "batch_size": 10,
+        "exclude_signal_ids": exclude_signal_ids,
+        "failed_instance_ids": failed_instance_ids,
+    }
+    assert flows.process_signal_instances(**kwargs) == 1
+    assert exclude_signal_ids == [signal.id]
+    assert not failed_instance_ids
+
+    # each signal is claimed once per pass
+    create_pending_instance(session, signal)
+    assert flows.process_signal_instances(**kwargs) is None
+
+
+def test_process_signal_instances_failed(session, signal, monkeypatch):
+    from datetime import datetime, timedelta, timezone
+
+    from dispatch.signal import flows
+
+    signal_instance = create_pending_instance(session, signal)
+    since = datetime.now(timezone.utc) - timedelta(hours=1)
+
+    def signal_instance_create_flow(db_session, signal_instance_id):
+        raise Exception("Failed to process signal instance.")
+
+    monkeypatch.setattr(flows, "signal_instance_create_flow", signal_instance_create_flow)
+    # rolling back would discard the test's transaction
+    monkeypatch.setattr(session, "rollback", lambda: None)
+
+    failed_instance_ids = {}
+    kwargs = {
+        "connection": session.connection(),
+        "db_session": session,
+        "since": since,
+        "batch_size": 10,
+        "failed_instance_ids": failed_instance_ids,
+    }
+
+    # failures aren't counted as processed, so idle workers back off
+    assert flows.process_signal_instances(exclude_signal_ids=[], **kwargs) == 0
+    assert list(failed_instance_ids) == [signal_instance.id]
+
+    # failed instances aren't handed out again
+    assert flows.process_signal_instances(exclude_signal_ids=[], **kwargs) is None
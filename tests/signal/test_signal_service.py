@@ -357,3 +357,217 @@ def test_filter_actions_snooze_expired(session, entity, signal, project):
     signal.filters = [signal_filter]
     session.commit()
     assert not filter_signal(db_session=session, signal_instance=signal_instance_1)
+
+
+def test_filter_actions_snooze_not_matching(session, entity, signal, project):
+    from datetime import datetime, timedelta, timezone
+    from dispatch.signal.models import (
+        SignalFilter,
+        SignalInstance,
+        SignalFilterAction,
+    )
+    from dispatch.signal.service import filter_signal
+
+    session.add(entity)
+
+    # create instance
+    signal_instance_1 = SignalInstance(
+        raw=json.dumps({"id": "foo"}), project=project, signal=signal, entities=[entity]
+    )
+    session.add(signal_instance_1)
+    session.commit()
+
+    signal_filter = SignalFilter(
+        name="snooze2",
+        description="test",
+        expression=[
+            {
+                "and": [
+                    {"model": "Entity", "field": "id", "op": "==", "value": entity.id},
+                    {"model": "Entity", "field": "value", "op": "ilike", "value": "%not-a-match%"},
+                ]
+            }
+        ],
+        action=SignalFilterAction.snooze,
+        expiration=datetime.now(tz=timezone.utc) + timedelta(minutes=5),
+        project=project,
+    )
+
+    signal.filters = [signal_filter]
+    session.commit()
+    assert not filter_signal(db_session=session, signal_instance=signal_instance_1)
+    assert signal_instance_1.filter_action == SignalFilterAction.none
+
+
+def test_filter_actions_snooze_other_model(session, entity, signal, project):
+    from datetime import datetime, timedelta, timezone
+    from dispatch.database.service import compile_filter_predicate
+    from dispatch.signal.models import (
+        SignalFilter,
+        SignalInstance,
+        SignalFilterAction,
+    )
+    from dispatch.signal.service import SIGNAL_FILTER_ROW_MODELS, filter_signal
+
+    session.add(entity)
+
+    # create instance
+    signal_instance_1 = SignalInstance(
+        raw=json.dumps({"id": "foo"}), project=project, signal=signal, entities=[entity]
+    )
+    session.add(signal_instance_1)
+    session.commit()
+
+    # the signal isn't part of the in-memory rows, so the expression is evaluated by the database
+    expression = [
+        {
+            "and": [
+                {"model": "Entity", "field": "id", "op": "==", "value": entity.id},
+                {"model": "Signal", "field": "name", "op": "==", "value": signal.name},
+            ]
+        }
+    ]
+    assert compile_filter_predicate(expression, "SignalInstance", SIGNAL_FILTER_ROW_MODELS) is None
+
+    signal_filter = SignalFilter(
+        name="snooze3",
+        description="test",
+        expression=expression,
+        action=SignalFilterAction.snooze,
+        expiration=datetime.now(tz=timezone.utc) + timedelta(minutes=5),
+        project=project,
+    )
+
+    signal.filters = [signal_filter]
+    session.commit()
+    assert filter_signal(db_session=session, signal_instance=signal_instance_1)
+    assert signal_instance_1.filter_action == SignalFilterAction.snooze
+
+
+def test_filter_actions_deduplicate_indexed(session, signal, project, case):
+    from dispatch.signal.dedup import signal_dedup_index
+    from dispatch.signal.models import (
+        SignalFilter,
+        SignalInstance,
+        SignalFilterAction,
+    )
+    from dispatch.signal.service import filter_signal
+    from dispatch.entity_type.models import EntityType
+    from dispatch.entity.models import Entity
+
+    entity_type = EntityType(
+        name="dedupe-indexed",
+        field="id",
+        regular_expression=None,
+        project=project,
+    )
+    session.add(entity_type)
+
+    entity = Entity(name="dedupe-indexed", description="test", value="foo", entity_type=entity_type)
+    session.add(entity)
+    session.commit()
+
+    signal_filter = SignalFilter(
+        name="dedupe-indexed",
+        description="test",
+        expression=[
+            {"or": [{"model": "EntityType", "field": "id", "op": "==", "value": entity_type.id}]}
+        ],
+        action=SignalFilterAction.deduplicate,
+        window=5,
+        project=project,
+    )
+    signal.filters.append(signal_filter)
+
+    signal_instance_1 = SignalInstance(
+        raw=json.dumps({"id": "foo"}), project=project, signal=signal, entities=[entity], case=case
+    )
+    session.add(signal_instance_1)
+    session.commit()
+
+    signal_dedup_index.add(db_session=session, signal_instance=signal_instance_1)
+    hits = signal_dedup_index.statistics()["hits"]
+
+    signal_instance_2 = SignalInstance(
+        raw=json.dumps({"id": "foo"}), project=project, signal=signal, entities=[entity]
+    )
+    session.add(signal_instance_2)
+    session.commit()
+
+    assert filter_signal(db_session=session, signal_instance=signal_instance_2)
+    assert signal_instance_2.filter_action == SignalFilterAction.deduplicate
+    assert signal_instance_2.case_id == case.id
+    assert signal_dedup_index.statistics()["hits"] == hits + 1
+
+
+def test_create_instances(session, signal, project):
+    import uuid
+
+    from dispatch.signal.service import create_instances, get_signal_instance
+
+    signal.project = project
+    signal.variant = "batch-variant"
+    session.commit()
+
+    instance_id = uuid.uuid4()
+    raw_instances = [
+        {"variant": "batch-variant", "id": str(instance_id)},
+        {"variant": "unknown-variant"},
+        {"foo": "bar"},
+        {"variant": "batch-variant"},
+    ]
+    result = create_instances(db_session=session, project=project, raw_instances=raw_instances)
+
+    assert len(result.created) == 2
+    assert [e.index for e in result.errors] == [1, 2]
+    assert get_signal_instance(db_session=session, signal_instance_id=instance_id)
+
+    # inserting the same instance again is reported instead of failing the batch
+    result = create_instances(db_session=session, project=project, raw_instances=[raw_instances[0]])
+    assert not result.created
+    assert [e.index for e in result.errors] == [0]
+
+
+def test_create_instances_batch_max_size():
+    import pytest
+    from pydantic import ValidationError
+
+    from dispatch.signal.models import SIGNAL_INSTANCE_BATCH_MAX_SIZE, SignalInstanceBatchCreate
+
+    instances = [{"variant": "batch-variant"}] * SIGNAL_INSTANCE_BATCH_MAX_SIZE
+    assert SignalInstanceBatchCreate(instances=instances)
+
+    with pytest.raises(ValidationError):
+        SignalInstanceBatchCreate(instances=instances + [{"variant": "batch-variant"}])
+
+
+def test_dedup_index_reconcile(session, signal, project, case):
+    from datetime import datetime, timedelta, timezone
+
+    from dispatch.signal.dedup import signal_dedup_index
+    from dispatch.signal.models import SignalInstance
+
+    signal_instance = SignalInstance(
+        raw=json.dumps({"id": "foo"}), project=project, signal=signal, case=case
+    )
+    session.add(signal_instance)
+    session.commit()
+    case_id = case.id
+
+    since = datetime.now(timezone.utc) - timedelta(hours=1)
+    assert (
+        signal_dedup_index.get_latest_case_id(db_session=session, signal=signal, since=since)
+        == case_id
+    )
+
+    # a case deleted by another process stays in the index until it's reconciled
+    session.delete(signal_instance)
+    session.delete(case)
+    session.commit()
+    assert (
+        signal_dedup_index.get_latest_case_id(db_session=session, signal=signal, since=since)
+        == case_id
+    )
+
+    assert signal_dedup_index.reconcile(db_session=session)
+    assert not signal_dedup_index.get_latest_case_id(db_session=session, signal=signal, since=since)
@@ -1,3 +1,6 @@
+import pytest
+
+
 def test_get(session, tag):
     from dispatch.tag.service import get
 
@@ -50,3 +53,20 @@ def test_delete(session, tag):
 
     delete(db_session=session, tag_id=tag.id)
     assert not get(db_session=session, tag_id=tag.id)
+
+
+def test_build_model():
+    from types import SimpleNamespace
+
+    from dispatch.tag.recommender import build_model, get_neighbors, load_model
+
+    def item(*tag_ids):
+        return SimpleNamespace(tags=[SimpleNamespace(id=tag_id) for tag_id in tag_ids])
+
+    build_model([item(1, 2), item(1, 2, 3), item(3)], "test", "test", "test")
+    model = load_model("test", "test", "test")
+
+    # 1 and 2 always occur together, 1 and 3 in one of three items
+    assert get_neighbors(model, 1) == [2, 3]
+    assert list(model["scores"][0][:2]) == [1.0, pytest.approx(1 / 3)]
+    assert get_neighbors(model, 4) == []